@@ -0,0 +1,42 @@
+"""
+API 의존성 정의
+"""
+
+from functools import lru_cache
+
+from app.services.ai_engine import AIEngine
+from app.services.data_collector import DataCollector
+from app.services.trading_executor import TradingExecutor
+from app.services.notification_service import NotificationService
+
+
+@lru_cache(maxsize=1)
+def get_ai_engine() -> AIEngine:
+    """AI 엔진 인스턴스 조회 (프로세스당 1개)"""
+    return AIEngine()
+
+
+@lru_cache(maxsize=1)
+def get_data_collector() -> DataCollector:
+    """데이터 수집기 인스턴스 조회 (프로세스당 1개)"""
+    return DataCollector()
+
+
+@lru_cache(maxsize=1)
+def get_trading_executor() -> TradingExecutor:
+    """거래 실행기 인스턴스 조회 (프로세스당 1개)"""
+    return TradingExecutor()
+
+
+@lru_cache(maxsize=1)
+def get_notification_service() -> NotificationService:
+    """알림 서비스 인스턴스 조회 (프로세스당 1개)"""
+    return NotificationService()
+
+
+def warm_up_dependencies():
+    """서비스 인스턴스를 미리 생성하여 첫 요청 지연 제거"""
+    get_ai_engine()
+    get_data_collector()
+    get_trading_executor()
+    get_notification_service()
@@ -0,0 +1,90 @@
+"""
+ASGI 미들웨어
+"""
+
+from typing import Iterable, Tuple
+
+# CORS 프리플라이트 허용 메서드
+CORS_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class StaticCORSMiddleware:
+    """허용 출처가 부팅 시 고정된 CORS 처리 ASGI 미들웨어
+
+    응답 헤더 목록을 미리 만들어 두고 Origin 헤더가 있는 요청에만 덧붙이며,
+    프리플라이트(OPTIONS) 요청은 라우터를 거치지 않고 바로 204로 응답합니다.
+    """
+
+    def __init__(self, app, allow_origins: Iterable[str] = ("*",), allow_credentials: bool = False,
+                 max_age: int = 600):
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+
+        # 자격 증명 허용 시 브라우저가 "*"를 거부하므로 요청 Origin을 그대로 돌려줌
+        self.echo_origin = allow_credentials or not self.allow_all_origins
+
+        # 출처와 무관한 고정 헤더
+        shared_headers = [(b"vary", b"Origin")] if self.echo_origin else []
+        if allow_credentials:
+            shared_headers.append((b"access-control-allow-credentials", b"true"))
+        self._simple_headers = shared_headers
+        self._preflight_headers = shared_headers + [
+            (b"access-control-allow-methods", CORS_ALLOW_METHODS),
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # CORS 관련 요청 헤더를 한 번의 순회로 수집
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # 교차 출처 요청이 아니면 그대로 통과
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self.allow_all_origins or origin in self.allow_origins
+
+        # 프리플라이트 요청
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if not allowed:
+                await send({"type": "http.response.start", "status": 400, "headers": [(b"content-length", b"0")]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers = self._preflight_headers + [self._allow_origin_header(origin)]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        # 일반 요청: 응답 시작 메시지에 CORS 헤더 추가
+        cors_headers = self._simple_headers + [self._allow_origin_header(origin)]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def _allow_origin_header(self, origin: bytes) -> Tuple[bytes, bytes]:
+        """Access-Control-Allow-Origin 헤더 생성"""
+        return (b"access-control-allow-origin", origin if self.echo_origin else b"*")
@@ -3,347 +3,356 @@ API 라우터 정의
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from typing import Dict, List, Optional
 import asyncio
+import orjson
+from fastapi_cache.decorator import cache
+from sqlalchemy import select, func, lambda_stmt
 
 from app.services.ai_engine import AIEngine
 from app.services.data_collector import DataCollector
 from app.services.trading_executor import TradingExecutor
 from app.services.notification_service import NotificationService
-from app.utils.database import get_db_session
+from app.api import trading_control
+from app.api.dependencies import (
+    get_ai_engine,
+    get_data_collector,
+    get_trading_executor,
+    get_notification_service
+)
+from app.config import settings, LLM_CONFIG, TRADING_LIMITS, EXCHANGE_CONFIG, NOTIFICATION_CONFIG
+from app.utils.database import AsyncSessionLocal
 from app.models.trading_models import Trade, Position, TradingSignal
 from app.models.notification_models import Notification
+from llm_models.analysis_writer import aget_llm_analyses
 
 # 라우터 생성
-router = APIRouter(prefix="/api/v1", tags=["AI Trading API"])
-
-# 서비스 인스턴스
-ai_engine = AIEngine()
-data_collector = DataCollector()
-trading_executor = TradingExecutor()
-notification_service = NotificationService()
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["AI Trading API"],
+    default_response_class=ORJSONResponse
+)
+
+# 목록 응답 필드 (조회 쿼리의 컬럼 순서와 동일)
+_TRADE_COLS = ("id", "symbol", "side", "quantity", "price", "status", "created_at", "executed_at")
+_SIGNAL_COLS = ("id", "symbol", "signal_type", "confidence", "price", "reasoning", "created_at", "executed")
+_NOTIFICATION_COLS = ("id", "notification_type", "channel", "title", "status", "created_at", "sent_at")
+
+# 목록 조회 쿼리 (lambda_stmt로 SQL 컴파일 결과를 캐시, limit만 요청마다 바인딩)
+_TRADE_LIST_STMT = lambda_stmt(
+    lambda: select(
+        Trade.id,
+        Trade.symbol,
+        Trade.side,
+        Trade.quantity,
+        Trade.price,
+        Trade.status,
+        Trade.created_at,
+        Trade.executed_at
+    ).order_by(Trade.created_at.desc())
+)
+
+_SIGNAL_LIST_STMT = lambda_stmt(
+    lambda: select(
+        TradingSignal.id,
+        TradingSignal.symbol,
+        TradingSignal.signal_type,
+        TradingSignal.confidence,
+        TradingSignal.price,
+        TradingSignal.reasoning,
+        TradingSignal.created_at,
+        TradingSignal.executed
+    ).order_by(TradingSignal.created_at.desc())
+)
+
+_NOTIFICATION_LIST_STMT = lambda_stmt(
+    lambda: select(
+        Notification.id,
+        Notification.notification_type,
+        Notification.channel,
+        Notification.title,
+        Notification.status,
+        Notification.created_at,
+        Notification.sent_at
+    ).order_by(Notification.created_at.desc())
+)
 
 
 # ==================== 시스템 제어 API ====================
 
 @router.post("/system/start")
 async def start_ai_trading():
-    """AI 거래 시스템 시작"""
-    try:
-        await ai_engine.start_ai_trading()
-        return {"success": True, "message": "AI 거래 시스템이 시작되었습니다."}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"시스템 시작 실패: {str(e)}")
+    """AI 거래 시스템 시작 (/start-trading과 같은 태스크/락 사용, 요청은 즉시 반환)"""
+    return await trading_control.start_trading()
 
 
 @router.post("/system/stop")
 async def stop_ai_trading():
     """AI 거래 시스템 중지"""
-    try:
-        await ai_engine.stop_ai_trading()
-        return {"success": True, "message": "AI 거래 시스템이 중지되었습니다."}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"시스템 중지 실패: {str(e)}")
+    return await trading_control.stop_trading()
 
 
 @router.get("/system/status")
-async def get_system_status():
+async def get_system_status(ai_engine: AIEngine = Depends(get_ai_engine)):
     """시스템 상태 조회"""
-    try:
-        status = await ai_engine.get_system_summary()
-        return status
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"상태 조회 실패: {str(e)}")
+    status = await ai_engine.get_system_summary()
+    return status
 
 
 # ==================== 데이터 API ====================
 
 @router.get("/data/market/{symbol}")
-async def get_market_data(symbol: str):
+@cache(expire=2)
+async def get_market_data(symbol: str, data_collector: DataCollector = Depends(get_data_collector)):
     """특정 심볼의 시장 데이터 조회"""
-    try:
-        data = data_collector.get_latest_data(symbol)
-        if not data:
-            raise HTTPException(status_code=404, detail=f"{symbol} 데이터를 찾을 수 없습니다")
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
+    data = data_collector.get_latest_data(symbol)
+    if not data:
+        raise HTTPException(status_code=404, detail=f"{symbol} 데이터를 찾을 수 없습니다")
+    return data
 
 
-@router.get("/data/market")
-async def get_all_market_data():
+@router.get("/data/market", response_model=None, response_class=ORJSONResponse)
+@cache(expire=2)
+async def get_all_market_data(data_collector: DataCollector = Depends(get_data_collector)):
     """모든 심볼의 시장 데이터 조회"""
-    try:
-        data = data_collector.get_symbols_data()
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
+    data = data_collector.get_symbols_data()
+    return data
 
 
 # ==================== AI 분석 API ====================
 
-@router.post("/analysis/{symbol}")
-async def analyze_symbol(symbol: str):
+@router.post("/analysis/{symbol}", response_model=None, response_class=ORJSONResponse)
+async def analyze_symbol(symbol: str, ai_engine: AIEngine = Depends(get_ai_engine)):
     """특정 심볼 AI 분석"""
-    try:
-        result = await ai_engine.analyze_single_symbol(symbol)
-        if "error" in result:
-            raise HTTPException(status_code=400, detail=result["error"])
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"분석 실패: {str(e)}")
+    result = await ai_engine.analyze_single_symbol(symbol)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return ORJSONResponse(result)
 
 
-@router.get("/analysis/history")
-async def get_analysis_history(limit: int = 100):
+@router.get("/analysis/history", response_model=None, response_class=ORJSONResponse)
+async def get_analysis_history(limit: int = 100, ai_engine: AIEngine = Depends(get_ai_engine)):
     """분석 히스토리 조회"""
-    try:
-        history = ai_engine.get_analysis_history(limit)
-        return {"history": history, "count": len(history)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"히스토리 조회 실패: {str(e)}")
+    history = await ai_engine.aget_analysis_history(limit)
+    return ORJSONResponse({"history": history, "count": len(history)})
 
 
 # ==================== 거래 API ====================
 
-@router.get("/trading/positions")
-async def get_positions():
+@router.get("/trading/positions", response_model=None, response_class=ORJSONResponse)
+@cache(expire=2)
+async def get_positions(trading_executor: TradingExecutor = Depends(get_trading_executor)):
     """현재 포지션 조회"""
-    try:
-        positions = trading_executor.get_positions()
-        return {"positions": positions, "count": len(positions)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"포지션 조회 실패: {str(e)}")
+    positions = await trading_executor.aget_positions()
+    return {"positions": positions, "count": len(positions)}
 
 
 @router.get("/trading/summary")
-async def get_trading_summary():
+@cache(expire=2)
+async def get_trading_summary(trading_executor: TradingExecutor = Depends(get_trading_executor)):
     """거래 요약 정보 조회"""
-    try:
-        summary = trading_executor.get_trading_summary()
-        return summary
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"요약 조회 실패: {str(e)}")
+    summary = await trading_executor.get_trading_summary()
+    return summary
 
 
-@router.get("/trading/trades")
+@router.get("/trading/trades", response_model=None, response_class=StreamingResponse)
 async def get_trade_history(limit: int = 100):
-    """거래 히스토리 조회"""
-    try:
-        with get_db_session() as db:
-            trades = db.query(Trade).order_by(Trade.created_at.desc()).limit(limit).all()
-            
-            return {
-                "trades": [
-                    {
-                        "id": trade.id,
-                        "symbol": trade.symbol,
-                        "side": trade.side.value,
-                        "quantity": trade.quantity,
-                        "price": trade.price,
-                        "status": trade.status.value,
-                        "created_at": trade.created_at.isoformat(),
-                        "executed_at": trade.executed_at.isoformat() if trade.executed_at else None
-                    }
-                    for trade in trades
-                ],
-                "count": len(trades)
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"거래 히스토리 조회 실패: {str(e)}")
+    """거래 히스토리 조회 (행 단위 스트리밍)"""
+    async def generate_trades():
+        """거래 목록 JSON을 행 단위로 생성 (세션은 스트리밍이 끝나거나 중단되면 닫힘)"""
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(_TRADE_LIST_STMT + (lambda s: s.limit(limit)))
+            count = 0
+            yield b'{"trades":['
+            async for trade in result:
+                if count:
+                    yield b","
+                yield orjson.dumps(dict(zip(_TRADE_COLS, trade)))
+                count += 1
+            yield b'],"count":' + str(count).encode() + b"}"
+    
+    return StreamingResponse(generate_trades(), media_type="application/json")
 
 
 # ==================== 알림 API ====================
 
-@router.post("/notifications/send")
-async def send_notification(notification_type: str, message: str, data: Dict = None):
+@router.post("/notifications/send", response_model=None, response_class=ORJSONResponse)
+async def send_notification(
+    notification_type: str,
+    message: str,
+    data: Dict = None,
+    notification_service: NotificationService = Depends(get_notification_service)
+):
     """알림 전송"""
-    try:
-        result = await notification_service.send_notification(notification_type, message, data)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"알림 전송 실패: {str(e)}")
+    result = await notification_service.send_notification(notification_type, message, data)
+    return ORJSONResponse(result)
 
 
-@router.get("/notifications/history")
-async def get_notification_history(limit: int = 50):
+@router.get("/notifications/history", response_model=None, response_class=ORJSONResponse)
+async def get_notification_history(
+    limit: int = 50,
+    notification_service: NotificationService = Depends(get_notification_service)
+):
     """알림 히스토리 조회"""
-    try:
-        history = notification_service.get_notification_history(limit)
-        return {"history": history, "count": len(history)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"알림 히스토리 조회 실패: {str(e)}")
+    history = await notification_service.aget_notification_history(limit)
+    return {"history": history, "count": len(history)}
 
 
 @router.get("/notifications/summary")
-async def get_notification_summary():
+async def get_notification_summary(
+    notification_service: NotificationService = Depends(get_notification_service)
+):
     """알림 서비스 요약 정보 조회"""
-    try:
-        summary = notification_service.get_notification_summary()
-        return summary
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"알림 요약 조회 실패: {str(e)}")
+    summary = notification_service.get_notification_summary()
+    return summary
 
 
 # ==================== 관리 API ====================
 
-@router.get("/admin/signals")
+@router.get("/admin/signals", response_model=None, response_class=ORJSONResponse)
 async def get_trading_signals(limit: int = 100):
     """거래 신호 조회"""
-    try:
-        with get_db_session() as db:
-            signals = db.query(TradingSignal).order_by(TradingSignal.created_at.desc()).limit(limit).all()
-            
-            return {
-                "signals": [
-                    {
-                        "id": signal.id,
-                        "symbol": signal.symbol,
-                        "signal_type": signal.signal_type.value,
-                        "confidence": signal.confidence,
-                        "price": signal.price,
-                        "reasoning": signal.reasoning,
-                        "created_at": signal.created_at.isoformat(),
-                        "executed": signal.executed
-                    }
-                    for signal in signals
-                ],
-                "count": len(signals)
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"거래 신호 조회 실패: {str(e)}")
-
-
-@router.get("/admin/notifications")
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(_SIGNAL_LIST_STMT + (lambda s: s.limit(limit)))
+        signals = result.all()
+        
+        return ORJSONResponse({
+            "signals": [dict(zip(_SIGNAL_COLS, signal)) for signal in signals],
+            "count": len(signals)
+        })
+
+
+@router.get("/admin/notifications", response_model=None, response_class=ORJSONResponse)
 async def get_all_notifications(limit: int = 100):
     """모든 알림 조회"""
-    try:
-        with get_db_session() as db:
-            notifications = db.query(Notification).order_by(Notification.created_at.desc()).limit(limit).all()
-            
-            return {
-                "notifications": [
-                    {
-                        "id": notif.id,
-                        "notification_type": notif.notification_type.value,
-                        "channel": notif.channel.value,
-                        "title": notif.title,
-                        "status": notif.status.value,
-                        "created_at": notif.created_at.isoformat(),
-                        "sent_at": notif.sent_at.isoformat() if notif.sent_at else None
-                    }
-                    for notif in notifications
-                ],
-                "count": len(notifications)
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"알림 조회 실패: {str(e)}")
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(_NOTIFICATION_LIST_STMT + (lambda s: s.limit(limit)))
+        notifications = result.all()
+        
+        return ORJSONResponse({
+            "notifications": [dict(zip(_NOTIFICATION_COLS, notif)) for notif in notifications],
+            "count": len(notifications)
+        })
+
+
+@router.get("/admin/llm-analyses", response_model=None, response_class=ORJSONResponse)
+async def get_llm_analyses(limit: int = 100):
+    """LLM 분석 원문 조회 (저장된 입력/출력 압축 해제)"""
+    analyses = await aget_llm_analyses(limit)
+    return ORJSONResponse({"analyses": analyses, "count": len(analyses)})
 
 
 # ==================== 헬스체크 API ====================
 
+# 정적 응답이므로 모듈 로드 시 한 번만 직렬화
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "2024-01-01T00:00:00Z",
+    "version": "1.0.0",
+    "services": {
+        "ai_engine": "active",
+        "data_collector": "active",
+        "trading_executor": "active",
+        "notification_service": "active"
+    }
+})
+
+
 @router.get("/health")
 async def health_check():
     """시스템 헬스체크"""
-    try:
-        return {
-            "status": "healthy",
-            "timestamp": "2024-01-01T00:00:00Z",
-            "version": "1.0.0",
-            "services": {
-                "ai_engine": "active",
-                "data_collector": "active",
-                "trading_executor": "active",
-                "notification_service": "active"
-            }
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"헬스체크 실패: {str(e)}")
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
 # ==================== 설정 API ====================
 
+# 설정은 프로세스 실행 중 변하지 않으므로 모듈 로드 시 한 번만 직렬화
+_CONFIG_BYTES = orjson.dumps({
+    "settings": {
+        "binance_testnet": settings.binance_testnet,
+        "analysis_interval": 60,
+        "max_position_size": TRADING_LIMITS['max_position_size'],
+        "max_daily_loss": TRADING_LIMITS['max_daily_loss']
+    },
+    "llm_config": LLM_CONFIG,
+    "trading_limits": TRADING_LIMITS,
+    "exchange_config": EXCHANGE_CONFIG,
+    "notification_config": NOTIFICATION_CONFIG
+})
+
+
 @router.get("/config")
 async def get_config():
     """시스템 설정 조회"""
-    try:
-        from app.config import settings, LLM_CONFIG, TRADING_LIMITS, EXCHANGE_CONFIG, NOTIFICATION_CONFIG
-        
-        return {
-            "settings": {
-                "binance_testnet": settings.binance_testnet,
-                "analysis_interval": 60,
-                "max_position_size": TRADING_LIMITS['max_position_size'],
-                "max_daily_loss": TRADING_LIMITS['max_daily_loss']
-            },
-            "llm_config": LLM_CONFIG,
-            "trading_limits": TRADING_LIMITS,
-            "exchange_config": EXCHANGE_CONFIG,
-            "notification_config": NOTIFICATION_CONFIG
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"설정 조회 실패: {str(e)}")
+    return Response(_CONFIG_BYTES, media_type="application/json")
 
 
 # ==================== 통계 API ====================
 
+def _count_since(model, since):
+    """특정 시점 이후 생성된 레코드 수 스칼라 서브쿼리"""
+    return (
+        select(func.count())
+        .select_from(model)
+        .where(model.created_at >= since)
+        .scalar_subquery()
+    )
+
+
 @router.get("/stats/daily")
-async def get_daily_stats():
+async def get_daily_stats(trading_executor: TradingExecutor = Depends(get_trading_executor)):
     """일일 통계 조회"""
-    try:
-        # 오늘 거래 수
-        with get_db_session() as db:
-            from datetime import datetime, timedelta
-            
-            today = datetime.now().date()
-            trades_today = db.query(Trade).filter(
-                Trade.created_at >= today
-            ).count()
-            
-            signals_today = db.query(TradingSignal).filter(
-                TradingSignal.created_at >= today
-            ).count()
-            
-            notifications_today = db.query(Notification).filter(
-                Notification.created_at >= today
-            ).count()
-            
-            return {
-                "date": today.isoformat(),
-                "trades": trades_today,
-                "signals": signals_today,
-                "notifications": notifications_today,
-                "portfolio_summary": trading_executor.get_trading_summary()
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
+    # 오늘 거래 수 (기준일은 DB 서버의 CURRENT_DATE)
+    async with AsyncSessionLocal() as db:
+        today = func.current_date()
+        
+        # 거래/신호/알림 수 집계와 포트폴리오 요약을 동시에 조회
+        result, portfolio_summary = await asyncio.gather(
+            db.execute(
+                select(
+                    today,
+                    _count_since(Trade, today),
+                    _count_since(TradingSignal, today),
+                    _count_since(Notification, today)
+                )
+            ),
+            trading_executor.get_trading_summary()
+        )
+        date, trades_today, signals_today, notifications_today = result.one()
+        
+        return {
+            "date": date.isoformat(),
+            "trades": trades_today,
+            "signals": signals_today,
+            "notifications": notifications_today,
+            "portfolio_summary": portfolio_summary
+        }
 
 
 @router.get("/stats/weekly")
-async def get_weekly_stats():
+async def get_weekly_stats(trading_executor: TradingExecutor = Depends(get_trading_executor)):
     """주간 통계 조회"""
-    try:
-        # 이번 주 통계
-        with get_db_session() as db:
-            from datetime import datetime, timedelta
-            
-            today = datetime.now()
-            week_start = today - timedelta(days=today.weekday())
-            
-            trades_weekly = db.query(Trade).filter(
-                Trade.created_at >= week_start
-            ).count()
-            
-            signals_weekly = db.query(TradingSignal).filter(
-                TradingSignal.created_at >= week_start
-            ).count()
-            
-            return {
-                "week_start": week_start.date().isoformat(),
-                "trades": trades_weekly,
-                "signals": signals_weekly,
-                "portfolio_summary": trading_executor.get_trading_summary()
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"주간 통계 조회 실패: {str(e)}") 
\ No newline at end of file
+    # 이번 주 통계 (주 시작일은 DB 서버에서 계산)
+    async with AsyncSessionLocal() as db:
+        week_start = func.date_trunc('week', func.now())
+        
+        # 거래/신호 수 집계와 포트폴리오 요약을 동시에 조회
+        result, portfolio_summary = await asyncio.gather(
+            db.execute(
+                select(
+                    week_start,
+                    _count_since(Trade, week_start),
+                    _count_since(TradingSignal, week_start)
+                )
+            ),
+            trading_executor.get_trading_summary()
+        )
+        week_start_at, trades_weekly, signals_weekly = result.one()
+        
+        return {
+            "week_start": week_start_at.date().isoformat(),
+            "trades": trades_weekly,
+            "signals": signals_weekly,
+            "portfolio_summary": portfolio_summary
+        }
\ No newline at end of file
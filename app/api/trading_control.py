@@ -0,0 +1,88 @@
+"""
+AI 거래 실행 제어 (프로세스당 거래 태스크 1개, 워커 간 advisory lock으로 단일 실행 보장)
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.api.dependencies import get_ai_engine
+from app.utils.database import async_engine
+
+# AI 거래 단일 실행 보장용 PostgreSQL advisory lock (여러 워커 중 락을 잡은 프로세스만 거래 실행)
+TRADING_LOCK_KEY = 731800
+_TRY_TRADING_LOCK_STMT = text("SELECT pg_try_advisory_lock(:key)")
+_RELEASE_TRADING_LOCK_STMT = text("SELECT pg_advisory_unlock(:key)")
+
+# 실행 중인 AI 거래 태스크
+_trading_task: Optional[asyncio.Task] = None
+
+
+async def start_trading() -> Dict:
+    """AI 거래를 백그라운드 태스크로 시작 (이미 실행 중이면 시작하지 않음)"""
+    global _trading_task
+    if _trading_task is not None and not _trading_task.done():
+        return {"success": False, "message": "AI 거래가 이미 실행 중입니다"}
+
+    # 다른 워커 프로세스에서 이미 거래 중이면 시작하지 않음
+    lock_connection = await _acquire_trading_lock()
+    if lock_connection is None:
+        return {"success": False, "message": "다른 워커에서 AI 거래가 이미 실행 중입니다"}
+
+    # 웹 서버와 같은 이벤트 루프에서 AI 거래 실행 (HTTP 클라이언트/커넥션 풀 공유)
+    _trading_task = asyncio.create_task(_run_trading(lock_connection))
+
+    return {"success": True, "message": "AI 거래가 시작되었습니다"}
+
+
+async def stop_trading() -> Dict:
+    """AI 거래 중지 후 거래 태스크 종료 대기"""
+    await get_ai_engine().stop_ai_trading()
+    await cancel_trading_task()
+    return {"success": True, "message": "AI 거래가 중지되었습니다"}
+
+
+async def cancel_trading_task():
+    """실행 중인 AI 거래 태스크 취소 및 종료 대기"""
+    task = _trading_task
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _acquire_trading_lock():
+    """AI 거래 advisory lock 획득 (성공 시 락을 보유한 커넥션, 실패 시 None 반환)"""
+    connection = await async_engine.connect()
+    try:
+        acquired = (await connection.execute(_TRY_TRADING_LOCK_STMT, {"key": TRADING_LOCK_KEY})).scalar()
+        await connection.commit()  # 세션 수준 락은 트랜잭션 종료 후에도 유지
+    except Exception:
+        await connection.close()
+        raise
+
+    if not acquired:
+        await connection.close()
+        return None
+    return connection
+
+
+async def _run_trading(lock_connection):
+    """AI 거래 실행 후 advisory lock 해제 (프로세스가 죽으면 커넥션 종료로 자동 해제)"""
+    try:
+        await get_ai_engine().start_ai_trading()
+    finally:
+        try:
+            await lock_connection.execute(_RELEASE_TRADING_LOCK_STMT, {"key": TRADING_LOCK_KEY})
+            await lock_connection.commit()
+        except Exception as e:
+            # 해제하지 못한 락이 풀에 돌아가지 않도록 커넥션 폐기
+            logger.error(f"AI 거래 락 해제 실패: {e}")
+            await lock_connection.invalidate()
+        finally:
+            await lock_connection.close()
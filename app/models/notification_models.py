@@ -3,8 +3,9 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import validates
 import enum
 
 Base = declarative_base()
@@ -38,14 +39,17 @@ class NotificationChannel(enum.Enum):
 class Notification(Base):
     """알림 모델"""
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_created_at", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    notification_type = Column(Enum(NotificationType), nullable=False)
-    channel = Column(Enum(NotificationChannel), nullable=False)
+    notification_type = Column(String(20), nullable=False)  # NotificationType 값
+    channel = Column(String(20), nullable=False)  # NotificationChannel 값
     title = Column(String(200), nullable=False)
     message = Column(Text, nullable=False)
     data = Column(Text, nullable=True)  # JSON 형태의 추가 데이터
-    status = Column(Enum(NotificationStatus), nullable=False, default=NotificationStatus.PENDING)
+    status = Column(String(20), nullable=False, default=NotificationStatus.PENDING.value)  # NotificationStatus 값
     retry_count = Column(Integer, default=0)
     max_retries = Column(Integer, default=3)
     sent_at = Column(DateTime, nullable=True)
@@ -53,6 +57,21 @@ class Notification(Base):
     
     # 관계
     history = relationship("NotificationHistory", back_populates="notification")
+    
+    @validates("notification_type")
+    def _validate_notification_type(self, key, value):
+        """알림 타입 검증 후 문자열로 저장"""
+        return NotificationType(value).value
+    
+    @validates("channel")
+    def _validate_channel(self, key, value):
+        """알림 채널 검증 후 문자열로 저장"""
+        return NotificationChannel(value).value
+    
+    @validates("status")
+    def _validate_status(self, key, value):
+        """알림 상태 검증 후 문자열로 저장"""
+        return NotificationStatus(value).value
 
 
 class NotificationHistory(Base):
@@ -61,13 +80,18 @@ class NotificationHistory(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     notification_id = Column(Integer, nullable=False)
-    status = Column(Enum(NotificationStatus), nullable=False)
+    status = Column(String(20), nullable=False)  # NotificationStatus 값
     error_message = Column(Text, nullable=True)
     response_data = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계
     notification = relationship("Notification", back_populates="history")
+    
+    @validates("status")
+    def _validate_status(self, key, value):
+        """알림 상태 검증 후 문자열로 저장"""
+        return NotificationStatus(value).value
 
 
 class NotificationTemplate(Base):
@@ -5,9 +5,9 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, Index, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 import enum
 
 Base = declarative_base()
@@ -45,10 +45,14 @@ class OrderStatus(enum.Enum):
 class TradingSignal(Base):
     """거래 신호 모델"""
     __tablename__ = "trading_signals"
+    __table_args__ = (
+        Index("ix_trading_signals_created_at", "created_at"),
+        Index("ix_trading_signals_symbol_created_at", "symbol", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     symbol = Column(String(20), nullable=False, index=True)
-    signal_type = Column(Enum(SignalType), nullable=False)
+    signal_type = Column(String(20), nullable=False)  # SignalType 값
     confidence = Column(Float, nullable=False)  # 0.0 ~ 1.0
     price = Column(Float, nullable=False)
     quantity = Column(Float, nullable=False)
@@ -60,21 +64,30 @@ class TradingSignal(Base):
     
     # 관계
     trades = relationship("Trade", back_populates="signal")
+    
+    @validates("signal_type")
+    def _validate_signal_type(self, key, value):
+        """신호 타입 검증 후 문자열로 저장"""
+        return SignalType(value).value
 
 
 class Trade(Base):
     """거래 기록 모델"""
     __tablename__ = "trades"
+    __table_args__ = (
+        Index("ix_trades_created_at", "created_at"),
+        Index("ix_trades_symbol_created_at", "symbol", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     signal_id = Column(Integer, nullable=True)
     symbol = Column(String(20), nullable=False, index=True)
     side = Column(String(10), nullable=False)  # BUY, SELL
-    order_type = Column(Enum(OrderType), nullable=False)
+    order_type = Column(String(20), nullable=False)  # OrderType 값
     quantity = Column(Float, nullable=False)
     price = Column(Float, nullable=False)
     executed_price = Column(Float, nullable=True)
-    status = Column(Enum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
+    status = Column(String(20), nullable=False, default=OrderStatus.PENDING.value)  # OrderStatus 값
     order_id = Column(String(100), nullable=True)  # 거래소 주문 ID
     fee = Column(Float, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -83,15 +96,28 @@ class Trade(Base):
     # 관계
     signal = relationship("TradingSignal", back_populates="trades")
     position = relationship("Position", back_populates="trades")
+    
+    @validates("order_type")
+    def _validate_order_type(self, key, value):
+        """주문 타입 검증 후 문자열로 저장"""
+        return OrderType(value).value
+    
+    @validates("status")
+    def _validate_status(self, key, value):
+        """주문 상태 검증 후 문자열로 저장"""
+        return OrderStatus(value).value
 
 
 class Position(Base):
     """포지션 모델"""
     __tablename__ = "positions"
+    __table_args__ = (
+        Index("ix_position_symbol_open", "symbol", "is_open"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     symbol = Column(String(20), nullable=False, index=True)
-    position_type = Column(Enum(PositionType), nullable=False)
+    position_type = Column(String(20), nullable=False)  # PositionType 값
     quantity = Column(Float, nullable=False)
     entry_price = Column(Float, nullable=False)
     current_price = Column(Float, nullable=True)
@@ -107,6 +133,11 @@ class Position(Base):
     
     # 관계
     trades = relationship("Trade", back_populates="position")
+    
+    @validates("position_type")
+    def _validate_position_type(self, key, value):
+        """포지션 타입 검증 후 문자열로 저장"""
+        return PositionType(value).value
 
 
 class Portfolio(Base):
@@ -166,9 +197,23 @@ class LLMAnalysis(Base):
     timestamp = Column(DateTime, nullable=False, index=True)
     llm_provider = Column(String(50), nullable=False)  # gpt4, claude, perplexity
     analysis_type = Column(String(50), nullable=False)  # market_analysis, risk_assessment, etc.
-    input_data = Column(Text, nullable=True)
-    output_data = Column(Text, nullable=False)
+    input_data = Column(LargeBinary, nullable=True)  # zlib 압축 (llm_models.analysis_writer.decompress_analysis_text로 복원)
+    output_data = Column(LargeBinary, nullable=False)
+    compression_dict = Column(Integer, nullable=True)  # 압축 사전 ID (NULL: 압축 도입 전 UTF-8 원문)
     confidence_score = Column(Float, nullable=True)
     processing_time = Column(Float, nullable=True)  # 초 단위
     cost = Column(Float, nullable=True)  # API 비용
-    created_at = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class LLMBatchJob(Base):
+    """LLM Batch API 제출 작업 모델 (프로세스 재시작 후에도 결과 수집)"""
+    __tablename__ = "llm_batch_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    batch_id = Column(String(100), nullable=False, unique=True)
+    llm_provider = Column(String(50), nullable=False)  # gpt4
+    status = Column(String(20), nullable=False, index=True)  # submitted, completed, failed
+    prompts = Column(Text, nullable=False)  # 심볼 -> 입력 프롬프트 (JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
@@ -3,18 +3,41 @@ LLM 앙상블 기반 AI 분석 엔진
 """
 
 import asyncio
+import hashlib
+import math
 import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+import orjson
 from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_models.ensemble_decision import EnsembleDecision
 from app.services.data_collector import DataCollector
 from app.services.trading_executor import TradingExecutor
 from app.services.notification_service import NotificationService
-from app.utils.database import get_db_session
+from app.config import LLM_CONFIG
+from app.utils.database import AsyncSessionLocal, get_db_session
+from app.utils.async_utils import run_in_thread
 from app.models.trading_models import TradingSignal
 
+# 분석 히스토리 조회 컬럼 (ORM 객체 생성 없이 dict 형태로 조회)
+ANALYSIS_HISTORY_SELECT = select(
+    TradingSignal.id,
+    TradingSignal.symbol,
+    TradingSignal.signal_type,
+    TradingSignal.confidence,
+    TradingSignal.price,
+    TradingSignal.reasoning,
+    TradingSignal.created_at,
+    TradingSignal.executed
+)
+
+# 기본 분석 대상 심볼 (가장 활발한 거래 심볼)
+TARGET_SYMBOL = 'BTCUSDT'
+
 
 class AIEngine:
     """LLM 앙상블 기반 AI 분석 엔진"""
@@ -25,11 +48,36 @@ class AIEngine:
         self.trading_executor = TradingExecutor()
         self.notification_service = NotificationService()
         self.logger = logger.bind(name="ai_engine")
+        # 필터링되는 로그는 메시지 포맷팅을 생략하는 지연 평가 로거
+        self.lazy_logger = self.logger.opt(lazy=True)
         
         # 분석 주기 설정 (초 단위)
         self.analysis_interval = 60  # 1분마다 분석
         self.is_running = False
         
+        # 오류 발생 시 재시도 대기 시간 (1초부터 지수 증가, 최대 60초)
+        self._min_err_backoff = 1
+        self._max_err_backoff = 60
+        self._err_backoff = self._min_err_backoff
+        
+        # 앙상블 의사결정 캐시 (양자화된 시장 특징 해시 -> (저장 시각, 결과))
+        self._decision_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._decision_cache_ttl = 120  # 초
+        self._decision_cache_size = 1024
+        
+        # 메인 루프 전용 DB 세션 (루프 동안 유지하며 반복마다 커밋, 중지 시 종료)
+        self._session: Optional[AsyncSession] = None
+        
+        # 감시 심볼 일괄 재평가 (거래 대상 외 심볼을 GPT-4 다중 심볼 요청으로 주기적으로 분석)
+        self._watchlist_scan_interval = LLM_CONFIG['gpt4']['watchlist_scan_interval']
+        self._watchlist_batch_size = LLM_CONFIG['gpt4']['batch_size']
+        self._low_priority_symbols = frozenset(LLM_CONFIG['gpt4']['low_priority_symbols'])
+        self._watchlist_task: Optional[asyncio.Task] = None
+        
+        # 시스템 상태 알림 주기 (초)
+        self._status_interval = 3600
+        self._last_status_sent: Optional[float] = None  # time.monotonic() 기준
+        
     async def start_ai_trading(self):
         """AI 거래 시작"""
         try:
@@ -37,7 +85,11 @@ class AIEngine:
             self.is_running = True
             
             # 데이터 수집 시작
-            self.data_collector.start()
+            await self.data_collector.start()
+            
+            # 감시 심볼 재평가 시작
+            if self._watchlist_scan_interval > 0:
+                self._watchlist_task = asyncio.create_task(self._watchlist_scan_loop())
             
             # 메인 루프 시작
             await self._main_trading_loop()
@@ -46,14 +98,24 @@ class AIEngine:
             self.logger.error(f"AI 거래 시작 오류: {e}")
             await self._send_error_notification(str(e))
             
+        finally:
+            await self._cancel_watchlist_scan()
+            await self._close_session()
+            
     async def stop_ai_trading(self):
         """AI 거래 중지"""
         try:
             self.logger.info("AI 거래 시스템을 중지합니다.")
             self.is_running = False
             
+            # 감시 심볼 재평가 중지
+            await self._cancel_watchlist_scan()
+            
             # 데이터 수집 중지
-            self.data_collector.stop()
+            await self.data_collector.stop()
+            
+            # 메인 루프 DB 세션 종료
+            await self._close_session()
             
         except Exception as e:
             self.logger.error(f"AI 거래 중지 오류: {e}")
@@ -62,6 +124,9 @@ class AIEngine:
         """메인 거래 루프"""
         while self.is_running:
             try:
+                # 반복마다 현재 시각을 한 번만 조회해 하위 단계에 전달
+                now_dt = datetime.now()
+                
                 # 시장 데이터 수집
                 market_data = self._collect_market_data()
                 
@@ -78,42 +143,42 @@ class AIEngine:
                     trading_signal = self._generate_trading_signal(analysis_result, market_data)
                     
                     # 거래 신호 저장
-                    self._save_trading_signal(trading_signal)
+                    await self._save_trading_signal(trading_signal, now_dt)
                     
                     # 거래 실행
-                    trade_result = self.trading_executor.execute_trading_signal(trading_signal, market_data)
+                    trade_result = await self.trading_executor.execute_trading_signal(trading_signal, market_data)
                     
                     # 알림 전송
                     await self._send_trading_notifications(trade_result, trading_signal)
                     
                     # 시스템 상태 업데이트
-                    await self._update_system_status()
+                    await self._update_system_status(now_dt)
                     
+                # 정상 처리 시 재시도 대기 시간 초기화
+                self._err_backoff = self._min_err_backoff
+                
                 # 대기
                 await asyncio.sleep(self.analysis_interval)
                 
             except Exception as e:
-                self.logger.error(f"메인 루프 오류: {e}")
+                self.logger.error(f"메인 루프 오류: {e} ({self._err_backoff}초 후 재시도)")
                 await self._send_error_notification(str(e))
-                await asyncio.sleep(self.analysis_interval)
+                await asyncio.sleep(self._err_backoff)
+                self._err_backoff = min(self._err_backoff * 2, self._max_err_backoff)
                 
     def _collect_market_data(self) -> Optional[Dict]:
         """시장 데이터 수집"""
         try:
-            # 모든 심볼의 최신 데이터 조회
-            symbols_data = self.data_collector.get_symbols_data()
-            
-            if not symbols_data:
-                return None
-                
-            # 가장 활발한 거래 심볼 선택 (예: BTCUSDT)
-            target_symbol = 'BTCUSDT'
-            market_data = symbols_data.get(target_symbol)
+            # 가장 활발한 거래 심볼 선택 (전체 캐시를 복사하지 않고 직접 조회)
+            target_symbol = TARGET_SYMBOL
+            market_data = self.data_collector.get_latest_data(target_symbol)
             
             if not market_data:
                 # 첫 번째 사용 가능한 심볼 사용
-                target_symbol = list(symbols_data.keys())[0]
-                market_data = symbols_data[target_symbol]
+                target_symbol = self.data_collector.get_first_symbol()
+                if target_symbol is None:
+                    return None
+                market_data = self.data_collector.get_latest_data(target_symbol)
                 
             # 심볼 정보 추가
             market_data['symbol'] = target_symbol
@@ -124,17 +189,86 @@ class AIEngine:
             self.logger.error(f"시장 데이터 수집 오류: {e}")
             return None
             
+    async def _watchlist_scan_loop(self):
+        """감시 심볼 재평가 루프 (첫 재평가는 데이터가 모이도록 한 주기 뒤에 실행)"""
+        while self.is_running:
+            await asyncio.sleep(self._watchlist_scan_interval)
+            try:
+                await self._scan_watchlist()
+            except Exception as e:
+                self.logger.error(f"감시 심볼 재평가 오류: {e}")
+                
+    async def _cancel_watchlist_scan(self):
+        """감시 심볼 재평가 작업 취소"""
+        task, self._watchlist_task = self._watchlist_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            
+    async def _scan_watchlist(self):
+        """거래 대상 외 심볼을 묶어서 GPT-4로 일괄 분석 (결과는 LLM 분석 기록으로 저장)
+        
+        저우선순위 심볼은 Batch API로 제출하고 이후 재평가 주기마다 결과를 수집합니다.
+        """
+        gpt4_engine = self.ensemble_decision.gpt4_engine
+        realtime, deferred = [], []
+        for market_data in self._collect_watchlist_data():
+            (deferred if market_data['symbol'] in self._low_priority_symbols else realtime).append(market_data)
+            
+        # 실시간 심볼: 다중 심볼 요청으로 즉시 분석
+        if realtime:
+            results = await gpt4_engine.analyze_market_batch(realtime, self._watchlist_batch_size)
+            self.lazy_logger.info(
+                "감시 심볼 재평가 완료 - {summary}",
+                summary=lambda: ", ".join(
+                    f"{market_data['symbol']}: {result.get('decision', 'HOLD')}"
+                    for market_data, result in zip(realtime, results)
+                )
+            )
+            
+        # 저우선순위 심볼: 이전 배치 결과 수집 후, 처리 중인 배치가 없을 때만 새로 제출
+        if self._low_priority_symbols:
+            pending = await gpt4_engine.poll_pending_batches()
+            if deferred and not pending:
+                await gpt4_engine.submit_batch(deferred)
+        
+    def _collect_watchlist_data(self) -> List[Dict]:
+        """감시 심볼(거래 대상 제외)의 최신 시장 데이터 수집"""
+        watchlist = []
+        for symbol in self.data_collector.symbols:
+            if symbol == TARGET_SYMBOL:
+                continue
+            market_data = self.data_collector.get_latest_data(symbol)
+            if market_data:
+                watchlist.append({**market_data, 'symbol': symbol})
+        return watchlist
+        
     async def _perform_ai_analysis(self, market_data: Dict) -> Optional[Dict]:
         """AI 분석 수행"""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
+            
+            # 시장 상태가 거의 같으면 캐시된 의사결정 재사용
+            cache_key = self._make_decision_cache_key(market_data)
+            cached = self._decision_cache.get(cache_key)
+            if cached and start_time - cached[0] < self._decision_cache_ttl:
+                self._decision_cache.move_to_end(cache_key)
+                self.logger.info("AI 분석 캐시 적중 - 이전 의사결정 재사용")
+                return cached[1]
             
             # 앙상블 의사결정 수행
-            analysis_result = self.ensemble_decision.make_ensemble_decision(market_data)
+            analysis_result = await self.ensemble_decision.make_ensemble_decision(market_data)
+            
+            # 의사결정 캐시 저장 (오래된 항목부터 제거, 일시적 오류로 생긴 기본 응답은 저장하지 않음)
+            if not analysis_result.get('fallback'):
+                self._decision_cache[cache_key] = (time.monotonic(), analysis_result)
+                self._decision_cache.move_to_end(cache_key)
+                while len(self._decision_cache) > self._decision_cache_size:
+                    self._decision_cache.popitem(last=False)
             
             # 성능 로깅
-            processing_time = time.time() - start_time
-            self.logger.info(f"AI 분석 완료 - 소요시간: {processing_time:.3f}초")
+            processing_time = time.monotonic() - start_time
+            self.lazy_logger.info("AI 분석 완료 - 소요시간: {t:.3f}초", t=lambda: processing_time)
             
             return analysis_result
             
@@ -142,27 +276,50 @@ class AIEngine:
             self.logger.error(f"AI 분석 오류: {e}")
             return None
             
+    def _make_decision_cache_key(self, market_data: Dict) -> str:
+        """양자화된 시장 특징으로 의사결정 캐시 키 생성"""
+        price = market_data.get('close_price') or 0
+        rsi = market_data.get('rsi') or 0
+        macd = market_data.get('macd') or 0
+        volume = market_data.get('volume') or 0
+        bb_upper = market_data.get('bollinger_upper') or price
+        bb_lower = market_data.get('bollinger_lower') or price
+        
+        # 볼린저 밴드 위치 및 거래량 구간 (10배 단위)
+        bb_position = 'UPPER' if price >= bb_upper else 'LOWER' if price <= bb_lower else 'MIDDLE'
+        volume_bucket = int(math.log10(volume)) if volume > 0 else 0
+        
+        features = (
+            f"{market_data.get('symbol', 'UNKNOWN')}|{price:.4g}|{round(rsi)}|"
+            f"{macd:.3g}|{bb_position}|{volume_bucket}"
+        )
+        return hashlib.sha256(features.encode()).hexdigest()
+        
     def _generate_trading_signal(self, analysis_result: Dict, market_data: Dict) -> Dict:
         """거래 신호 생성"""
         try:
+            # 메서드 조회를 한 번만 하도록 지역 변수에 바인딩
+            ar_get = analysis_result.get
+            md_get = market_data.get
+            
             signal = {
-                'symbol': market_data.get('symbol', 'UNKNOWN'),
-                'decision': analysis_result.get('decision', 'HOLD'),
-                'confidence': analysis_result.get('confidence', 0.5),
-                'position_size': analysis_result.get('position_size', 5),
-                'risk_level': analysis_result.get('risk_level', 5),
-                'expected_return': analysis_result.get('expected_return', 0.0),
-                'reasoning': analysis_result.get('reasoning', ''),
-                'stop_loss': analysis_result.get('stop_loss'),
-                'take_profit': analysis_result.get('take_profit'),
-                'timeframe': analysis_result.get('timeframe', '1H'),
-                'leverage': analysis_result.get('leverage', 1),
-                'ensemble_details': analysis_result.get('ensemble_details', {}),
+                'symbol': md_get('symbol', 'UNKNOWN'),
+                'decision': ar_get('decision', 'HOLD'),
+                'confidence': ar_get('confidence', 0.5),
+                'position_size': ar_get('position_size', 5),
+                'risk_level': ar_get('risk_level', 5),
+                'expected_return': ar_get('expected_return', 0.0),
+                'reasoning': ar_get('reasoning', ''),
+                'stop_loss': ar_get('stop_loss'),
+                'take_profit': ar_get('take_profit'),
+                'timeframe': ar_get('timeframe', '1H'),
+                'leverage': ar_get('leverage', 1),
+                'ensemble_details': ar_get('ensemble_details', {}),
                 'market_data': {
-                    'price': market_data.get('close_price', 0),
-                    'volume': market_data.get('volume', 0),
-                    'rsi': market_data.get('rsi', 0),
-                    'macd': market_data.get('macd', 0)
+                    'price': md_get('close_price', 0),
+                    'volume': md_get('volume', 0),
+                    'rsi': md_get('rsi', 0),
+                    'macd': md_get('macd', 0)
                 }
             }
             
@@ -179,27 +336,42 @@ class AIEngine:
                 'reasoning': '신호 생성 실패'
             }
             
-    def _save_trading_signal(self, signal: Dict):
-        """거래 신호 저장"""
+    async def _save_trading_signal(self, signal: Dict, now_dt: Optional[datetime] = None):
+        """거래 신호 저장 (메인 루프 세션 재사용, 실패 시 롤백해 다음 저장에 영향 없음)"""
+        if self._session is None:
+            self._session = AsyncSessionLocal()
+        db = self._session
+        
         try:
-            with get_db_session() as db:
-                trading_signal = TradingSignal(
-                    symbol=signal['symbol'],
-                    signal_type=signal['decision'],
-                    confidence=signal['confidence'],
-                    price=signal['market_data']['price'],
-                    quantity=0,  # 거래 실행 시 계산
-                    leverage=signal.get('leverage', 1),
-                    reasoning=signal['reasoning'],
-                    llm_analysis=signal.get('ensemble_details', {}),
-                    created_at=datetime.now()
-                )
-                
-                db.add(trading_signal)
-                db.commit()
-                
+            db.add(TradingSignal(
+                symbol=signal['symbol'],
+                signal_type=signal['decision'],
+                confidence=signal['confidence'],
+                price=signal['market_data']['price'],
+                quantity=0,  # 거래 실행 시 계산
+                leverage=signal.get('leverage', 1),
+                reasoning=signal['reasoning'],
+                # 텍스트 컬럼이므로 앙상블 상세 결과를 JSON 문자열로 저장
+                llm_analysis=orjson.dumps(
+                    signal.get('ensemble_details', {}), default=str
+                ).decode(),
+                created_at=now_dt or datetime.now()
+            ))
+            await db.commit()
+            
         except Exception as e:
             self.logger.error(f"거래 신호 저장 오류: {e}")
+            # 롤백까지 실패하면(연결 끊김 등) 세션을 닫고 다음 저장에서 새로 생성
+            try:
+                await db.rollback()
+            except Exception:
+                await self._close_session()
+            
+    async def _close_session(self):
+        """메인 루프 DB 세션 종료"""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
             
     async def _send_trading_notifications(self, trade_result: Dict, signal: Dict):
         """거래 알림 전송"""
@@ -217,7 +389,7 @@ class AIEngine:
                 await self.notification_service.send_trade_notification(trade_data)
                 
                 # 포트폴리오 상태 알림
-                portfolio_data = self.trading_executor.get_trading_summary()
+                portfolio_data = await self.trading_executor.get_trading_summary()
                 await self.notification_service.send_portfolio_status(portfolio_data)
                 
         except Exception as e:
@@ -239,9 +411,14 @@ class AIEngine:
         except Exception as e:
             self.logger.error(f"에러 알림 전송 오류: {e}")
             
-    async def _update_system_status(self):
+    async def _update_system_status(self, now_dt: Optional[datetime] = None):
         """시스템 상태 업데이트"""
         try:
+            # 주기적으로 상태 알림 전송 (1시간마다, 전송할 때만 상태 데이터 생성)
+            now = time.monotonic()
+            if self._last_status_sent is not None and now - self._last_status_sent < self._status_interval:
+                return
+                
             # 시스템 상태 확인
             status_data = {
                 'status': 'HEALTHY',
@@ -250,14 +427,12 @@ class AIEngine:
                     'ai_engine': 'active',
                     'trading_executor': 'active',
                     'notification_service': 'active',
-                    'last_update': datetime.now().isoformat()
+                    'last_update': (now_dt or datetime.now()).isoformat()
                 }
             }
             
-            # 주기적으로 상태 알림 전송 (예: 1시간마다)
-            current_hour = datetime.now().hour
-            if current_hour % 1 == 0:  # 매시간
-                await self.notification_service.send_system_status_notification(status_data)
+            await self.notification_service.send_system_status_notification(status_data)
+            self._last_status_sent = now
                 
         except Exception as e:
             self.logger.error(f"시스템 상태 업데이트 오류: {e}")
@@ -291,6 +466,12 @@ class AIEngine:
     async def get_system_summary(self) -> Dict:
         """시스템 요약 정보 조회"""
         try:
+            # 포지션과 거래 요약은 독립적인 I/O이므로 동시에 조회
+            positions, trading_summary = await asyncio.gather(
+                run_in_thread(self.trading_executor.get_positions),
+                self.trading_executor.get_trading_summary()
+            )
+            
             return {
                 'ai_engine': {
                     'status': 'active' if self.is_running else 'inactive',
@@ -304,8 +485,8 @@ class AIEngine:
                 },
                 'trading_executor': {
                     'status': 'active',
-                    'positions': self.trading_executor.get_positions(),
-                    'summary': self.trading_executor.get_trading_summary()
+                    'positions': positions,
+                    'summary': trading_summary
                 },
                 'notification_service': {
                     'status': 'active',
@@ -324,25 +505,34 @@ class AIEngine:
     def get_analysis_history(self, limit: int = 100) -> List[Dict]:
         """분석 히스토리 조회"""
         try:
+            stmt = ANALYSIS_HISTORY_SELECT.order_by(
+                TradingSignal.created_at.desc()
+            ).limit(limit)
+            
             with get_db_session() as db:
-                signals = db.query(TradingSignal).order_by(
-                    TradingSignal.created_at.desc()
-                ).limit(limit).all()
+                return [
+                    {**row, 'created_at': row['created_at'].isoformat()}
+                    for row in db.execute(stmt).mappings()
+                ]
                 
+        except Exception as e:
+            self.logger.error(f"분석 히스토리 조회 오류: {e}")
+            return []
+            
+    async def aget_analysis_history(self, limit: int = 100) -> List[Dict]:
+        """분석 히스토리 조회 (비동기 세션, 이벤트 루프 비차단)"""
+        try:
+            stmt = ANALYSIS_HISTORY_SELECT.order_by(
+                TradingSignal.created_at.desc()
+            ).limit(limit)
+            
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(stmt)
                 return [
-                    {
-                        'id': signal.id,
-                        'symbol': signal.symbol,
-                        'signal_type': signal.signal_type.value,
-                        'confidence': signal.confidence,
-                        'price': signal.price,
-                        'reasoning': signal.reasoning,
-                        'created_at': signal.created_at.isoformat(),
-                        'executed': signal.executed
-                    }
-                    for signal in signals
+                    {**row, 'created_at': row['created_at'].isoformat()}
+                    for row in result.mappings()
                 ]
                 
         except Exception as e:
             self.logger.error(f"분석 히스토리 조회 오류: {e}")
-            return [] 
\ No newline at end of file
+            return []
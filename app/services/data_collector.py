@@ -4,83 +4,174 @@
 
 import asyncio
 import json
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from binance.client import Client
-from binance.websockets import BinanceSocketManager
+from binance import AsyncClient
 from binance.exceptions import BinanceAPIException
-import pandas as pd
-import numpy as np
-import ta
 from loguru import logger
+from sqlalchemy import insert, select
 
 from app.config import settings, EXCHANGE_CONFIG
-from app.utils.database import get_db_session
+from app.utils.database import engine, get_db_session
+from app.utils.async_utils import run_in_thread
+from app.utils.binance_streams import FastBinanceSocketManager
 from app.models.trading_models import MarketData
+from app.utils.indicators import IndicatorState
+
+# 시장 데이터 INSERT 문 (ORM 단위 작업 없이 Core로 실행, 컴파일 결과 재사용)
+MARKET_INSERT = insert(MarketData.__table__)
+
+# 과거 데이터 조회 컬럼 (ORM 객체 생성 없이 dict 형태로 조회)
+HISTORY_SELECT = select(
+    MarketData.symbol,
+    MarketData.timestamp,
+    MarketData.open_price,
+    MarketData.high_price,
+    MarketData.low_price,
+    MarketData.close_price,
+    MarketData.volume,
+    MarketData.rsi,
+    MarketData.macd,
+    MarketData.bollinger_upper,
+    MarketData.bollinger_lower,
+    MarketData.sma_20,
+    MarketData.sma_50
+)
+
+# INSERT 대상 컬럼 (다중 행 INSERT는 모든 행의 키가 같아야 함)
+MARKET_COLUMNS = tuple(
+    column.name for column in MarketData.__table__.columns
+    if column.name not in ('id', 'created_at')
+)
 
 
 class DataCollector:
     """실시간 시장 데이터 수집기"""
     
     def __init__(self):
-        self.client = Client(
-            settings.binance_api_key,
-            settings.binance_secret_key,
-            testnet=settings.binance_testnet
-        )
-        self.bm = BinanceSocketManager(self.client)
-        self.connections = []
+        # 비동기 클라이언트는 start()에서 이벤트 루프 위에 생성
+        self.client: Optional[AsyncClient] = None
+        self.bm: Optional[FastBinanceSocketManager] = None
+        self.connections: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.symbols = EXCHANGE_CONFIG['binance']['supported_symbols']
+        self._symbol_set = frozenset(self.symbols)
         self.data_cache = {}
         self.logger = logger.bind(name="data_collector")
         
-        # 기술적 지표 계산을 위한 데이터 저장
-        self.klines_cache = {}
+        # 심볼별 기술적 지표 스트리밍 상태
+        self.klines_cache: Dict[str, IndicatorState] = {}
+        
+        # 시장 데이터 일괄 저장 버퍼 (백그라운드 스레드가 주기적으로 flush)
+        self._pending_rows: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        self._flush_interval = 0.5  # 초
+        self._flush_batch_size = 500  # 이 이상 쌓이면 즉시 flush
+        self._flush_wakeup = threading.Event()
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        
+        # 과거 데이터 수집 시 최대 동시 REST 요청 수
+        self._history_concurrency = 10
         
-    def start(self):
+    async def start(self):
         """데이터 수집 시작"""
         self.logger.info("데이터 수집 서비스를 시작합니다.")
         
-        # WebSocket 연결 시작
-        for symbol in self.symbols:
-            self._start_symbol_stream(symbol)
-            
-        # REST API로 과거 데이터 수집
-        self._collect_historical_data()
+        # 비동기 클라이언트 및 소켓 매니저 생성
+        self._loop = asyncio.get_running_loop()
+        self.client = await AsyncClient.create(
+            settings.binance_api_key,
+            settings.binance_secret_key,
+            testnet=settings.binance_testnet
+        )
+        self.bm = FastBinanceSocketManager(self.client)
+        
+        # 시장 데이터 저장 스레드 시작
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        
+        # REST API로 과거 데이터 수집 (지표 상태를 먼저 채운 뒤 실시간 갱신)
+        await self._collect_historical_data()
         
-    def stop(self):
+        # WebSocket 스트림 시작 (전체 심볼을 결합 스트림 2개로 수신)
+        self._start_streams()
+        
+    async def stop(self):
         """데이터 수집 중지"""
         self.logger.info("데이터 수집 서비스를 중지합니다.")
         
-        # WebSocket 연결 종료
-        for conn in self.connections:
-            conn.close()
+        # 스트림 태스크는 수집을 시작한 이벤트 루프에서 종료
+        loop = self._loop
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._close_streams(), loop)
+            await asyncio.wrap_future(future)
+        else:
+            await self._close_streams()
+        
+        # 저장 스레드 종료 후 남은 데이터 저장
+        await run_in_thread(self._stop_flush_thread)
+        
+    async def _close_streams(self):
+        """WebSocket 스트림 태스크 및 클라이언트 종료"""
+        for task in self.connections:
+            task.cancel()
+        await asyncio.gather(*self.connections, return_exceptions=True)
         self.connections.clear()
         
-    def _start_symbol_stream(self, symbol: str):
-        """특정 심볼의 WebSocket 스트림 시작"""
-        try:
-            # Kline/Candlestick 스트림
-            conn_key = self.bm.start_kline_socket(
-                symbol.lower(),
-                self._process_kline_message,
-                interval=Client.KLINE_INTERVAL_1MINUTE
-            )
-            self.connections.append(conn_key)
-            
-            # 24hr Ticker 스트림
-            conn_key = self.bm.start_symbol_ticker_socket(
-                symbol,
-                self._process_ticker_message
-            )
-            self.connections.append(conn_key)
-            
-            self.logger.info(f"{symbol} 스트림이 시작되었습니다.")
-            
-        except Exception as e:
-            self.logger.error(f"{symbol} 스트림 시작 실패: {e}")
+        if self.client:
+            await self.client.close_connection()
+            self.client = None
+            self.bm = None
             
+    def _stop_flush_thread(self):
+        """저장 스레드 종료 후 남은 데이터 저장"""
+        self._flush_stop.set()
+        self._flush_wakeup.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=5)
+            self._flush_thread = None
+        self._flush_pending_rows()
+        
+    def _start_streams(self):
+        """WebSocket 스트림 태스크 시작"""
+        # Kline/Candlestick 멀티플렉스 스트림 (<symbol>@kline_1m/...)
+        kline_streams = [
+            f"{symbol.lower()}@kline_{AsyncClient.KLINE_INTERVAL_1MINUTE}"
+            for symbol in self.symbols
+        ]
+        self.connections.append(asyncio.create_task(self._run_stream(
+            "Kline",
+            lambda: self.bm.multiplex_socket(kline_streams),
+            self._process_multiplex_kline_message
+        )))
+        
+        # 전체 심볼 24hr Ticker 스트림 (!ticker@arr)
+        self.connections.append(asyncio.create_task(self._run_stream(
+            "Ticker",
+            self.bm.ticker_socket,
+            self._process_all_tickers
+        )))
+        
+        self.logger.info(f"{len(self.symbols)}개 심볼 스트림이 시작되었습니다.")
+        
+    async def _run_stream(self, name: str, socket_factory, handler):
+        """WebSocket 메시지를 이벤트 루프에서 수신해 처리 (오류 시 재연결)"""
+        while True:
+            try:
+                async with socket_factory() as stream:
+                    while True:
+                        handler(await stream.recv())
+                        
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"{name} 스트림 오류: {e}")
+                await asyncio.sleep(1)
+                
     def _process_kline_message(self, msg):
         """Kline 메시지 처리"""
         try:
@@ -111,6 +202,25 @@ class DataCollector:
         except Exception as e:
             self.logger.error(f"Kline 메시지 처리 오류: {e}")
             
+    def _process_multiplex_kline_message(self, msg):
+        """멀티플렉스 Kline 메시지 처리"""
+        data = msg.get('data')
+        if data is not None:
+            self._process_kline_message(data)
+        else:
+            self.logger.error(f"Kline 스트림 메시지 오류: {msg}")
+            
+    def _process_all_tickers(self, msg):
+        """전체 심볼 Ticker 배열 메시지 처리"""
+        if not isinstance(msg, list):
+            self.logger.error(f"Ticker 스트림 메시지 오류: {msg}")
+            return
+            
+        symbols = self._symbol_set
+        for ticker in msg:
+            if ticker['s'] in symbols:
+                self._process_ticker_message(ticker)
+                
     def _process_ticker_message(self, msg):
         """Ticker 메시지 처리"""
         try:
@@ -135,41 +245,13 @@ class DataCollector:
         try:
             symbol = data['symbol']
             
-            # 캐시된 데이터 가져오기
-            if symbol not in self.klines_cache:
-                self.klines_cache[symbol] = []
+            # 심볼별 지표 상태 가져오기
+            state = self.klines_cache.get(symbol)
+            if state is None:
+                state = self.klines_cache[symbol] = IndicatorState()
                 
-            # 새로운 데이터 추가
-            self.klines_cache[symbol].append(data)
-            
-            # 최근 100개 데이터만 유지
-            if len(self.klines_cache[symbol]) > 100:
-                self.klines_cache[symbol] = self.klines_cache[symbol][-100:]
-                
-            # DataFrame 생성
-            df = pd.DataFrame(self.klines_cache[symbol])
-            
-            if len(df) >= 20:  # 최소 데이터 필요
-                # RSI 계산
-                data['rsi'] = ta.momentum.RSIIndicator(df['close_price']).rsi().iloc[-1]
-                
-                # MACD 계산
-                macd = ta.trend.MACD(df['close_price'])
-                data['macd'] = macd.macd().iloc[-1]
-                data['macd_signal'] = macd.macd_signal().iloc[-1]
-                data['macd_histogram'] = macd.macd_diff().iloc[-1]
-                
-                # Bollinger Bands 계산
-                bb = ta.volatility.BollingerBands(df['close_price'])
-                data['bollinger_upper'] = bb.bollinger_hband().iloc[-1]
-                data['bollinger_middle'] = bb.bollinger_mavg().iloc[-1]
-                data['bollinger_lower'] = bb.bollinger_lband().iloc[-1]
-                
-                # 이동평균선 계산
-                data['sma_20'] = ta.trend.SMAIndicator(df['close_price'], window=20).sma_indicator().iloc[-1]
-                data['sma_50'] = ta.trend.SMAIndicator(df['close_price'], window=50).sma_indicator().iloc[-1]
-                data['ema_12'] = ta.trend.EMAIndicator(df['close_price'], window=12).ema_indicator().iloc[-1]
-                data['ema_26'] = ta.trend.EMAIndicator(df['close_price'], window=26).ema_indicator().iloc[-1]
+            # 새 종가로 지표 갱신 (최소 데이터 수 미만이면 빈 dict)
+            data.update(state.update(data['close_price']))
                 
         except Exception as e:
             self.logger.error(f"기술적 지표 계산 오류: {e}")
@@ -177,59 +259,106 @@ class DataCollector:
         return data
         
     def _save_market_data(self, data: Dict):
-        """시장 데이터를 데이터베이스에 저장"""
+        """시장 데이터를 저장 버퍼에 추가"""
+        row = {column: data.get(column) for column in MARKET_COLUMNS}
+        with self._pending_lock:
+            self._pending_rows.append(row)
+            pending = len(self._pending_rows)
+            
+        if pending >= self._flush_batch_size:
+            self._flush_wakeup.set()
+            
+    def _flush_loop(self):
+        """저장 버퍼를 주기적으로 데이터베이스에 저장"""
+        while not self._flush_stop.is_set():
+            self._flush_wakeup.wait(self._flush_interval)
+            self._flush_wakeup.clear()
+            self._flush_pending_rows()
+            
+    def _flush_pending_rows(self):
+        """버퍼에 쌓인 시장 데이터를 한 번의 다중 행 INSERT로 저장"""
+        with self._pending_lock:
+            rows, self._pending_rows = self._pending_rows, []
+            
+        if not rows:
+            return
+            
         try:
-            with get_db_session() as db:
-                market_data = MarketData(**data)
-                db.add(market_data)
-                db.commit()
+            self._insert_market_rows(rows)
                 
         except Exception as e:
-            self.logger.error(f"시장 데이터 저장 오류: {e}")
+            self.logger.error(f"시장 데이터 저장 오류 ({len(rows)}건): {e}")
+            
+    def _insert_market_rows(self, rows: List[Dict]):
+        """시장 데이터 다중 행 INSERT"""
+        with engine.begin() as conn:
+            conn.execute(MARKET_INSERT, rows)
             
     def _update_cache(self, symbol: str, data: Dict):
         """캐시 업데이트"""
         self.data_cache[symbol] = data
         
-    def _collect_historical_data(self):
-        """과거 데이터 수집"""
+    async def _collect_historical_data(self):
+        """과거 데이터 수집 (심볼별 REST 요청을 동시에 수행)"""
         self.logger.info("과거 데이터 수집을 시작합니다.")
         
-        for symbol in self.symbols:
-            try:
-                # 최근 100개 캔들스틱 데이터 수집
-                klines = self.client.get_klines(
+        # 거래소 요청 한도를 넘지 않도록 동시 요청 수 제한
+        semaphore = asyncio.Semaphore(self._history_concurrency)
+        await asyncio.gather(*(
+            self._collect_symbol_history(symbol, semaphore) for symbol in self.symbols
+        ))
+        
+    async def _collect_symbol_history(self, symbol: str, semaphore: asyncio.Semaphore):
+        """특정 심볼의 과거 데이터 수집"""
+        try:
+            # 최근 100개 캔들스틱 데이터 수집
+            async with semaphore:
+                klines = await self.client.get_klines(
                     symbol=symbol,
-                    interval=Client.KLINE_INTERVAL_1MINUTE,
+                    interval=AsyncClient.KLINE_INTERVAL_1MINUTE,
                     limit=100
                 )
                 
-                for kline in klines:
-                    data = {
-                        'symbol': symbol,
-                        'timestamp': datetime.fromtimestamp(kline[0] / 1000),
-                        'open_price': float(kline[1]),
-                        'high_price': float(kline[2]),
-                        'low_price': float(kline[3]),
-                        'close_price': float(kline[4]),
-                        'volume': float(kline[5])
-                    }
-                    
-                    # 기술적 지표 계산
-                    data = self._calculate_technical_indicators(data)
-                    
-                    # 데이터베이스에 저장
-                    self._save_market_data(data)
-                    
-                self.logger.info(f"{symbol} 과거 데이터 수집 완료")
+            # 새 지표 상태로 전체 캔들을 한 번에 계산
+            state = IndicatorState()
+            rows = []
+            for kline in klines:
+                data = {
+                    'symbol': symbol,
+                    'timestamp': datetime.fromtimestamp(kline[0] / 1000),
+                    'open_price': float(kline[1]),
+                    'high_price': float(kline[2]),
+                    'low_price': float(kline[3]),
+                    'close_price': float(kline[4]),
+                    'volume': float(kline[5])
+                }
+                data.update(state.update(data['close_price']))
+                rows.append(data)
                 
-            except Exception as e:
-                self.logger.error(f"{symbol} 과거 데이터 수집 실패: {e}")
+            # 한 번의 트랜잭션으로 일괄 저장
+            if rows:
+                await run_in_thread(self._insert_market_rows, [
+                    {column: row.get(column) for column in MARKET_COLUMNS} for row in rows
+                ])
+                    
+            # 실시간 스트림이 이어서 갱신하도록 지표 상태 설정
+            self.klines_cache[symbol] = state
+            if rows:
+                self._update_cache(symbol, rows[-1])
                 
+            self.logger.info(f"{symbol} 과거 데이터 수집 완료")
+            
+        except Exception as e:
+            self.logger.error(f"{symbol} 과거 데이터 수집 실패: {e}")
+            
     def get_latest_data(self, symbol: str) -> Optional[Dict]:
         """최신 데이터 조회"""
         return self.data_cache.get(symbol)
         
+    def get_first_symbol(self) -> Optional[str]:
+        """데이터가 있는 첫 번째 심볼 조회"""
+        return next(iter(self.data_cache), None)
+        
     def get_symbols_data(self) -> Dict[str, Dict]:
         """모든 심볼의 최신 데이터 조회"""
         return self.data_cache.copy()
@@ -237,31 +366,14 @@ class DataCollector:
     def get_historical_data(self, symbol: str, limit: int = 100) -> List[Dict]:
         """과거 데이터 조회"""
         try:
+            stmt = HISTORY_SELECT.where(
+                MarketData.symbol == symbol
+            ).order_by(
+                MarketData.timestamp.desc()
+            ).limit(limit)
+            
             with get_db_session() as db:
-                market_data = db.query(MarketData).filter(
-                    MarketData.symbol == symbol
-                ).order_by(
-                    MarketData.timestamp.desc()
-                ).limit(limit).all()
-                
-                return [
-                    {
-                        'symbol': data.symbol,
-                        'timestamp': data.timestamp,
-                        'open_price': data.open_price,
-                        'high_price': data.high_price,
-                        'low_price': data.low_price,
-                        'close_price': data.close_price,
-                        'volume': data.volume,
-                        'rsi': data.rsi,
-                        'macd': data.macd,
-                        'bollinger_upper': data.bollinger_upper,
-                        'bollinger_lower': data.bollinger_lower,
-                        'sma_20': data.sma_20,
-                        'sma_50': data.sma_50
-                    }
-                    for data in market_data
-                ]
+                return [dict(row) for row in db.execute(stmt).mappings()]
                 
         except Exception as e:
             self.logger.error(f"과거 데이터 조회 오류: {e}")
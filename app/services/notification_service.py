@@ -3,42 +3,223 @@ Telegram Bot 알림 서비스
 """
 
 import asyncio
-import json
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
+import orjson
 from loguru import logger
+from sqlalchemy import insert, select
 
 from app.config import settings, NOTIFICATION_CONFIG
-from app.utils.database import get_db_session
-from app.models.notification_models import Notification, NotificationHistory, NotificationStatus
+from app.utils.database import AsyncSessionLocal, get_db_session
+from app.utils.rate_limiter import TokenBucket
+from app.models.notification_models import (
+    Notification, NotificationHistory, NotificationStatus, NotificationType, NotificationChannel
+)
+
+# 알림 타입별 이모지
+EMOJI_MAP = MappingProxyType({
+    'TRADE_EXECUTION': '🔔',
+    'PROFIT_LOSS': '💰',
+    'SYSTEM_STATUS': '⚙️',
+    'RISK_ALERT': '⚠️',
+    'DAILY_REPORT': '📊',
+    'WEEKLY_REPORT': '📈',
+    'MONTHLY_REPORT': '📋'
+})
+
+# 알림 타입별 제목 (미리 생성)
+TITLE_MAP = MappingProxyType({
+    notification_type: f"{emoji} AI 거래 시스템 알림"
+    for notification_type, emoji in EMOJI_MAP.items()
+})
+DEFAULT_TITLE = "📢 AI 거래 시스템 알림"
+
+# 시스템 상태별 이모지 (그 외 상태는 🔴)
+STATUS_EMOJI = MappingProxyType({'HEALTHY': '🟢', 'WARNING': '🟡'})
+
+# 리스크 레벨별 이모지 (그 외 레벨은 ℹ️)
+RISK_EMOJI = MappingProxyType({'HIGH': '⚠️', 'MEDIUM': '⚡'})
+
+# 알림 히스토리 조회 컬럼 (ORM 객체 생성 없이 필요한 컬럼만 조회)
+NOTIFICATION_HISTORY_SELECT = select(
+    Notification.id,
+    Notification.notification_type,
+    Notification.title,
+    Notification.status,
+    Notification.created_at,
+    Notification.sent_at
+)
+
+# 알림/알림 히스토리 INSERT 문 (ORM 단위 작업 없이 Core로 실행)
+NOTIFICATION_INSERT = insert(Notification.__table__).returning(Notification.__table__.c.id)
+NOTIFICATION_HISTORY_INSERT = insert(NotificationHistory.__table__)
+
+# 중복 방지 제외 알림 타입 (같은 내용의 체결도 각각 실제로 발생한 거래)
+DEDUP_EXEMPT_TYPES = frozenset({'TRADE_EXECUTION'})
+
+# 알림 메시지 시각 형식
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 알림 메시지 템플릿 (str.format_map으로 한 번에 생성)
+TRADE_TEMPLATE = (
+    "🔔 거래 실행 알림\n\n"
+    "📊 심볼: {symbol}\n"
+    "🎯 액션: {action}\n"
+    "📈 수량: {quantity}\n"
+    "💰 가격: ${price:,.2f}\n"
+    "🎯 신뢰도: {confidence:.1%}\n"
+    "⏰ 시간: {time}"
+)
+PROFIT_LOSS_TEMPLATE = (
+    "{emoji} {status} 알림\n\n"
+    "📊 심볼: {symbol}\n"
+    "📈 포지션: {position_type}\n"
+    "💰 {status}: ${pnl:,.2f}\n"
+    "📊 비율: {pnl_percent:.2f}%\n"
+    "⏰ 시간: {time}"
+)
+SYSTEM_STATUS_TEMPLATE = (
+    "{emoji} 시스템 상태 알림\n\n"
+    "📊 상태: {status}\n"
+    "⏰ 시간: {time}\n\n"
+)
+RISK_ALERT_TEMPLATE = (
+    "{emoji} 리스크 알림\n\n"
+    "🚨 리스크 레벨: {risk_level}\n"
+    "📊 리스크 타입: {risk_type}\n"
+    "⏰ 시간: {time}\n\n"
+)
+DAILY_REPORT_TEMPLATE = (
+    "{emoji} 일일 거래 리포트\n\n"
+    "📊 총 거래: {total_trades}건\n"
+    "✅ 승리: {winning_trades}건\n"
+    "❌ 패배: {losing_trades}건\n"
+    "🎯 승률: {win_rate:.1f}%\n"
+    "💰 총 손익: ${total_pnl:,.2f}\n"
+    "📅 날짜: {date}"
+)
+PORTFOLIO_TEMPLATE = (
+    "📊 포트폴리오 상태\n\n"
+    "💰 총 잔고: ${total_balance:,.2f}\n"
+    "💳 사용 가능: ${available_balance:,.2f}\n"
+    "📈 미실현 손익: ${total_unrealized_pnl:,.2f}\n"
+    "📋 활성 포지션: {positions_count}개\n"
+    "⏰ 시간: {time}"
+)
+
+# 초 단위로 캐시한 현재 시각 문자열 (초, 문자열)
+_now_str_cache = (0, '')
+
+
+def _now_str() -> str:
+    """현재 시각 문자열 (같은 초 안에서는 포맷 결과 재사용)"""
+    global _now_str_cache
+    t = int(time.time())
+    cached_t, cached_s = _now_str_cache
+    if t != cached_t:
+        cached_s = time.strftime(TIME_FORMAT, time.localtime(t))
+        _now_str_cache = (t, cached_s)
+    return cached_s
 
 
 class NotificationService:
     """Telegram Bot 알림 서비스"""
     
     def __init__(self):
-        self.bot = Bot(token=settings.telegram_bot_token)
+        # 연결을 재사용하는 HTTP/2 커넥션 풀 (버스트 전송 시 TLS 핸드셰이크 최소화)
+        # Bot.shutdown()은 initialize()하지 않은 봇에서 아무것도 닫지 않으므로 요청 객체를 직접 보관 후 종료
+        self._request = HTTPXRequest(connection_pool_size=20, http_version="2")
+        self._get_updates_request = HTTPXRequest(connection_pool_size=1)
+        self.bot = Bot(
+            token=settings.telegram_bot_token,
+            request=self._request,
+            get_updates_request=self._get_updates_request
+        )
         self.chat_id = settings.telegram_chat_id
         self.logger = logger.bind(name="notification_service")
         self.config = NOTIFICATION_CONFIG['telegram']
         
-    async def send_notification(self, notification_type: str, message: str, data: Dict = None) -> Dict:
-        """알림 전송"""
+        # 알림 전송률 제한 (토큰 버킷)
+        self.rate_limiter = TokenBucket(
+            rate=self.config['rate_limit_per_minute'] / 60,
+            capacity=self.config['burst']
+        )
+        
+        # Telegram 전송 큐 (전송 워커가 토큰 버킷 속도에 맞춰 순서대로 전송)
+        self.send_limiter = TokenBucket(
+            rate=self.config['send_rate_per_second'],
+            capacity=self.config['send_burst']
+        )
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        
+        # 전송 동시성 제한 (진행 중인 전송 수와 상한, 상한은 실행 중 변경 가능)
+        self._send_cv: Optional[asyncio.Condition] = None
+        self._in_flight = 0
+        self._max_in_flight = self.config['max_concurrent_sends']
+        
+        # 최근 전송한 알림 내용 해시 (MD5 -> 전송 시각)
+        self._recent: "OrderedDict[bytes, float]" = OrderedDict()
+        
+    async def close(self):
+        """전송 워커 및 HTTP 커넥션 풀 종료"""
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+            await asyncio.gather(self._dispatch_task, return_exceptions=True)
+            
+            # 전송되지 못한 메시지의 대기 중인 호출자 해제
+            while not self._send_queue.empty():
+                _, _, future = self._send_queue.get_nowait()
+                future.cancel()
+                
+            self._dispatch_task = None
+            self._send_queue = None
+        await asyncio.gather(self._request.shutdown(), self._get_updates_request.shutdown())
+        
+    async def send_notification(self, notification_type: str, message: str, data: Dict = None,
+                                *, skip_template: bool = False) -> Dict:
+        """알림 전송 (skip_template=True면 이미 완성된 메시지를 그대로 전송)"""
         try:
             # 알림 설정 확인
             if not self._is_notification_enabled(notification_type):
                 return {"success": False, "error": "알림이 비활성화되어 있습니다"}
                 
-            # 알림 템플릿 생성
-            title, formatted_message = self._create_notification_template(notification_type, message, data)
+            # 최근에 같은 내용을 보냈으면 전송 및 기록 생략
+            dedup_key = None
+            if notification_type not in DEDUP_EXEMPT_TYPES:
+                dedup_key = self._dedup_key(notification_type, message, data)
+                if self._is_duplicate(dedup_key):
+                    return {"success": True, "deduped": True}
+                
+            # 전송률 제한 확인 (위험 알림은 항상 전송)
+            if notification_type != 'RISK_ALERT' and not self.rate_limiter.request_tokens():
+                self.logger.warning(f"알림 전송률 제한으로 {notification_type} 알림을 건너뜁니다.")
+                return {"success": False, "error": "알림 전송 한도를 초과했습니다"}
+                
+            # 알림 템플릿 생성 (완성된 메시지는 첫 줄을 기록용 제목으로 사용)
+            if skip_template:
+                title, formatted_message = '', message
+            else:
+                title, formatted_message = self._create_notification_template(notification_type, message, data)
             
             # Telegram 메시지 전송
             result = await self._send_telegram_message(title, formatted_message)
             
+            # 실제로 전송된 알림만 중복 방지 대상으로 기록
+            if dedup_key is not None and result.get('success'):
+                self._mark_sent(dedup_key)
+                
             # 알림 기록 저장
-            self._save_notification_record(notification_type, title, formatted_message, result)
+            await self._save_notification_record(
+                notification_type, title or message.partition('\n')[0], formatted_message, result
+            )
             
             return result
             
@@ -49,21 +230,17 @@ class NotificationService:
     async def send_trade_notification(self, trade_data: Dict) -> Dict:
         """거래 알림 전송"""
         try:
-            symbol = trade_data.get('symbol', 'UNKNOWN')
-            action = trade_data.get('action', 'UNKNOWN')
-            quantity = trade_data.get('quantity', 0)
-            price = trade_data.get('price', 0)
-            confidence = trade_data.get('confidence', 0)
-            
-            message = f"🔔 거래 실행 알림\n\n"
-            message += f"📊 심볼: {symbol}\n"
-            message += f"🎯 액션: {action}\n"
-            message += f"📈 수량: {quantity}\n"
-            message += f"💰 가격: ${price:,.2f}\n"
-            message += f"🎯 신뢰도: {confidence:.1%}\n"
-            message += f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            return await self.send_notification('TRADE_EXECUTION', message, trade_data)
+            get = trade_data.get
+            message = TRADE_TEMPLATE.format_map({
+                'symbol': get('symbol', 'UNKNOWN'),
+                'action': get('action', 'UNKNOWN'),
+                'quantity': get('quantity', 0),
+                'price': get('price', 0),
+                'confidence': get('confidence', 0),
+                'time': _now_str()
+            })
+            
+            return await self.send_notification('TRADE_EXECUTION', message, trade_data, skip_template=True)
             
         except Exception as e:
             self.logger.error(f"거래 알림 전송 오류: {e}")
@@ -72,22 +249,19 @@ class NotificationService:
     async def send_profit_loss_notification(self, pnl_data: Dict) -> Dict:
         """수익/손실 알림 전송"""
         try:
-            symbol = pnl_data.get('symbol', 'UNKNOWN')
-            pnl = pnl_data.get('pnl', 0)
-            pnl_percent = pnl_data.get('pnl_percent', 0)
-            position_type = pnl_data.get('position_type', 'UNKNOWN')
-            
-            emoji = "📈" if pnl > 0 else "📉"
-            status = "수익" if pnl > 0 else "손실"
-            
-            message = f"{emoji} {status} 알림\n\n"
-            message += f"📊 심볼: {symbol}\n"
-            message += f"📈 포지션: {position_type}\n"
-            message += f"💰 {status}: ${pnl:,.2f}\n"
-            message += f"📊 비율: {pnl_percent:.2f}%\n"
-            message += f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            return await self.send_notification('PROFIT_LOSS', message, pnl_data)
+            get = pnl_data.get
+            pnl = get('pnl', 0)
+            message = PROFIT_LOSS_TEMPLATE.format_map({
+                'emoji': "📈" if pnl > 0 else "📉",
+                'status': "수익" if pnl > 0 else "손실",
+                'symbol': get('symbol', 'UNKNOWN'),
+                'position_type': get('position_type', 'UNKNOWN'),
+                'pnl': pnl,
+                'pnl_percent': get('pnl_percent', 0),
+                'time': _now_str()
+            })
+            
+            return await self.send_notification('PROFIT_LOSS', message, pnl_data, skip_template=True)
             
         except Exception as e:
             self.logger.error(f"수익/손실 알림 전송 오류: {e}")
@@ -99,18 +273,18 @@ class NotificationService:
             status = status_data.get('status', 'UNKNOWN')
             details = status_data.get('details', {})
             
-            emoji = "🟢" if status == 'HEALTHY' else "🟡" if status == 'WARNING' else "🔴"
-            
-            message = f"{emoji} 시스템 상태 알림\n\n"
-            message += f"📊 상태: {status}\n"
-            message += f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            message = SYSTEM_STATUS_TEMPLATE.format_map({
+                'emoji': STATUS_EMOJI.get(status, '🔴'),
+                'status': status,
+                'time': _now_str()
+            })
             
             if details:
-                message += "📋 상세 정보:\n"
-                for key, value in details.items():
-                    message += f"• {key}: {value}\n"
+                message += "📋 상세 정보:\n" + "".join(
+                    f"• {key}: {value}\n" for key, value in details.items()
+                )
                     
-            return await self.send_notification('SYSTEM_STATUS', message, status_data)
+            return await self.send_notification('SYSTEM_STATUS', message, status_data, skip_template=True)
             
         except Exception as e:
             self.logger.error(f"시스템 상태 알림 전송 오류: {e}")
@@ -123,17 +297,17 @@ class NotificationService:
             risk_type = risk_data.get('risk_type', 'UNKNOWN')
             details = risk_data.get('details', '')
             
-            emoji = "⚠️" if risk_level == 'HIGH' else "⚡" if risk_level == 'MEDIUM' else "ℹ️"
-            
-            message = f"{emoji} 리스크 알림\n\n"
-            message += f"🚨 리스크 레벨: {risk_level}\n"
-            message += f"📊 리스크 타입: {risk_type}\n"
-            message += f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            message = RISK_ALERT_TEMPLATE.format_map({
+                'emoji': RISK_EMOJI.get(risk_level, 'ℹ️'),
+                'risk_level': risk_level,
+                'risk_type': risk_type,
+                'time': _now_str()
+            })
             
             if details:
                 message += f"📋 상세 정보:\n{details}"
                 
-            return await self.send_notification('RISK_ALERT', message, risk_data)
+            return await self.send_notification('RISK_ALERT', message, risk_data, skip_template=True)
             
         except Exception as e:
             self.logger.error(f"리스크 알림 전송 오류: {e}")
@@ -142,28 +316,47 @@ class NotificationService:
     async def send_daily_report_notification(self, report_data: Dict) -> Dict:
         """일일 리포트 알림 전송"""
         try:
-            total_trades = report_data.get('total_trades', 0)
-            winning_trades = report_data.get('winning_trades', 0)
-            losing_trades = report_data.get('losing_trades', 0)
-            total_pnl = report_data.get('total_pnl', 0)
-            win_rate = report_data.get('win_rate', 0)
-            
-            emoji = "📈" if total_pnl > 0 else "📉"
-            
-            message = f"{emoji} 일일 거래 리포트\n\n"
-            message += f"📊 총 거래: {total_trades}건\n"
-            message += f"✅ 승리: {winning_trades}건\n"
-            message += f"❌ 패배: {losing_trades}건\n"
-            message += f"🎯 승률: {win_rate:.1f}%\n"
-            message += f"💰 총 손익: ${total_pnl:,.2f}\n"
-            message += f"📅 날짜: {datetime.now().strftime('%Y-%m-%d')}"
-            
-            return await self.send_notification('DAILY_REPORT', message, report_data)
+            get = report_data.get
+            total_pnl = get('total_pnl', 0)
+            message = DAILY_REPORT_TEMPLATE.format_map({
+                'emoji': "📈" if total_pnl > 0 else "📉",
+                'total_trades': get('total_trades', 0),
+                'winning_trades': get('winning_trades', 0),
+                'losing_trades': get('losing_trades', 0),
+                'win_rate': get('win_rate', 0),
+                'total_pnl': total_pnl,
+                'date': _now_str()[:10]
+            })
+            
+            return await self.send_notification('DAILY_REPORT', message, report_data, skip_template=True)
             
         except Exception as e:
             self.logger.error(f"일일 리포트 알림 전송 오류: {e}")
             return {"success": False, "error": str(e)}
             
+    @staticmethod
+    def _dedup_key(notification_type: str, message: str, data: Optional[Dict]) -> bytes:
+        """중복 판별 키 (메시지에는 전송 시각이 들어가므로 템플릿 입력 데이터가 있으면 데이터로 판별)"""
+        content = message.encode()
+        if data:
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+            except orjson.JSONEncodeError:
+                pass
+        return hashlib.md5(notification_type.encode() + b"|" + content).digest()
+        
+    def _is_duplicate(self, key: bytes) -> bool:
+        """같은 알림을 중복 방지 기간 안에 전송했는지 확인"""
+        sent_at = self._recent.get(key)
+        return sent_at is not None and time.monotonic() - sent_at < self.config['dedup_ttl']
+        
+    def _mark_sent(self, key: bytes):
+        """전송 완료한 알림 기록 (가장 오래된 항목부터 제거)"""
+        self._recent[key] = time.monotonic()
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.config['dedup_size']:
+            self._recent.popitem(last=False)
+        
     def _is_notification_enabled(self, notification_type: str) -> bool:
         """알림 활성화 여부 확인"""
         try:
@@ -176,40 +369,85 @@ class NotificationService:
     def _create_notification_template(self, notification_type: str, message: str, data: Dict = None) -> tuple:
         """알림 템플릿 생성"""
         try:
-            # 알림 타입별 이모지
-            emoji_map = {
-                'TRADE_EXECUTION': '🔔',
-                'PROFIT_LOSS': '💰',
-                'SYSTEM_STATUS': '⚙️',
-                'RISK_ALERT': '⚠️',
-                'DAILY_REPORT': '📊',
-                'WEEKLY_REPORT': '📈',
-                'MONTHLY_REPORT': '📋'
-            }
-            
-            emoji = emoji_map.get(notification_type, '📢')
-            title = f"{emoji} AI 거래 시스템 알림"
-            
-            return title, message
+            # 알림 타입별 제목 (모듈 상수에서 조회)
+            return TITLE_MAP.get(notification_type, DEFAULT_TITLE), message
             
         except Exception as e:
             self.logger.error(f"알림 템플릿 생성 오류: {e}")
             return "📢 알림", message
             
     async def _send_telegram_message(self, title: str, message: str) -> Dict:
-        """Telegram 메시지 전송"""
+        """Telegram 메시지를 전송 큐에 넣고 전송 결과 대기"""
+        self._ensure_dispatch_worker()
+        
+        # 진행 중인 전송 수가 상한 미만이 될 때까지 대기
+        cv = self._send_cv
+        async with cv:
+            await cv.wait_for(lambda: self._in_flight < self._max_in_flight)
+            self._in_flight += 1
+            
         try:
-            full_message = f"{title}\n\n{message}"
+            future = asyncio.get_running_loop().create_future()
+            await self._send_queue.put((title, message, future))
+            return await future
+        finally:
+            async with cv:
+                self._in_flight -= 1
+                cv.notify(1)
+                
+    async def set_max_concurrency(self, max_in_flight: int):
+        """전송 동시성 상한 변경 (대기 중인 전송에 즉시 반영)"""
+        self._max_in_flight = max(1, max_in_flight)
+        if self._send_cv is not None:
+            async with self._send_cv:
+                self._send_cv.notify_all()
+        
+    def _ensure_dispatch_worker(self):
+        """현재 이벤트 루프에서 전송 워커 실행 보장"""
+        loop = asyncio.get_running_loop()
+        task = self._dispatch_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._send_queue = asyncio.Queue()
+            self._send_cv = asyncio.Condition()
+            self._in_flight = 0
+            self._dispatch_task = loop.create_task(self._dispatch_loop(self._send_queue))
+            
+    async def _dispatch_loop(self, queue: asyncio.Queue):
+        """전송 큐의 메시지를 토큰 버킷 속도에 맞춰 전송"""
+        wait_interval = 1 / self.config['send_rate_per_second']
+        while True:
+            title, message, future = await queue.get()
+            
+            # 토큰이 생길 때까지 대기
+            while not self.send_limiter.request_tokens():
+                await asyncio.sleep(wait_interval)
+                
+            result = await self._deliver_telegram_message(title, message)
+            if not future.done():
+                future.set_result(result)
+                
+    async def _deliver_telegram_message(self, title: str, message: str) -> Dict:
+        """Telegram 메시지 전송 (전송 한도 초과 시 안내된 시간만큼 대기 후 재시도)"""
+        try:
+            full_message = f"{title}\n\n{message}" if title else message
             
             # 메시지 길이 제한 (Telegram 제한: 4096자)
             if len(full_message) > 4000:
                 full_message = full_message[:4000] + "\n\n... (메시지가 잘렸습니다)"
                 
-            result = await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=full_message,
-                parse_mode='HTML'
-            )
+            for attempt in range(self.config['max_send_retries'] + 1):
+                try:
+                    result = await self.bot.send_message(
+                        chat_id=self.chat_id,
+                        text=full_message,
+                        parse_mode='HTML'
+                    )
+                    break
+                except RetryAfter as e:
+                    if attempt == self.config['max_send_retries']:
+                        raise
+                    self.logger.warning(f"Telegram 전송 한도 초과 - {e.retry_after}초 후 재시도")
+                    await asyncio.sleep(e.retry_after)
             
             return {
                 "success": True,
@@ -225,34 +463,36 @@ class NotificationService:
             self.logger.error(f"메시지 전송 오류: {e}")
             return {"success": False, "error": str(e)}
             
-    def _save_notification_record(self, notification_type: str, title: str, message: str, result: Dict):
-        """알림 기록 저장"""
+    async def _save_notification_record(self, notification_type: str, title: str, message: str, result: Dict):
+        """알림 기록 저장 (비동기 세션으로 알림과 히스토리를 한 트랜잭션으로 저장)"""
         try:
-            with get_db_session() as db:
-                notification = Notification(
-                    notification_type=notification_type,
-                    channel='TELEGRAM',
-                    title=title,
-                    message=message,
-                    data=json.dumps(result),
-                    status=NotificationStatus.SENT if result.get('success') else NotificationStatus.FAILED,
-                    sent_at=datetime.now() if result.get('success') else None,
-                    created_at=datetime.now()
-                )
-                
-                db.add(notification)
-                db.commit()
-                
-                # 알림 히스토리 저장
-                history = NotificationHistory(
-                    notification_id=notification.id,
-                    status=notification.status,
-                    response_data=json.dumps(result),
-                    created_at=datetime.now()
-                )
+            now = datetime.now()
+            success = result.get('success')
+            status = NotificationStatus.SENT if success else NotificationStatus.FAILED
+            payload_json = orjson.dumps(result).decode()
+            
+            async with AsyncSessionLocal() as db:
+                # 알림 저장 후 RETURNING으로 ID 발급 (Core 실행이므로 값은 직접 검증)
+                result_row = await db.execute(NOTIFICATION_INSERT, {
+                    'notification_type': NotificationType(notification_type.upper()).value,
+                    'channel': NotificationChannel.TELEGRAM.value,
+                    'title': title,
+                    'message': message,
+                    'data': payload_json,
+                    'status': status.value,
+                    'sent_at': now if success else None,
+                    'created_at': now
+                })
+                notification_id = result_row.scalar_one()
                 
-                db.add(history)
-                db.commit()
+                # 알림 히스토리 저장 후 함께 커밋
+                await db.execute(NOTIFICATION_HISTORY_INSERT, {
+                    'notification_id': notification_id,
+                    'status': status.value,
+                    'response_data': payload_json,
+                    'created_at': now
+                })
+                await db.commit()
                 
         except Exception as e:
             self.logger.error(f"알림 기록 저장 오류: {e}")
@@ -260,19 +500,16 @@ class NotificationService:
     async def send_portfolio_status(self, portfolio_data: Dict) -> Dict:
         """포트폴리오 상태 알림 전송"""
         try:
-            total_balance = portfolio_data.get('total_balance', 0)
-            available_balance = portfolio_data.get('available_balance', 0)
-            total_unrealized_pnl = portfolio_data.get('total_unrealized_pnl', 0)
-            positions_count = portfolio_data.get('positions_count', 0)
-            
-            message = f"📊 포트폴리오 상태\n\n"
-            message += f"💰 총 잔고: ${total_balance:,.2f}\n"
-            message += f"💳 사용 가능: ${available_balance:,.2f}\n"
-            message += f"📈 미실현 손익: ${total_unrealized_pnl:,.2f}\n"
-            message += f"📋 활성 포지션: {positions_count}개\n"
-            message += f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            get = portfolio_data.get
+            message = PORTFOLIO_TEMPLATE.format_map({
+                'total_balance': get('total_balance', 0),
+                'available_balance': get('available_balance', 0),
+                'total_unrealized_pnl': get('total_unrealized_pnl', 0),
+                'positions_count': get('positions_count', 0),
+                'time': _now_str()
+            })
             
-            return await self.send_notification('SYSTEM_STATUS', message, portfolio_data)
+            return await self.send_notification('SYSTEM_STATUS', message, portfolio_data, skip_template=True)
             
         except Exception as e:
             self.logger.error(f"포트폴리오 상태 알림 전송 오류: {e}")
@@ -281,27 +518,45 @@ class NotificationService:
     def get_notification_history(self, limit: int = 50) -> List[Dict]:
         """알림 히스토리 조회"""
         try:
+            stmt = NOTIFICATION_HISTORY_SELECT.order_by(
+                Notification.created_at.desc()
+            ).limit(limit)
+            
             with get_db_session() as db:
-                notifications = db.query(Notification).order_by(
-                    Notification.created_at.desc()
-                ).limit(limit).all()
+                return [self._history_to_dict(*row) for row in db.execute(stmt)]
                 
-                return [
-                    {
-                        'id': notif.id,
-                        'type': notif.notification_type.value,
-                        'title': notif.title,
-                        'status': notif.status.value,
-                        'created_at': notif.created_at.isoformat(),
-                        'sent_at': notif.sent_at.isoformat() if notif.sent_at else None
-                    }
-                    for notif in notifications
-                ]
+        except Exception as e:
+            self.logger.error(f"알림 히스토리 조회 오류: {e}")
+            return []
+            
+    async def aget_notification_history(self, limit: int = 50) -> List[Dict]:
+        """알림 히스토리 조회 (비동기 세션, 이벤트 루프 비차단)"""
+        try:
+            stmt = NOTIFICATION_HISTORY_SELECT.order_by(
+                Notification.created_at.desc()
+            ).limit(limit)
+            
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(stmt)
+                return [self._history_to_dict(*row) for row in result]
                 
         except Exception as e:
             self.logger.error(f"알림 히스토리 조회 오류: {e}")
             return []
             
+    @staticmethod
+    def _history_to_dict(notification_id, notification_type, title, status,
+                         created_at, sent_at) -> Dict:
+        """알림 히스토리 행을 응답 딕셔너리로 변환"""
+        return {
+            'id': notification_id,
+            'type': notification_type,
+            'title': title,
+            'status': status,
+            'created_at': created_at.isoformat(),
+            'sent_at': sent_at.isoformat() if sent_at else None
+        }
+            
     def get_notification_summary(self) -> Dict:
         """알림 서비스 요약 정보 조회"""
         return {
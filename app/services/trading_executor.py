@@ -2,17 +2,43 @@
 Binance API를 사용한 거래 실행 서비스
 """
 
+import asyncio
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from decimal import Decimal, ROUND_DOWN
 from typing import Dict, List, Optional, Any
+import numpy as np
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceOrderException
 from loguru import logger
+from sqlalchemy import func, insert, select
 
 from app.config import settings, TRADING_LIMITS, EXCHANGE_CONFIG
-from app.utils.database import get_db_session
-from app.models.trading_models import Trade, Position, TradingSignal
+from app.utils.database import AsyncSessionLocal, get_db_session
+from app.models.trading_models import Trade, Position, TradingSignal, OrderStatus
 from app.utils.logger import log_trade
+from app.utils.async_utils import run_in_executor, run_in_thread
+
+# 열린 포지션 조회 컬럼 (ORM 객체 생성 없이 필요한 컬럼만 조회)
+OPEN_POSITIONS_SELECT = select(
+    Position.symbol,
+    Position.position_type,
+    Position.quantity,
+    Position.entry_price,
+    Position.current_price,
+    Position.unrealized_pnl,
+    Position.leverage,
+    Position.created_at
+).where(Position.is_open.is_(True))
+
+# 거래 기록 INSERT 문 (쓰기 스레드가 배치 단위 executemany로 실행)
+TRADE_INSERT = insert(Trade.__table__)
+
+# 열린 포지션 수 조회
+OPEN_POSITIONS_COUNT = select(func.count(Position.id)).where(Position.is_open.is_(True))
 
 
 class TradingExecutor:
@@ -24,28 +50,67 @@ class TradingExecutor:
             settings.binance_secret_key,
             testnet=settings.binance_testnet
         )
-        self.logger = logger.bind(name="trading_executor")
+        self.logger = logger.bind(name="trading_executor", channel="trading")
         self.trading_limits = TRADING_LIMITS
         self.exchange_config = EXCHANGE_CONFIG['binance']
         
-    def execute_trading_signal(self, signal: Dict, market_data: Dict) -> Dict:
+        # 거래소 REST 호출 전용 스레드 풀 (동시 요청 수를 거래소 한도에 맞게 제한)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="binance")
+        
+        # 선물 API 호스트와 미리 연결해 첫 주문에서 TCP/TLS 핸드셰이크 생략
+        self._pool.submit(self._warm_up_connection)
+        
+        # 심볼별 주문 수량 단위/최소 수량 (exchangeInfo의 LOT_SIZE, 시작 시 백그라운드 조회)
+        self._lot_sizes: Optional[Dict[str, tuple]] = None
+        self._lot_sizes_future = self._pool.submit(self._load_lot_sizes)
+        
+        # 계좌 정보 캐시 (time.monotonic() 기준 조회 시각, 계좌 정보)
+        self._acct_cache: tuple = (0.0, None)
+        self._acct_cache_ttl = 1.0  # 초
+        
+        # 일일 손익 캐시 (time.monotonic() 기준 조회 시각, 손익)
+        self._daily_pnl_cache: tuple = (0.0, None)
+        self._daily_pnl_cache_ttl = 10.0  # 초
+        
+        # 심볼별 마지막으로 설정한 레버리지 (같은 값이면 설정 호출 생략)
+        self._leverages: Dict[str, int] = {}
+        
+        # 거래/포지션 DB 쓰기 큐 (주문 체결 후 저장은 백그라운드 스레드가 일괄 처리)
+        self._write_queue: queue.Queue = queue.Queue(maxsize=1000)
+        self._write_batch_size = 64
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="trade-writer", daemon=True)
+        self._writer_thread.start()
+        
+    async def execute_trading_signal(self, signal: Dict, market_data: Dict) -> Dict:
         """거래 신호 실행"""
         try:
             # 거래 신호 검증
             if not self._validate_signal(signal):
                 return {"success": False, "error": "거래 신호 검증 실패"}
                 
+            symbol = market_data.get('symbol', 'BTCUSDT')
+            leverage = min(signal.get('leverage', 1), self.exchange_config['max_leverage'])
+            
+            # 일일 손익과 계좌 정보는 조회만 하므로 동시에 수행
+            daily_pnl, account_info = await asyncio.gather(self.aget_daily_pnl(), self.aget_account_info())
+                
             # 리스크 체크
-            if not self._check_risk_limits(signal):
+            if not self._check_risk_limits(signal, daily_pnl):
                 return {"success": False, "error": "리스크 한도 초과"}
                 
             # 계좌 잔고 확인
-            account_info = self._get_account_info()
             if not self._check_balance(signal, account_info):
                 return {"success": False, "error": "잔고 부족"}
                 
-            # 거래 실행
-            trade_result = self._execute_trade(signal, market_data)
+            # 레버리지 설정 (검증을 모두 통과한 주문만, 이미 같은 값이면 생략, HOLD는 주문하지 않으므로 생략)
+            if signal['decision'] != 'HOLD' and self._leverages.get(symbol) != leverage:
+                if not await run_in_executor(self._pool, self._set_leverage, symbol, leverage):
+                    return {"success": False, "error": "레버리지 설정 실패"}
+                    
+            # 거래 실행 (조회한 계좌 정보로 수량 계산)
+            trade_result = await run_in_executor(
+                self._pool, self._execute_trade, signal, market_data, account_info, leverage
+            )
             
             # 거래 기록 저장
             self._save_trade_record(signal, trade_result, market_data)
@@ -87,11 +152,10 @@ class TradingExecutor:
             self.logger.error(f"신호 검증 오류: {e}")
             return False
             
-    def _check_risk_limits(self, signal: Dict) -> bool:
+    def _check_risk_limits(self, signal: Dict, daily_pnl: float) -> bool:
         """리스크 한도 체크"""
         try:
             # 일일 손실 한도 체크
-            daily_pnl = self._get_daily_pnl()
             max_daily_loss = self.trading_limits['max_daily_loss']
             
             if daily_pnl < -max_daily_loss:
@@ -118,10 +182,30 @@ class TradingExecutor:
             self.logger.error(f"리스크 체크 오류: {e}")
             return False
             
+    def _warm_up_connection(self):
+        """선물 API 연결 예열 (세션의 keep-alive 연결을 재사용)"""
+        try:
+            self.client.futures_ping()
+        except Exception as e:
+            self.logger.warning(f"선물 API 연결 예열 실패: {e}")
+            
+    async def aget_account_info(self) -> Dict:
+        """계좌 정보 조회 (거래소 스레드 풀에서 실행)"""
+        return await run_in_executor(self._pool, self._get_account_info)
+        
+    async def aget_daily_pnl(self) -> float:
+        """일일 손익 조회 (거래소 스레드 풀에서 실행)"""
+        return await run_in_executor(self._pool, self._get_daily_pnl)
+        
     def _get_account_info(self) -> Dict:
-        """계좌 정보 조회"""
+        """계좌 정보 조회 (짧은 TTL 동안 캐시 재사용)"""
         try:
+            fetched_at, account_info = self._acct_cache
+            if account_info is not None and time.monotonic() - fetched_at < self._acct_cache_ttl:
+                return account_info
+                
             account_info = self.client.futures_account()
+            self._acct_cache = (time.monotonic(), account_info)
             return account_info
         except Exception as e:
             self.logger.error(f"계좌 정보 조회 오류: {e}")
@@ -151,7 +235,7 @@ class TradingExecutor:
             self.logger.error(f"잔고 확인 오류: {e}")
             return False
             
-    def _execute_trade(self, signal: Dict, market_data: Dict) -> Dict:
+    def _execute_trade(self, signal: Dict, market_data: Dict, account_info: Dict, leverage: int) -> Dict:
         """실제 거래 실행"""
         try:
             symbol = market_data.get('symbol', 'BTCUSDT')
@@ -162,7 +246,7 @@ class TradingExecutor:
                 return {"success": True, "action": "HOLD", "message": "거래 보류"}
                 
             # 거래 수량 계산
-            quantity = self._calculate_quantity(signal, market_data)
+            quantity = self._calculate_quantity(signal, market_data, account_info)
             
             # 주문 타입 결정
             order_type = 'MARKET'  # 시장가 주문
@@ -170,11 +254,7 @@ class TradingExecutor:
             # 거래 방향 결정
             side = 'BUY' if decision == 'BUY' else 'SELL'
             
-            # 레버리지 설정
-            leverage = min(signal.get('leverage', 1), self.exchange_config['max_leverage'])
-            self._set_leverage(symbol, leverage)
-            
-            # 주문 실행
+            # 주문 실행 (레버리지는 execute_trading_signal에서 설정 완료)
             order = self.client.futures_create_order(
                 symbol=symbol,
                 side=side,
@@ -182,6 +262,10 @@ class TradingExecutor:
                 quantity=quantity
             )
             
+            # 주문으로 잔고/손익이 바뀌었으므로 캐시 무효화
+            self._acct_cache = (0.0, None)
+            self._daily_pnl_cache = (0.0, None)
+            
             # 거래 로그
             log_trade(
                 symbol=symbol,
@@ -211,11 +295,10 @@ class TradingExecutor:
             self.logger.error(f"거래 실행 오류: {e}")
             return {"success": False, "error": str(e)}
             
-    def _calculate_quantity(self, signal: Dict, market_data: Dict) -> float:
+    def _calculate_quantity(self, signal: Dict, market_data: Dict, account_info: Dict) -> float:
         """거래 수량 계산"""
         try:
-            # 계좌 잔고 조회
-            account_info = self._get_account_info()
+            # 계좌 잔고 확인
             usdt_balance = 0
             
             for balance in account_info.get('assets', []):
@@ -239,44 +322,75 @@ class TradingExecutor:
             # 수량 계산
             quantity = available_amount / current_price
             
-            # 최소 주문 수량 체크
-            min_quantity = self.exchange_config['min_order_size']
-            if quantity < min_quantity:
-                quantity = min_quantity
+            # 심볼의 수량 단위를 모르면 설정의 최소 주문 수량과 소수점 3자리 사용
+            lot_size = self._get_lot_size(market_data.get('symbol', 'BTCUSDT'))
+            if lot_size is None:
+                return round(max(quantity, self.exchange_config['min_order_size']), 3)
                 
-            # 소수점 자릿수 조정 (Binance 요구사항)
-            quantity = round(quantity, 3)
-            
-            return quantity
+            # 수량 단위(stepSize)에 맞춰 내린 뒤 최소 수량(minQty, 최소 한 단위)으로 보정
+            step, min_quantity = lot_size
+            quantity = (Decimal(str(quantity)) / step).to_integral_value(rounding=ROUND_DOWN) * step
+            return float(max(quantity, step, min_quantity))
             
         except Exception as e:
             self.logger.error(f"수량 계산 오류: {e}")
             return 0.001  # 최소 수량
             
-    def _set_leverage(self, symbol: str, leverage: int):
-        """레버리지 설정"""
+    def _load_lot_sizes(self):
+        """심볼별 주문 수량 단위(stepSize)와 최소 수량(minQty) 조회"""
+        try:
+            exchange_info = self.client.futures_exchange_info()
+            self._lot_sizes = {
+                info['symbol']: (Decimal(f['stepSize']).normalize(), Decimal(f['minQty']).normalize())
+                for info in exchange_info.get('symbols', [])
+                for f in info.get('filters', [])
+                if f.get('filterType') == 'LOT_SIZE'
+            }
+        except Exception as e:
+            self.logger.error(f"거래소 정보 조회 오류: {e}")
+            
+    def _get_lot_size(self, symbol: str) -> Optional[tuple]:
+        """심볼별 (수량 단위, 최소 수량) 조회 (아직 조회 전이면 None)
+        
+        시작 시 조회가 실패했으면 주문 경로를 막지 않도록 백그라운드에서 다시 조회합니다.
+        """
+        if self._lot_sizes is None:
+            if self._lot_sizes_future.done():
+                self._lot_sizes_future = self._pool.submit(self._load_lot_sizes)
+            return None
+            
+        return self._lot_sizes.get(symbol)
+        
+    def _set_leverage(self, symbol: str, leverage: int) -> bool:
+        """레버리지 설정 (성공 여부 반환)"""
         try:
             self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
+            self._leverages[symbol] = leverage
             self.logger.info(f"{symbol} 레버리지 설정: {leverage}배")
+            return True
         except Exception as e:
+            self._leverages.pop(symbol, None)
             self.logger.error(f"레버리지 설정 오류: {e}")
+            return False
             
     def _get_daily_pnl(self) -> float:
         """일일 손익 조회"""
         try:
-            # 최근 24시간 거래 내역 조회
-            trades = self.client.futures_account_trades()
-            
-            daily_pnl = 0.0
-            current_time = time.time()
-            one_day_ago = current_time - (24 * 60 * 60)
-            
-            for trade in trades:
-                trade_time = trade['time'] / 1000  # 밀리초를 초로 변환
-                if trade_time > one_day_ago:
-                    realized_pnl = float(trade.get('realizedPnl', 0))
-                    daily_pnl += realized_pnl
-                    
+            fetched_at, daily_pnl = self._daily_pnl_cache
+            if daily_pnl is not None and time.monotonic() - fetched_at < self._daily_pnl_cache_ttl:
+                return daily_pnl
+                
+            # 최근 24시간 거래 내역만 거래소에서 필터링해 조회
+            one_day_ago = time.time() - (24 * 60 * 60)
+            trades = self.client.futures_account_trades(startTime=int(one_day_ago * 1000))
+            
+            # 실현 손익을 float64 배열로 변환 후 한 번에 합산
+            daily_pnl = float(np.fromiter(
+                (float(trade.get('realizedPnl', 0)) for trade in trades),
+                dtype=np.float64,
+                count=len(trades)
+            ).sum())
+            self._daily_pnl_cache = (time.monotonic(), daily_pnl)
             return daily_pnl
             
         except Exception as e:
@@ -284,71 +398,137 @@ class TradingExecutor:
             return 0.0
             
     def _save_trade_record(self, signal: Dict, trade_result: Dict, market_data: Dict):
-        """거래 기록 저장"""
-        try:
-            with get_db_session() as db:
-                trade = Trade(
+        """거래 기록을 DB 쓰기 큐에 추가"""
+        now = datetime.now()
+        success = trade_result.get('success')
+        self._enqueue_write('trade', {
+            'symbol': market_data.get('symbol', 'UNKNOWN'),
+            'side': trade_result.get('action', 'HOLD'),
+            'order_type': 'MARKET',
+            'quantity': trade_result.get('quantity', 0),
+            'price': market_data.get('close_price', 0),
+            'executed_price': trade_result.get('price', 0),
+            'status': OrderStatus.FILLED.value if success else OrderStatus.REJECTED.value,
+            'order_id': trade_result.get('order', {}).get('orderId'),
+            'created_at': now,
+            'executed_at': now if success else None
+        })
+        
+    def _update_position(self, signal: Dict, trade_result: Dict, market_data: Dict):
+        """포지션 업데이트를 DB 쓰기 큐에 추가"""
+        if not trade_result.get('success') or trade_result.get('action') == 'HOLD':
+            return
+            
+        self._enqueue_write('position', trade_result, market_data, datetime.now())
+        
+    def _write_position(self, db, trade_result: Dict, market_data: Dict, now: datetime):
+        """포지션 업데이트"""
+        # 기존 포지션 조회 (실현 손익 계산에 필요한 컬럼만 조회)
+        existing_position = db.execute(
+            select(
+                Position.id,
+                Position.entry_price,
+                Position.quantity,
+                Position.position_type
+            ).where(
+                Position.symbol == market_data.get('symbol'),
+                Position.is_open.is_(True)
+            ).limit(1)
+        ).first()
+        
+        if existing_position:
+            # 기존 포지션 업데이트 (객체 로드 없이 UPDATE 문으로 처리)
+            if trade_result.get('action') == 'SELL':
+                db.query(Position).filter(Position.id == existing_position.id).update({
+                    Position.is_open: False,
+                    Position.closed_at: now,
+                    Position.realized_pnl: self._calculate_realized_pnl(existing_position, trade_result)
+                }, synchronize_session=False)
+        else:
+            # 새 포지션 생성
+            if trade_result.get('action') == 'BUY':
+                db.add(Position(
                     symbol=market_data.get('symbol', 'UNKNOWN'),
-                    side=trade_result.get('action', 'HOLD'),
-                    order_type='MARKET',
+                    position_type='LONG',
                     quantity=trade_result.get('quantity', 0),
-                    price=market_data.get('close_price', 0),
-                    executed_price=trade_result.get('price', 0),
-                    status='FILLED' if trade_result.get('success') else 'REJECTED',
-                    order_id=trade_result.get('order', {}).get('orderId'),
-                    created_at=datetime.now()
-                )
+                    entry_price=trade_result.get('price', 0),
+                    current_price=trade_result.get('price', 0),
+                    leverage=trade_result.get('leverage', 1),
+                    margin_type='ISOLATED',
+                    is_open=True,
+                    created_at=now
+                ))
                 
-                if trade_result.get('success'):
-                    trade.executed_at = datetime.now()
-                    
-                db.add(trade)
-                db.commit()
-                
-        except Exception as e:
-            self.logger.error(f"거래 기록 저장 오류: {e}")
-            
-    def _update_position(self, signal: Dict, trade_result: Dict, market_data: Dict):
-        """포지션 업데이트"""
+    def _enqueue_write(self, kind: str, *args):
+        """DB 쓰기 작업('trade' 또는 'position')을 백그라운드 저장 스레드에 전달
+        
+        호출자는 이벤트 루프이므로 큐가 가득 차도 직접 저장하지 않고, 작업 내용을 오류 로그로 남긴 뒤 버립니다.
+        """
         try:
-            if not trade_result.get('success') or trade_result.get('action') == 'HOLD':
+            self._write_queue.put_nowait((kind, args))
+        except queue.Full:
+            self.logger.error(f"DB 쓰기 큐가 가득 차 {kind} 기록을 저장하지 못했습니다: {args[0]}")
+            
+    def close(self, timeout: float = 10.0):
+        """대기 중인 거래/포지션 기록을 모두 저장하고 저장 스레드 및 거래소 스레드 풀 종료"""
+        self._pool.shutdown(wait=False)
+        if not self._writer_thread.is_alive():
+            return
+        self._write_queue.put(None)
+        self._writer_thread.join(timeout)
+        if self._writer_thread.is_alive():
+            self.logger.error(f"거래/포지션 저장 스레드가 {timeout}초 안에 종료되지 않았습니다.")
+            
+    def _writer_loop(self):
+        """DB 쓰기 큐를 일괄 처리 (종료 신호 None을 받으면 앞선 작업까지 저장 후 종료)"""
+        while True:
+            job = self._write_queue.get()
+            if job is None:
                 return
                 
-            with get_db_session() as db:
-                # 기존 포지션 조회
-                existing_position = db.query(Position).filter(
-                    Position.symbol == market_data.get('symbol'),
-                    Position.is_open == True
-                ).first()
+            batch = [job]
+            closing = False
+            while len(batch) < self._write_batch_size:
+                try:
+                    job = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    closing = True
+                    break
+                batch.append(job)
                 
-                if existing_position:
-                    # 기존 포지션 업데이트
-                    if trade_result.get('action') == 'SELL':
-                        existing_position.is_open = False
-                        existing_position.closed_at = datetime.now()
-                        existing_position.realized_pnl = self._calculate_realized_pnl(existing_position, trade_result)
-                else:
-                    # 새 포지션 생성
-                    if trade_result.get('action') == 'BUY':
-                        new_position = Position(
-                            symbol=market_data.get('symbol', 'UNKNOWN'),
-                            position_type='LONG',
-                            quantity=trade_result.get('quantity', 0),
-                            entry_price=trade_result.get('price', 0),
-                            current_price=trade_result.get('price', 0),
-                            leverage=trade_result.get('leverage', 1),
-                            margin_type='ISOLATED',
-                            is_open=True,
-                            created_at=datetime.now()
-                        )
-                        db.add(new_position)
-                        
-                db.commit()
+            self._write_batch(batch)
+            if closing:
+                return
                 
-        except Exception as e:
-            self.logger.error(f"포지션 업데이트 오류: {e}")
-            
-    def _calculate_realized_pnl(self, position: Position, trade_result: Dict) -> float:
+    def _write_batch(self, batch: List[tuple]):
+        """DB 쓰기 작업 저장 (거래 기록과 포지션 변경을 별도 트랜잭션으로 분리)"""
+        # 거래 기록은 한 번의 executemany로 저장 (실패 시 행별로 재시도해 문제 행만 제외)
+        trade_rows = [args[0] for kind, args in batch if kind == 'trade']
+        if trade_rows:
+            try:
+                with get_db_session() as db:
+                    db.execute(TRADE_INSERT, trade_rows)
+            except Exception:
+                for row in trade_rows:
+                    try:
+                        with get_db_session() as db:
+                            db.execute(TRADE_INSERT, row)
+                    except Exception as e:
+                        self.logger.error(f"거래 기록 저장 오류: {e} - {row}")
+                        
+        # 포지션 변경은 작업별 트랜잭션 (하나가 실패해도 다른 변경은 유지, 순서대로 커밋)
+        for kind, args in batch:
+            if kind != 'position':
+                continue
+            try:
+                with get_db_session() as db:
+                    self._write_position(db, *args)
+            except Exception as e:
+                self.logger.error(f"포지션 저장 오류: {e} - {args[0]}")
+            
+    def _calculate_realized_pnl(self, position, trade_result: Dict) -> float:
         """실현 손익 계산"""
         try:
             entry_price = position.entry_price
@@ -368,37 +548,64 @@ class TradingExecutor:
         """현재 포지션 조회"""
         try:
             with get_db_session() as db:
-                positions = db.query(Position).filter(Position.is_open == True).all()
+                return [self._position_to_dict(*row) for row in db.execute(OPEN_POSITIONS_SELECT)]
                 
-                return [
-                    {
-                        'symbol': pos.symbol,
-                        'position_type': pos.position_type.value,
-                        'quantity': pos.quantity,
-                        'entry_price': pos.entry_price,
-                        'current_price': pos.current_price,
-                        'unrealized_pnl': pos.unrealized_pnl,
-                        'leverage': pos.leverage,
-                        'created_at': pos.created_at.isoformat()
-                    }
-                    for pos in positions
-                ]
+        except Exception as e:
+            self.logger.error(f"포지션 조회 오류: {e}")
+            return []
+            
+    async def aget_positions(self) -> List[Dict]:
+        """현재 포지션 조회 (비동기 세션, 이벤트 루프 비차단)"""
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(OPEN_POSITIONS_SELECT)
+                return [self._position_to_dict(*row) for row in result]
                 
         except Exception as e:
             self.logger.error(f"포지션 조회 오류: {e}")
             return []
             
-    def get_trading_summary(self) -> Dict:
+    @staticmethod
+    def _position_to_dict(symbol, position_type, quantity, entry_price, current_price,
+                          unrealized_pnl, leverage, created_at) -> Dict:
+        """포지션 조회 행을 응답 딕셔너리로 변환"""
+        return {
+            'symbol': symbol,
+            'position_type': position_type,
+            'quantity': quantity,
+            'entry_price': entry_price,
+            'current_price': current_price,
+            'unrealized_pnl': unrealized_pnl,
+            'leverage': leverage,
+            'created_at': created_at.isoformat()
+        }
+            
+    def get_open_positions_count(self) -> int:
+        """열린 포지션 수 조회"""
+        try:
+            with get_db_session() as db:
+                return db.execute(OPEN_POSITIONS_COUNT).scalar_one()
+                
+        except Exception as e:
+            self.logger.error(f"포지션 수 조회 오류: {e}")
+            return 0
+            
+    async def get_trading_summary(self) -> Dict:
         """거래 요약 정보 조회"""
         try:
-            account_info = self._get_account_info()
+            # 계좌/손익/포지션 조회는 서로 독립적이므로 동시에 수행
+            account_info, daily_pnl, positions_count = await asyncio.gather(
+                self.aget_account_info(),
+                self.aget_daily_pnl(),
+                run_in_thread(self.get_open_positions_count)
+            )
             
             return {
                 'total_balance': float(account_info.get('totalWalletBalance', 0)),
                 'available_balance': float(account_info.get('availableBalance', 0)),
                 'total_unrealized_pnl': float(account_info.get('totalUnrealizedProfit', 0)),
-                'daily_pnl': self._get_daily_pnl(),
-                'positions_count': len(self.get_positions()),
+                'daily_pnl': daily_pnl,
+                'positions_count': positions_count,
                 'last_update': datetime.now().isoformat()
             }
             
@@ -0,0 +1,48 @@
+"""
+orjson 기반 Binance WebSocket 스트림
+
+python-binance의 ReconnectingWebsocket은 모든 프레임을 표준 json.loads로 파싱합니다.
+결합 스트림에서는 파싱 비용이 가장 크므로 orjson으로 교체합니다.
+"""
+
+import gzip
+from typing import Optional
+
+import orjson
+from binance.streams import BinanceSocketManager, BinanceSocketType, ReconnectingWebsocket
+
+
+class OrjsonWebsocket(ReconnectingWebsocket):
+    """orjson으로 메시지를 파싱하는 ReconnectingWebsocket"""
+
+    def _handle_message(self, evt):
+        if self._is_binary:
+            try:
+                evt = gzip.decompress(evt)
+            except (ValueError, OSError):
+                return None
+        try:
+            return orjson.loads(evt)
+        except orjson.JSONDecodeError:
+            self._log.debug(f'error parsing evt json:{evt}')
+            return None
+
+
+class FastBinanceSocketManager(BinanceSocketManager):
+    """스트림 소켓을 OrjsonWebsocket으로 생성하는 소켓 매니저"""
+
+    def _get_socket(
+        self, path: str, stream_url: Optional[str] = None, prefix: str = 'ws/', is_binary: bool = False,
+        socket_type: BinanceSocketType = BinanceSocketType.SPOT
+    ) -> ReconnectingWebsocket:
+        conn_id = f'{socket_type}_{path}'
+        if conn_id not in self._conns:
+            self._conns[conn_id] = OrjsonWebsocket(
+                path=path,
+                url=self._get_stream_url(stream_url),
+                prefix=prefix,
+                exit_coro=lambda p: self._exit_socket(f'{socket_type}_{p}'),
+                is_binary=is_binary,
+            )
+
+        return self._conns[conn_id]
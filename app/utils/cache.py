@@ -0,0 +1,56 @@
+"""
+API 응답 캐시 설정 (Redis)
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from redis import asyncio as aioredis
+from starlette.requests import Request
+from starlette.responses import Response
+from loguru import logger
+
+from app.config import settings
+
+# 캐시 키 접두사
+CACHE_PREFIX = "api"
+
+
+class ORJSONCoder(Coder):
+    """orjson 기반 캐시 값 인코더"""
+    
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+def request_key_builder(
+    func: Callable,
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None
+) -> str:
+    """요청 경로 + 쿼리 문자열 기반 캐시 키 생성"""
+    return f"{namespace}:{request.url.path}?{request.url.query}"
+
+
+def init_cache():
+    """Redis 응답 캐시 초기화"""
+    redis = aioredis.from_url(settings.redis_url)
+    FastAPICache.init(
+        RedisBackend(redis),
+        prefix=CACHE_PREFIX,
+        coder=ORJSONCoder,
+        key_builder=request_key_builder
+    )
+    logger.info("응답 캐시 초기화 완료")
@@ -2,26 +2,89 @@
 데이터베이스 연결 및 세션 관리
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from loguru import logger
 
 from app.config import settings
 
-# 데이터베이스 엔진 생성
+
+def _pool_options(pool_size: int, max_overflow: int) -> dict:
+    """커넥션 풀 설정 (PgBouncer 사용 시 풀링을 PgBouncer에 위임)"""
+    if settings.db_use_pgbouncer:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": QueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True
+    }
+
+
+def _probe_pool_options() -> dict:
+    """헬스 체크용 커넥션 풀 설정 (커넥션 1개 + 여유 1개)"""
+    if settings.db_use_pgbouncer:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": QueuePool,
+        "pool_size": 1,
+        "max_overflow": 1,
+        "pool_pre_ping": True
+    }
+
+
+# 헬스 체크/정보 조회 SQL (모듈 로드 시 한 번만 생성)
+_PING_STMT = text("SELECT 1")
+_VERSION_STMT = text("SELECT version()")
+_TABLES_STMT = text(
+    "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'"
+)
+
+# 컴파일된 SQL 캐시 크기 (기본 500)
+_QUERY_CACHE_SIZE = 1200
+
+# 웹 워커 수 (비동기 엔진 풀은 워커 합계가 설정값을 넘지 않도록 분할)
+_WEB_WORKERS = max(1, settings.web_workers)
+
+# 데이터베이스 엔진 생성 (백그라운드 저장기 및 동기 조회 전용, 작은 풀)
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.debug
+    echo=settings.debug,
+    query_cache_size=_QUERY_CACHE_SIZE,
+    **_pool_options(settings.db_sync_pool_size, settings.db_sync_max_overflow)
+)
+
+# 헬스 체크 전용 엔진 (작은 풀로 거래 트래픽과 커넥션 경합 분리)
+probe_engine = create_engine(
+    settings.database_url,
+    echo=settings.debug,
+    **_probe_pool_options()
 )
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 데이터베이스 엔진 생성 (API 조회용, asyncpg 드라이버)
+async_engine = create_async_engine(
+    settings.database_url.replace("postgresql://", "postgresql+asyncpg://", 1),
+    echo=settings.debug,
+    query_cache_size=_QUERY_CACHE_SIZE,
+    **_pool_options(
+        max(1, settings.db_pool_size // _WEB_WORKERS),
+        settings.db_max_overflow // _WEB_WORKERS
+    )
+)
+
+# 비동기 세션 팩토리 생성
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # 베이스 클래스
 Base = declarative_base()
 
@@ -39,6 +102,17 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 생성"""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"비동기 데이터베이스 세션 오류: {e}")
+            await db.rollback()
+            raise
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """컨텍스트 매니저를 사용한 데이터베이스 세션"""
@@ -60,9 +134,15 @@ def init_db():
         # 모든 테이블 생성
         from app.models.trading_models import Base as TradingBase
         from app.models.notification_models import Base as NotificationBase
+        from app.utils.schema_migrations import migrate_schema
         
-        TradingBase.metadata.create_all(bind=engine)
-        NotificationBase.metadata.create_all(bind=engine)
+        # 두 메타데이터를 하나의 연결/트랜잭션에서 생성 (연결 체크아웃 및 커밋 1회)
+        with engine.begin() as connection:
+            TradingBase.metadata.create_all(bind=connection)
+            NotificationBase.metadata.create_all(bind=connection)
+            
+            # 기존 테이블에 컬럼 타입 변경 적용
+            migrate_schema(connection)
         
         logger.info("데이터베이스 테이블이 성공적으로 생성되었습니다.")
     except Exception as e:
@@ -73,8 +153,8 @@ def init_db():
 def check_db_connection() -> bool:
     """데이터베이스 연결 확인"""
     try:
-        with engine.connect() as connection:
-            connection.execute("SELECT 1")
+        with probe_engine.connect() as connection:
+            connection.execute(_PING_STMT)
         logger.info("데이터베이스 연결이 정상입니다.")
         return True
     except Exception as e:
@@ -85,18 +165,12 @@ def check_db_connection() -> bool:
 def get_db_info():
     """데이터베이스 정보 조회"""
     try:
-        with engine.connect() as connection:
+        with probe_engine.connect() as connection:
             # PostgreSQL 버전 확인
-            result = connection.execute("SELECT version()")
-            version = result.fetchone()[0]
+            version = connection.execute(_VERSION_STMT).scalar_one()
             
             # 테이블 목록 확인
-            result = connection.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public'
-            """)
-            tables = [row[0] for row in result.fetchall()]
+            tables = connection.execute(_TABLES_STMT).scalars().all()
             
             return {
                 "version": version,
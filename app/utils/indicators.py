@@ -0,0 +1,111 @@
+"""
+스트리밍 기술적 지표 계산
+
+새 종가가 들어올 때마다 O(1)로 지표를 갱신합니다.
+계산 방식은 ta 라이브러리(EMA: adjust=False, RSI: Wilder 평활, 볼린저 밴드: 모표준편차)와 동일합니다.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+
+# 지표 계산에 필요한 최소 데이터 수
+MIN_PERIODS = 20
+
+
+@dataclass
+class IndicatorState:
+    """심볼별 기술적 지표 스트리밍 상태"""
+    count: int = 0
+    prev_close: Optional[float] = None
+
+    # EMA / MACD
+    ema12: Optional[float] = None
+    ema26: Optional[float] = None
+    macd_signal: Optional[float] = None
+
+    # RSI (Wilder 평활)
+    rsi_avg_gain: float = 0.0
+    rsi_avg_loss: float = 0.0
+
+    # SMA20 / 볼린저 밴드 (부동소수점 오차를 줄이기 위해 첫 종가 기준 편차로 누적)
+    shift: float = 0.0
+    window20: Deque[float] = field(default_factory=lambda: deque(maxlen=20))
+    sum20: float = 0.0
+    sumsq20: float = 0.0
+
+    # SMA50
+    window50: Deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    sum50: float = 0.0
+
+    def update(self, close: float) -> Dict[str, Optional[float]]:
+        """새 종가로 상태를 갱신하고 현재 지표 값 반환"""
+        self.count += 1
+        if self.count == 1:
+            self.shift = close
+
+        # EMA 12/26
+        if self.ema12 is None:
+            self.ema12 = close
+            self.ema26 = close
+        else:
+            self.ema12 += (close - self.ema12) * (2 / 13)
+            self.ema26 += (close - self.ema26) * (2 / 27)
+
+        # MACD (EMA26이 유효해진 시점부터 시그널 계산)
+        macd = self.ema12 - self.ema26
+        if self.count >= 26:
+            if self.macd_signal is None:
+                self.macd_signal = macd
+            else:
+                self.macd_signal += (macd - self.macd_signal) * (2 / 10)
+
+        # RSI
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            self.rsi_avg_gain += (max(change, 0.0) - self.rsi_avg_gain) / 14
+            self.rsi_avg_loss += (max(-change, 0.0) - self.rsi_avg_loss) / 14
+        self.prev_close = close
+
+        # SMA20 / 볼린저 밴드
+        x = close - self.shift
+        if len(self.window20) == self.window20.maxlen:
+            old = self.window20[0]
+            self.sum20 -= old
+            self.sumsq20 -= old * old
+        self.window20.append(x)
+        self.sum20 += x
+        self.sumsq20 += x * x
+
+        # SMA50
+        if len(self.window50) == self.window50.maxlen:
+            self.sum50 -= self.window50[0]
+        self.window50.append(close)
+        self.sum50 += close
+
+        if self.count < MIN_PERIODS:
+            return {}
+
+        mean20 = self.sum20 / 20
+        std20 = math.sqrt(max(self.sumsq20 / 20 - mean20 * mean20, 0.0))
+        sma20 = mean20 + self.shift
+
+        if self.rsi_avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - 100 / (1 + self.rsi_avg_gain / self.rsi_avg_loss)
+
+        return {
+            'rsi': rsi,
+            'macd': macd if self.count >= 26 else None,
+            'macd_signal': self.macd_signal if self.count >= 34 else None,
+            'macd_histogram': macd - self.macd_signal if self.count >= 34 else None,
+            'bollinger_upper': sma20 + 2 * std20,
+            'bollinger_middle': sma20,
+            'bollinger_lower': sma20 - 2 * std20,
+            'sma_20': sma20,
+            'sma_50': self.sum50 / 50 if self.count >= 50 else None,
+            'ema_12': self.ema12 if self.count >= 12 else None,
+            'ema_26': self.ema26 if self.count >= 26 else None
+        }
@@ -0,0 +1,70 @@
+"""
+LLM 응답 텍스트에서 첫 번째 JSON 객체 추출
+"""
+
+import re
+from typing import Optional
+
+# 괄호 깊이 추적에 영향을 주는 문자 (나머지 문자는 정규식 엔진이 건너뜀)
+STRUCTURAL_CHARS = re.compile(r'[{}"\\]')
+
+
+class JsonObjectScanner:
+    """첫 번째 최상위 JSON 객체가 닫히는 위치를 찾는 괄호 깊이 상태 기계
+
+    문자열 내부의 중괄호와 백슬래시 이스케이프를 구분하며,
+    스트리밍 응답처럼 텍스트가 나뉘어 들어와도 상태를 이어서 추적합니다.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self._skip = -1  # 다음 조각에서 이스케이프된 문자 위치
+
+    def feed(self, text: str, pos: int = 0) -> int:
+        """텍스트 조각을 이어서 검사하고 객체가 닫히면 조각 내 끝 위치(닫는 괄호 다음), 아니면 -1 반환"""
+        skip = self._skip
+        self._skip = -1
+
+        # 객체 시작 전에는 여는 괄호까지 건너뜀
+        if self.depth == 0:
+            pos = text.find('{', pos)
+            if pos == -1:
+                return -1
+
+        for match in STRUCTURAL_CHARS.finditer(text, pos):
+            i = match.start()
+            if i == skip:
+                continue
+
+            ch = match.group()
+            if self.in_string:
+                if ch == '\\':
+                    skip = i + 1
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '{':
+                self.depth += 1
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+
+        # 조각 끝의 백슬래시는 다음 조각 첫 문자를 이스케이프
+        if skip == len(text):
+            self._skip = 0
+        return -1
+
+
+def extract_first_object(text: str) -> Optional[str]:
+    """텍스트에서 첫 번째로 균형이 맞는 {...} 구간을 한 번의 순회로 추출 (없으면 None)"""
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    end = JsonObjectScanner().feed(text, start)
+    if end == -1:
+        return None
+    return text[start:end]
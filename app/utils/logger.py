@@ -2,25 +2,56 @@
 로깅 설정 및 관리
 """
 
+import gzip
 import os
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
+
+import orjson
 from loguru import logger
 from app.config import settings
 
-# 로그 디렉토리 생성
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
+# 로그 파일 경로 (상위 디렉토리는 loguru 파일 싱크가 생성 시 직접 만듦)
+LOG_DIR = Path("logs")
+ERROR_LOG_PATH = LOG_DIR / "error.log"
+TRADING_LOG_PATH = LOG_DIR / "trading.log"
+LLM_LOG_PATH = LOG_DIR / "llm.log"
 
 # 기본 로거 제거
 logger.remove()
 
-# 콘솔 로거 추가
+
+def _compress_log(path: str) -> None:
+    """로테이션된 로그 파일을 gzip(압축 레벨 1)으로 압축
+
+    enqueue=True 싱크에서는 로테이션이 백그라운드 워커에서 실행되므로 호출 스레드를 막지 않습니다.
+    """
+    with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
+
+
+def _is_trading_record(record) -> bool:
+    """거래 채널 레코드 여부 (get_logger/bind로 지정된 channel 기준)"""
+    return record["extra"].get("channel") == "trading"
+
+
+def _is_llm_record(record) -> bool:
+    """LLM 채널 레코드 여부 (get_logger/bind로 지정된 channel 기준)"""
+    return record["extra"].get("channel") == "llm"
+
+
+# 콘솔 로거 추가 (컬러 출력은 디버그 모드에서만, 포맷팅/출력은 백그라운드 스레드에서 처리)
 logger.add(
     sys.stdout,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     level=settings.log_level,
-    colorize=True
+    colorize=settings.debug,
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 
 # 파일 로거 추가
@@ -30,62 +61,82 @@ logger.add(
     level=settings.log_level,
     rotation="1 day",
     retention="30 days",
-    compression="zip"
+    compression=_compress_log,
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 
 # 에러 로그 파일 추가
 logger.add(
-    "logs/error.log",
+    ERROR_LOG_PATH,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     level="ERROR",
     rotation="1 day",
     retention="90 days",
-    compression="zip"
+    compression=_compress_log,
+    enqueue=True
 )
 
 # 거래 로그 파일 추가
 logger.add(
-    "logs/trading.log",
+    TRADING_LOG_PATH,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     level="INFO",
-    filter=lambda record: "trading" in record["name"].lower(),
+    filter=_is_trading_record,
     rotation="1 day",
     retention="30 days",
-    compression="zip"
+    compression=_compress_log,
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 
 # LLM 로그 파일 추가
 logger.add(
-    "logs/llm.log",
+    LLM_LOG_PATH,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     level="INFO",
-    filter=lambda record: "llm" in record["name"].lower(),
+    filter=_is_llm_record,
     rotation="1 day",
     retention="30 days",
-    compression="zip"
+    compression=_compress_log,
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 
 
+@lru_cache(maxsize=32)
 def get_logger(name: str):
-    """특정 이름의 로거 반환"""
-    return logger.bind(name=name)
+    """특정 이름의 로거 반환 (이름을 로그 라우팅 채널로도 사용, 이름별로 캐시)"""
+    return logger.bind(name=name, channel=name)
+
+
+def _to_json(data) -> str:
+    """추가 정보를 JSON 문자열로 직렬화 (직렬화 불가 값은 str로 변환)"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def log_trade(symbol: str, action: str, quantity: float, price: float, **kwargs):
     """거래 로그 기록"""
-    trade_logger = get_logger("trading")
-    trade_logger.info(
-        f"거래 실행 - 심볼: {symbol}, 액션: {action}, "
-        f"수량: {quantity}, 가격: {price}, 추가정보: {kwargs}"
+    trade_logger = get_logger("trading").bind(
+        symbol=symbol, action=action, quantity=quantity, price=price, **kwargs
+    )
+    trade_logger.opt(lazy=True).info(
+        "거래 실행 - 심볼: {}, 액션: {}, 수량: {}, 가격: {}, 추가정보: {}",
+        lambda: symbol, lambda: action, lambda: quantity, lambda: price, lambda: _to_json(kwargs)
     )
 
 
 def log_llm_request(provider: str, model: str, input_data: str, output_data: str, **kwargs):
     """LLM 요청 로그 기록"""
     llm_logger = get_logger("llm")
-    llm_logger.info(
-        f"LLM 요청 - 제공자: {provider}, 모델: {model}, "
-        f"입력: {input_data[:100]}..., 출력: {output_data[:100]}..., 추가정보: {kwargs}"
+    # 긴 입출력 슬라이싱은 레코드가 실제로 기록될 때만 수행
+    llm_logger.opt(lazy=True).info(
+        "LLM 요청 - 제공자: {}, 모델: {}, 입력: {}..., 출력: {}..., 추가정보: {}",
+        lambda: provider, lambda: model,
+        lambda: input_data[:100], lambda: output_data[:100], lambda: _to_json(kwargs)
     )
 
 
@@ -98,16 +149,22 @@ def log_error(error: Exception, context: str = ""):
 def log_system_status(status: str, details: dict = None):
     """시스템 상태 로그 기록"""
     system_logger = get_logger("system")
-    system_logger.info(f"시스템 상태: {status}, 상세정보: {details}")
+    system_logger.opt(lazy=True).info(
+        "시스템 상태: {}, 상세정보: {}", lambda: status, lambda: _to_json(details)
+    )
 
 
 def log_performance(operation: str, duration: float, **kwargs):
     """성능 로그 기록"""
-    perf_logger = get_logger("performance")
-    perf_logger.info(f"성능 측정 - 작업: {operation}, 소요시간: {duration:.3f}초, 추가정보: {kwargs}")
+    perf_logger = get_logger("performance").bind(operation=operation, duration=duration, **kwargs)
+    perf_logger.opt(lazy=True).info(
+        "성능 측정 - 작업: {}, 소요시간: {:.3f}초, 추가정보: {}",
+        lambda: operation, lambda: duration, lambda: _to_json(kwargs)
+    )
 
 
-# 로거 초기화 완료 메시지
-logger.info("로깅 시스템이 초기화되었습니다.")
-logger.info(f"로그 레벨: {settings.log_level}")
-logger.info(f"로그 파일: {settings.log_file}") 
\ No newline at end of file
+def log_logging_config():
+    """로거 초기화 완료 메시지 기록 (애플리케이션 시작 시 한 번만 호출)"""
+    logger.info("로깅 시스템이 초기화되었습니다.")
+    logger.info("로그 레벨: {}", settings.log_level)
+    logger.info("로그 파일: {}", settings.log_file) 
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+토큰 버킷 기반 전송률 제한
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 전송률 제한기
+
+    초당 rate개의 토큰이 최대 capacity개까지 채워지며,
+    요청마다 토큰을 소모해 평균 전송률과 순간 버스트를 함께 제한합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def request_tokens(self, tokens: float = 1) -> bool:
+        """토큰을 소모할 수 있으면 소모 후 True, 부족하면 False 반환"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+            if self._tokens < tokens:
+                return False
+
+            self._tokens -= tokens
+            return True
@@ -0,0 +1,73 @@
+"""
+기존 데이터베이스 스키마 변경 적용
+
+create_all은 이미 존재하는 테이블을 변경하지 않으므로, 모델의 컬럼 타입 변경을
+기존 PostgreSQL 테이블에 맞춰 적용합니다. 각 단계는 현재 컬럼 타입을 확인한 뒤
+필요할 때만 실행되므로 매 시작 시 반복 호출해도 안전합니다.
+"""
+
+from typing import Dict, Tuple
+
+from loguru import logger
+from sqlalchemy import Enum, LargeBinary, inspect, text
+from sqlalchemy.engine import Connection
+
+# Enum → VARCHAR(20) 변환 대상 (테이블, 컬럼)
+ENUM_TO_VARCHAR_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("trading_signals", "signal_type"),
+    ("trades", "order_type"),
+    ("trades", "status"),
+    ("positions", "position_type"),
+    ("notifications", "notification_type"),
+    ("notifications", "channel"),
+    ("notifications", "status"),
+    ("notification_history", "status"),
+)
+
+# TEXT → BYTEA 변환 대상 (LLM 분석 결과 압축 저장, 기존 행은 UTF-8 원문 바이트로 변환)
+TEXT_TO_BYTEA_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("llm_analyses", "input_data"),
+    ("llm_analyses", "output_data"),
+)
+
+# 추가 컬럼 (테이블, 컬럼, 컬럼 정의)
+ADDED_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("llm_analyses", "compression_dict", "INTEGER"),
+)
+
+
+def migrate_schema(connection: Connection):
+    """기존 테이블에 모델 변경 사항 적용 (PostgreSQL 전용)"""
+    if connection.dialect.name != "postgresql":
+        return
+
+    inspector = inspect(connection)
+    column_types: Dict[str, Dict[str, object]] = {}
+
+    def column_type(table: str, column: str):
+        if table not in column_types:
+            column_types[table] = {col["name"]: col["type"] for col in inspector.get_columns(table)}
+        return column_types[table].get(column)
+
+    # Enum 컬럼을 문자열 컬럼으로 변환 (저장 값은 Enum 이름 = 값이므로 그대로 유지)
+    for table, column in ENUM_TO_VARCHAR_COLUMNS:
+        if isinstance(column_type(table, column), Enum):
+            connection.execute(text(
+                f'ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) USING {column}::text'
+            ))
+            logger.info(f"스키마 변경: {table}.{column} Enum → VARCHAR(20)")
+
+    # 텍스트 컬럼을 바이너리 컬럼으로 변환
+    for table, column in TEXT_TO_BYTEA_COLUMNS:
+        current_type = column_type(table, column)
+        if current_type is not None and not isinstance(current_type, LargeBinary):
+            connection.execute(text(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BYTEA USING convert_to({column}, 'UTF8')"
+            ))
+            logger.info(f"스키마 변경: {table}.{column} TEXT → BYTEA")
+
+    # 누락된 컬럼 추가 (기존 행은 NULL)
+    for table, column, definition in ADDED_COLUMNS:
+        if column_type(table, column) is None:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+            logger.info(f"스키마 변경: {table}.{column} 컬럼 추가")
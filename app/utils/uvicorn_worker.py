@@ -0,0 +1,16 @@
+"""
+uvloop/httptools 기반 gunicorn 워커
+"""
+
+from uvicorn.workers import UvicornWorker
+
+
+class FastUvicornWorker(UvicornWorker):
+    """uvloop 이벤트 루프와 httptools 파서를 사용하는 Uvicorn 워커"""
+    
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "limit_concurrency": 1000,
+        "timeout_keep_alive": 30
+    }
@@ -0,0 +1,25 @@
+"""
+프로덕션 웹 서버 설정 (gunicorn + UvicornWorker)
+
+실행: gunicorn main:app -c gunicorn.conf.py
+"""
+
+import os
+
+# 바인딩 주소
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+
+# 워커 설정 (기본값: 1, AI 거래 태스크가 웹 프로세스 안에서 실행되므로 늘릴 때는 거래 전용 프로세스 분리 권장)
+workers = int(os.getenv("WEB_WORKERS", 1))
+worker_class = "app.utils.uvicorn_worker.FastUvicornWorker"
+
+# 연결 설정
+worker_connections = 1000
+keepalive = 30
+timeout = 60
+graceful_timeout = 30
+
+# 로깅 설정
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+accesslog = "-"
+errorlog = "-"
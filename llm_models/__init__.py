@@ -2,14 +2,17 @@
 LLM 모델 패키지
 """
 
-from .gpt4_engine import GPT4Engine
-from .claude_engine import ClaudeEngine
-from .perplexity_engine import PerplexityEngine
+from .gpt4_engine import GPT4Engine, get_gpt4_engine
+from .claude_engine import ClaudeEngine, get_claude_engine
+from .perplexity_engine import PerplexityEngine, get_perplexity_engine
 from .ensemble_decision import EnsembleDecision
 
 __all__ = [
     'GPT4Engine',
     'ClaudeEngine', 
     'PerplexityEngine',
-    'EnsembleDecision'
+    'EnsembleDecision',
+    'get_gpt4_engine',
+    'get_claude_engine',
+    'get_perplexity_engine'
 ] 
\ No newline at end of file
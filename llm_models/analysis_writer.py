@@ -0,0 +1,161 @@
+"""
+LLM 분석 결과 백그라운드 일괄 저장
+"""
+
+import queue
+import threading
+import time
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import insert, select
+
+from app.models.trading_models import LLMAnalysis
+from app.utils.database import AsyncSessionLocal, get_db_session
+from llm_models.compression_dictionaries import COMPRESSION_DICTIONARIES, CURRENT_COMPRESSION_DICT_ID
+
+# 분석 결과 일괄 저장 구문
+LLM_ANALYSIS_INSERT = insert(LLMAnalysis.__table__)
+
+# 입력/출력 텍스트 압축 수준
+COMPRESSION_LEVEL = 6
+
+
+# 분석 결과 조회 구문 (최신순)
+LLM_ANALYSIS_SELECT = select(
+    LLMAnalysis.id,
+    LLMAnalysis.symbol,
+    LLMAnalysis.timestamp,
+    LLMAnalysis.llm_provider,
+    LLMAnalysis.analysis_type,
+    LLMAnalysis.input_data,
+    LLMAnalysis.output_data,
+    LLMAnalysis.compression_dict,
+    LLMAnalysis.processing_time
+).order_by(LLMAnalysis.timestamp.desc())
+
+
+def compress_analysis_text(text: Optional[str], dict_id: int = CURRENT_COMPRESSION_DICT_ID) -> Optional[bytes]:
+    """분석 텍스트를 dict_id 사전으로 zlib 압축"""
+    if text is None:
+        return None
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=COMPRESSION_DICTIONARIES[dict_id])
+    return compressor.compress(text.encode()) + compressor.flush()
+
+
+def decompress_analysis_text(data: Optional[bytes], dict_id: Optional[int]) -> Optional[str]:
+    """저장된 분석 텍스트 복원 (dict_id가 없으면 압축 도입 전 UTF-8 원문)"""
+    if data is None:
+        return None
+    if dict_id is None:
+        return data.decode()
+    decompressor = zlib.decompressobj(zdict=COMPRESSION_DICTIONARIES[dict_id])
+    return (decompressor.decompress(data) + decompressor.flush()).decode()
+
+
+async def aget_llm_analyses(limit: int = 100) -> List[Dict]:
+    """최근 LLM 분석 결과 조회 (입력/출력 압축 해제)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(LLM_ANALYSIS_SELECT.limit(limit))
+        return [
+            {
+                'id': row.id,
+                'symbol': row.symbol,
+                'timestamp': row.timestamp,
+                'llm_provider': row.llm_provider,
+                'analysis_type': row.analysis_type,
+                'input_data': decompress_analysis_text(row.input_data, row.compression_dict),
+                'output_data': decompress_analysis_text(row.output_data, row.compression_dict),
+                'processing_time': row.processing_time
+            }
+            for row in result
+        ]
+
+
+class AnalysisWriter:
+    """LLM 분석 결과를 큐에 모아 백그라운드 스레드에서 일괄 저장"""
+
+    def __init__(self, batch_size: int = 256, flush_interval: float = 1.0, maxsize: int = 10000):
+        self.logger = logger.bind(name="analysis_writer", channel="llm")
+
+        # 저장 큐 (batch_size건이 모이거나 flush_interval초가 지나면 한 트랜잭션으로 저장)
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._thread = threading.Thread(target=self._writer_loop, name="llm-analysis-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, llm_provider: str, analysis_type: str, symbol: str,
+               input_data: Optional[str], output_data: str, processing_time: Optional[float]):
+        """분석 결과 저장 요청 (호출 스레드를 막지 않음, 큐가 가득 차면 버림, 압축은 저장 스레드에서 수행)"""
+        row = {
+            'symbol': symbol,
+            'timestamp': datetime.utcnow(),
+            'llm_provider': llm_provider,
+            'analysis_type': analysis_type,
+            'input_data': input_data,
+            'output_data': output_data,
+            'confidence_score': None,
+            'processing_time': processing_time,
+            'cost': 0.0,  # 비용 계산 로직 추가 필요
+            'compression_dict': CURRENT_COMPRESSION_DICT_ID
+        }
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            # 호출자는 이벤트 루프이므로 압축/DB 저장을 직접 수행하지 않음
+            self.logger.warning(f"분석 결과 저장 큐가 가득 차 {llm_provider} {symbol} 분석 결과를 버립니다.")
+
+    def close(self, timeout: float = 5.0):
+        """남은 분석 결과를 저장하고 저장 스레드 종료"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _writer_loop(self):
+        """저장 큐를 일괄 처리"""
+        while True:
+            row = self._queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            deadline = time.monotonic() + self._flush_interval
+            closing = False
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is None:
+                    closing = True
+                    break
+                batch.append(row)
+
+            self._write_batch(batch)
+            if closing:
+                return
+
+    def _write_batch(self, batch: List[Dict]):
+        """분석 결과의 입력/출력을 압축해 한 번의 executemany로 저장"""
+        try:
+            for row in batch:
+                row['input_data'] = compress_analysis_text(row['input_data'], row['compression_dict'])
+                row['output_data'] = compress_analysis_text(row['output_data'], row['compression_dict'])
+                
+            with get_db_session() as db:
+                db.execute(LLM_ANALYSIS_INSERT, batch)
+
+        except Exception as e:
+            self.logger.error(f"분석 결과 저장 오류 ({len(batch)}건): {e}")
+
+
+@lru_cache(maxsize=1)
+def get_analysis_writer() -> AnalysisWriter:
+    """분석 결과 저장기 인스턴스 조회 (프로세스당 1개)"""
+    return AnalysisWriter()
@@ -2,22 +2,40 @@
 Claude 3.5 Sonnet 기반 투자 분석 엔진
 """
 
-import json
 import time
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from anthropic import Anthropic
+import orjson
+from anthropic import AsyncAnthropic
 from loguru import logger
 
 from app.config import settings, LLM_CONFIG
+from app.utils.json_scanner import extract_first_object
+from llm_models.rate_limiter import APIRateLimiter, estimate_tokens
 
 
 class ClaudeEngine:
     """Claude 3.5 Sonnet 기반 투자 분석 엔진"""
     
     def __init__(self):
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        # 재시도는 공용 호출 제한기가 담당 (429 발생 시 다른 호출도 함께 대기)
+        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key, max_retries=0)
         self.config = LLM_CONFIG['claude']
-        self.logger = logger.bind(name="claude_engine")
+        
+        # 요청마다 쓰는 설정값 (호출 경로의 dict 조회 생략)
+        self._model = self.config['model']
+        self._max_tokens = self.config['max_tokens']
+        self._temperature = self.config['temperature']
+        
+        # 분당 요청/토큰 한도 및 재시도
+        self.rate_limiter = APIRateLimiter(
+            "claude",
+            requests_per_minute=self.config['requests_per_minute'],
+            tokens_per_minute=self.config['tokens_per_minute'],
+            max_retries=self.config['max_retries']
+        )
+        
+        self.logger = logger.bind(name="claude_engine", channel="llm")
         
         # 투자 특화 프롬프트
         self.investment_prompt = """
@@ -57,7 +75,11 @@ class ClaudeEngine:
 }}
 """
         
-    def analyze_market(self, market_data: Dict) -> Dict:
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료"""
+        await self.client.close()
+        
+    async def analyze_market(self, market_data: Dict) -> Dict:
         """시장 분석 수행"""
         try:
             start_time = time.time()
@@ -65,17 +87,20 @@ class ClaudeEngine:
             # 프롬프트 생성
             prompt = self._create_analysis_prompt(market_data)
             
-            # Claude API 호출
-            response = self.client.messages.create(
-                model=self.config['model'],
-                max_tokens=self.config['max_tokens'],
-                temperature=self.config['temperature'],
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            # Claude API 호출 (호출 제한기 경유)
+            response = await self.rate_limiter.call(
+                lambda: self.client.messages.create(
+                    model=self._model,
+                    max_tokens=self._max_tokens,
+                    temperature=self._temperature,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                ),
+                estimate_tokens(prompt, self._max_tokens)
             )
             
             # 응답 파싱
@@ -238,13 +263,11 @@ class ClaudeEngine:
     def _parse_response(self, response_text: str) -> Dict:
         """Claude 응답 파싱"""
         try:
-            # JSON 추출
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
+            # JSON 추출 (첫 번째로 균형이 맞는 객체)
+            json_str = extract_first_object(response_text)
             
-            if start_idx != -1 and end_idx != 0:
-                json_str = response_text[start_idx:end_idx]
-                result = json.loads(json_str)
+            if json_str is not None:
+                result = orjson.loads(json_str)
                 
                 # 필수 필드 검증
                 required_fields = ['decision', 'confidence', 'position_size', 'risk_level']
@@ -257,7 +280,7 @@ class ClaudeEngine:
                 self.logger.warning("JSON 응답을 찾을 수 없습니다.")
                 return self._get_default_response()
                 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"JSON 파싱 오류: {e}")
             return self._get_default_response()
         except Exception as e:
@@ -275,7 +298,8 @@ class ClaudeEngine:
             "reasoning": "분석 실패로 인한 보수적 결정",
             "stop_loss": None,
             "take_profit": None,
-            "timeframe": "1H"
+            "timeframe": "1H",
+            "fallback": True  # API 오류/파싱 실패로 생성한 기본 응답 (캐시하지 않음)
         }
         
     def _get_default_value(self, field: str):
@@ -294,28 +318,10 @@ class ClaudeEngine:
         return defaults.get(field, None)
         
     def _save_analysis_result(self, symbol: str, input_data: str, output_data: str, processing_time: float):
-        """분석 결과 저장"""
-        try:
-            from app.utils.database import get_db_session
-            from app.models.trading_models import LLMAnalysis
-            
-            with get_db_session() as db:
-                analysis = LLMAnalysis(
-                    symbol=symbol,
-                    timestamp=time.time(),
-                    llm_provider='claude',
-                    analysis_type='market_analysis',
-                    input_data=input_data,
-                    output_data=output_data,
-                    processing_time=processing_time,
-                    cost=0.0  # 비용 계산 로직 추가 필요
-                )
-                db.add(analysis)
-                db.commit()
-                
-        except Exception as e:
-            self.logger.error(f"분석 결과 저장 오류: {e}")
-            
+        """분석 결과 저장 (백그라운드 저장기에 위임, 호출 경로에서 DB 커밋 대기 없음)"""
+        from .analysis_writer import get_analysis_writer
+        get_analysis_writer().submit('claude', 'market_analysis', symbol, input_data, output_data, processing_time)
+        
     def get_analysis_summary(self) -> Dict:
         """분석 요약 정보 조회"""
         return {
@@ -323,4 +329,10 @@ class ClaudeEngine:
             'model': self.config['model'],
             'weight': self.config['weight'],
             'status': 'active'
-        } 
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=1)
+def get_claude_engine() -> ClaudeEngine:
+    """Claude 엔진 인스턴스 조회 (프로세스당 1개, HTTP 클라이언트 연결 재사용)"""
+    return ClaudeEngine()
@@ -0,0 +1,129 @@
+"""
+LLM 분석 결과 저장 압축 사전
+
+분석 결과 행의 입력/출력은 zlib 프리셋 사전으로 압축되며, 사전 ID가 행에 함께 저장됩니다.
+한 번 배포한 사전은 절대 수정하지 말고, 프롬프트가 크게 바뀌면 새 ID로 사전을 추가하세요.
+(기존 행은 저장 당시의 사전 ID로만 복원할 수 있습니다)
+"""
+
+from typing import Dict
+
+# 사전 v1 (프롬프트 템플릿과 응답 형식의 고정 사본, 자주 나오는 내용일수록 끝에 배치)
+_DICTIONARY_V1 = """
+다음 암호화폐 심볼에 대한 최신 뉴스와 시장 감정을 분석해주세요:
+
+심볼: {symbol}
+현재가: {current_price}
+
+다음 JSON 형식으로 응답해주세요:
+{
+    "sentiment": "POSITIVE/NEGATIVE/NEUTRAL",
+    "confidence": 0.0-1.0,
+    "key_news": ["주요 뉴스 1", "주요 뉴스 2"],
+    "market_impact": "HIGH/MEDIUM/LOW",
+    "trend_prediction": "BULLISH/BEARISH/NEUTRAL",
+    "risk_factors": ["리스크 요소 1", "리스크 요소 2"],
+    "opportunities": ["기회 요소 1", "기회 요소 2"],
+    "summary": "전체 요약"
+}
+
+당신은 전문 투자 분석가입니다. 다음 정보를 바탕으로 투자 결정을 내려주세요:
+
+시장 데이터:
+- 심볼: {symbol}
+- 현재가: {current_price}
+- 거래량: {volume}
+- 24시간 변동률: {price_change_percent}%
+
+기술적 지표:
+- RSI: {rsi}
+- MACD: {macd}
+- MACD Signal: {macd_signal}
+- Bollinger Upper: {bollinger_upper}
+- Bollinger Lower: {bollinger_lower}
+- SMA 20: {sma_20}
+- SMA 50: {sma_50}
+
+시장 상황:
+- 추세: {trend}
+- 변동성: {volatility}
+- 거래량 추이: {volume_trend}
+
+분석 결과를 다음 JSON 형식으로 응답해주세요:
+{
+    "decision": "BUY/SELL/HOLD",
+    "confidence": 0.0-1.0,
+    "position_size": 1-10,
+    "risk_level": 1-10,
+    "expected_return": 0.0-1.0,
+    "reasoning": "분석 근거",
+    "stop_loss": "손절매 가격",
+    "take_profit": "익절매 가격",
+    "timeframe": "투자 기간"
+}
+
+당신은 전문 투자 분석가입니다. 아래 심볼 각각에 대해 투자 결정을 내려주세요.
+
+분석 결과를 다음 JSON 형식으로 응답해주세요. results의 i번째 원소는 i번째 심볼에 대응해야 합니다:
+{
+    "results": [
+        {
+            "symbol": "심볼",
+            "decision": "BUY/SELL/HOLD",
+            "confidence": 0.0-1.0,
+            "position_size": 1-10,
+            "risk_level": 1-10,
+            "expected_return": 0.0-1.0,
+            "reasoning": "분석 근거",
+            "stop_loss": "손절매 가격",
+            "take_profit": "익절매 가격",
+            "timeframe": "투자 기간"
+        }
+    ]
+}
+
+## 시장 데이터 ({count}개 심볼)
+{items}
+당신은 전문 투자 분석가입니다. 아래 시장 데이터를 바탕으로 투자 결정을 내려주세요.
+
+분석 결과를 다음 JSON 형식으로 응답해주세요:
+{
+    "decision": "BUY/SELL/HOLD",
+    "confidence": 0.0-1.0,
+    "position_size": 1-10,
+    "risk_level": 1-10,
+    "expected_return": 0.0-1.0,
+    "reasoning": "분석 근거",
+    "stop_loss": "손절매 가격",
+    "take_profit": "익절매 가격",
+    "timeframe": "투자 기간"
+}
+
+## 시장 데이터
+- 심볼: {symbol}
+- 현재가: {current_price}
+- 거래량: {volume}
+- 24시간 변동률: {price_change_percent}%
+
+기술적 지표:
+- RSI: {rsi}
+- MACD: {macd}
+- MACD Signal: {macd_signal}
+- Bollinger Upper: {bollinger_upper}
+- Bollinger Lower: {bollinger_lower}
+- SMA 20: {sma_20}
+- SMA 50: {sma_50}
+
+시장 상황:
+- 추세: {trend}
+- 변동성: {volatility}
+- 거래량 추이: {volume_trend}
+"""
+
+# 사전 ID -> 사전 데이터
+COMPRESSION_DICTIONARIES: Dict[int, bytes] = {
+    1: _DICTIONARY_V1.encode(),
+}
+
+# 새 행에 사용할 사전 ID
+CURRENT_COMPRESSION_DICT_ID = 1
@@ -2,25 +2,46 @@
 다중 LLM 앙상블 의사결정 시스템
 """
 
+import asyncio
 import json
 import time
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
-from .gpt4_engine import GPT4Engine
-from .claude_engine import ClaudeEngine
-from .perplexity_engine import PerplexityEngine
+from .gpt4_engine import get_gpt4_engine
+from .claude_engine import get_claude_engine
+from .perplexity_engine import get_perplexity_engine
 from app.config import LLM_CONFIG
 
+# 투자 기간 라벨 <-> 분 단위 변환표
+TIMEFRAME_MINUTES = {
+    '1M': 1, '5M': 5, '15M': 15, '30M': 30,
+    '1H': 60, '4H': 240, '1D': 1440
+}
+MINUTES_TIMEFRAME = {minutes: label for label, minutes in TIMEFRAME_MINUTES.items()}
+
+# 뉴스 감정 -> 의사결정 / 기본 리스크 / 예상 수익률
+SENTIMENT_DECISION = {'POSITIVE': 'BUY', 'NEGATIVE': 'SELL'}
+SENTIMENT_BASE_RISK = {'POSITIVE': 3, 'NEUTRAL': 5, 'NEGATIVE': 7}
+SENTIMENT_RETURN = {
+    'POSITIVE': 0.05,  # 5% 상승 예상
+    'NEUTRAL': 0.0,    # 변화 없음
+    'NEGATIVE': -0.05  # 5% 하락 예상
+}
+
+# 시장 영향도에 따른 리스크 조정 배수
+MARKET_IMPACT_MULTIPLIER = {'HIGH': 1.5, 'MEDIUM': 1.0, 'LOW': 0.8}
+
 
 class EnsembleDecision:
     """다중 LLM 앙상블 의사결정 시스템"""
     
     def __init__(self):
-        self.gpt4_engine = GPT4Engine()
-        self.claude_engine = ClaudeEngine()
-        self.perplexity_engine = PerplexityEngine()
-        self.logger = logger.bind(name="ensemble_decision")
+        # 엔진은 프로세스 단위로 공유 (HTTP 클라이언트 keep-alive 재사용)
+        self.gpt4_engine = get_gpt4_engine()
+        self.claude_engine = get_claude_engine()
+        self.perplexity_engine = get_perplexity_engine()
+        self.logger = logger.bind(name="ensemble_decision", channel="llm")
         
         # 가중치 설정
         self.weights = {
@@ -29,19 +50,23 @@ class EnsembleDecision:
             'perplexity': LLM_CONFIG['perplexity']['weight']
         }
         
-    def make_ensemble_decision(self, market_data: Dict) -> Dict:
+        # 가중치 튜플 (gpt4, claude, perplexity)과 합계를 미리 계산
+        self._w = (self.weights['gpt4'], self.weights['claude'], self.weights['perplexity'])
+        self._w_sum = sum(self._w)
+        
+    async def make_ensemble_decision(self, market_data: Dict) -> Dict:
         """앙상블 의사결정 수행"""
         try:
             start_time = time.time()
             
-            # 각 LLM의 분석 수행
-            gpt4_result = self.gpt4_engine.analyze_market(market_data)
-            claude_result = self.claude_engine.analyze_market(market_data)
-            
-            # 뉴스 감정 분석
+            # 각 LLM 분석과 뉴스 감정 분석을 동시에 수행 (총 지연은 가장 느린 호출 기준)
             symbol = market_data.get('symbol', 'UNKNOWN')
             current_price = market_data.get('close_price', 0)
-            perplexity_result = self.perplexity_engine.analyze_news_sentiment(symbol, current_price)
+            gpt4_result, claude_result, perplexity_result = await asyncio.gather(
+                self.gpt4_engine.analyze_market(market_data),
+                self.claude_engine.analyze_market(market_data),
+                self.perplexity_engine.analyze_news_sentiment(symbol, current_price)
+            )
             
             # 앙상블 의사결정 생성
             final_decision = self._combine_analyses(
@@ -59,19 +84,62 @@ class EnsembleDecision:
             return self._get_default_response()
             
     def _combine_analyses(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> Dict:
-        """여러 분석 결과를 종합"""
+        """여러 분석 결과를 종합 (각 결과 필드는 한 번만 읽음)"""
         try:
-            # 의사결정 가중 평균 계산
-            decision_scores = self._calculate_decision_scores(gpt4_result, claude_result, perplexity_result)
+            gpt4_get = gpt4_result.get
+            claude_get = claude_result.get
+            perplexity_get = perplexity_result.get
+            w_gpt4, w_claude, w_perplexity = self._w
+            w_sum = self._w_sum
             
-            # 신뢰도 가중 평균 계산
-            confidence = self._calculate_weighted_confidence(gpt4_result, claude_result, perplexity_result)
+            # 각 모델 결과에서 필요한 필드 추출
+            gpt4_decision = gpt4_get('decision', 'HOLD')
+            gpt4_confidence = gpt4_get('confidence', 0.5)
+            claude_decision = claude_get('decision', 'HOLD')
+            claude_confidence = claude_get('confidence', 0.5)
+            sentiment = perplexity_get('sentiment', 'NEUTRAL')
+            sentiment_confidence = perplexity_get('confidence', 0.5)
             
-            # 포지션 크기 가중 평균 계산
-            position_size = self._calculate_weighted_position_size(gpt4_result, claude_result, perplexity_result)
+            # 의사결정 점수 (Perplexity는 감정을 의사결정으로 변환)
+            decision_scores = {'BUY': 0.0, 'SELL': 0.0, 'HOLD': 0.0}
+            decision_scores[gpt4_decision] += gpt4_confidence * w_gpt4
+            decision_scores[claude_decision] += claude_confidence * w_claude
+            decision_scores[SENTIMENT_DECISION.get(sentiment, 'HOLD')] += sentiment_confidence * w_perplexity
             
-            # 리스크 레벨 가중 평균 계산
-            risk_level = self._calculate_weighted_risk_level(gpt4_result, claude_result, perplexity_result)
+            if w_sum > 0:
+                # 신뢰도 가중 평균
+                confidence = (
+                    gpt4_confidence * w_gpt4
+                    + claude_confidence * w_claude
+                    + sentiment_confidence * w_perplexity
+                ) / w_sum
+                
+                # 포지션 크기 가중 평균 (Perplexity는 포지션 크기 없으므로 중간값 사용)
+                position_size = round((
+                    gpt4_get('position_size', 5) * w_gpt4
+                    + claude_get('position_size', 5) * w_claude
+                    + 5 * w_perplexity
+                ) / w_sum)
+                
+                # 리스크 레벨 가중 평균 (Perplexity는 뉴스 감정 및 시장 영향도 기반)
+                news_risk = min(10, max(1, round(
+                    SENTIMENT_BASE_RISK.get(sentiment, 5)
+                    * MARKET_IMPACT_MULTIPLIER.get(perplexity_get('market_impact', 'LOW'), 1.0)
+                )))
+                risk_level = round((
+                    gpt4_get('risk_level', 5) * w_gpt4
+                    + claude_get('risk_level', 5) * w_claude
+                    + news_risk * w_perplexity
+                ) / w_sum)
+                
+                # 예상 수익률 가중 평균 (Perplexity는 감정 분석 기반)
+                expected_return = (
+                    gpt4_get('expected_return', 0.0) * w_gpt4
+                    + claude_get('expected_return', 0.0) * w_claude
+                    + SENTIMENT_RETURN.get(sentiment, 0.0) * w_perplexity
+                ) / w_sum
+            else:
+                confidence, position_size, risk_level, expected_return = 0.5, 5, 5, 0.0
             
             # 최종 의사결정
             final_decision = self._determine_final_decision(decision_scores, confidence)
@@ -82,17 +150,21 @@ class EnsembleDecision:
                 "confidence": confidence,
                 "position_size": position_size,
                 "risk_level": risk_level,
-                "expected_return": self._calculate_expected_return(gpt4_result, claude_result, perplexity_result),
+                "expected_return": expected_return,
                 "reasoning": self._combine_reasoning(gpt4_result, claude_result, perplexity_result),
                 "stop_loss": self._determine_stop_loss(gpt4_result, claude_result),
                 "take_profit": self._determine_take_profit(gpt4_result, claude_result),
                 "timeframe": self._determine_timeframe(gpt4_result, claude_result),
                 "ensemble_details": {
-                    "gpt4_decision": gpt4_result.get('decision', 'HOLD'),
-                    "claude_decision": claude_result.get('decision', 'HOLD'),
-                    "perplexity_sentiment": perplexity_result.get('sentiment', 'NEUTRAL'),
+                    "gpt4_decision": gpt4_decision,
+                    "claude_decision": claude_decision,
+                    "perplexity_sentiment": sentiment,
                     "decision_scores": decision_scores
-                }
+                },
+                # 하나라도 기본 응답이면 일시적 오류가 반영된 결과 (캐시하지 않음)
+                "fallback": bool(
+                    gpt4_get('fallback') or claude_get('fallback') or perplexity_get('fallback')
+                )
             }
             
             return result
@@ -101,192 +173,39 @@ class EnsembleDecision:
             self.logger.error(f"분석 결과 종합 오류: {e}")
             return self._get_default_response()
             
-    def _calculate_decision_scores(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> Dict:
-        """의사결정 점수 계산"""
-        scores = {
-            'BUY': 0.0,
-            'SELL': 0.0,
-            'HOLD': 0.0
-        }
-        
-        # GPT-4 의사결정
-        gpt4_decision = gpt4_result.get('decision', 'HOLD')
-        gpt4_confidence = gpt4_result.get('confidence', 0.5)
-        scores[gpt4_decision] += gpt4_confidence * self.weights['gpt4']
-        
-        # Claude 의사결정
-        claude_decision = claude_result.get('decision', 'HOLD')
-        claude_confidence = claude_result.get('confidence', 0.5)
-        scores[claude_decision] += claude_confidence * self.weights['claude']
-        
-        # Perplexity 감정 분석
-        sentiment = perplexity_result.get('sentiment', 'NEUTRAL')
-        sentiment_confidence = perplexity_result.get('confidence', 0.5)
-        
-        if sentiment == 'POSITIVE':
-            scores['BUY'] += sentiment_confidence * self.weights['perplexity']
-        elif sentiment == 'NEGATIVE':
-            scores['SELL'] += sentiment_confidence * self.weights['perplexity']
-        else:
-            scores['HOLD'] += sentiment_confidence * self.weights['perplexity']
-            
-        return scores
-        
-    def _calculate_weighted_confidence(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> float:
-        """가중 평균 신뢰도 계산"""
-        total_confidence = 0.0
-        total_weight = 0.0
-        
-        # GPT-4 신뢰도
-        gpt4_confidence = gpt4_result.get('confidence', 0.5)
-        total_confidence += gpt4_confidence * self.weights['gpt4']
-        total_weight += self.weights['gpt4']
-        
-        # Claude 신뢰도
-        claude_confidence = claude_result.get('confidence', 0.5)
-        total_confidence += claude_confidence * self.weights['claude']
-        total_weight += self.weights['claude']
-        
-        # Perplexity 신뢰도
-        perplexity_confidence = perplexity_result.get('confidence', 0.5)
-        total_confidence += perplexity_confidence * self.weights['perplexity']
-        total_weight += self.weights['perplexity']
-        
-        return total_confidence / total_weight if total_weight > 0 else 0.5
-        
-    def _calculate_weighted_position_size(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> int:
-        """가중 평균 포지션 크기 계산"""
-        total_size = 0.0
-        total_weight = 0.0
-        
-        # GPT-4 포지션 크기
-        gpt4_size = gpt4_result.get('position_size', 5)
-        total_size += gpt4_size * self.weights['gpt4']
-        total_weight += self.weights['gpt4']
-        
-        # Claude 포지션 크기
-        claude_size = claude_result.get('position_size', 5)
-        total_size += claude_size * self.weights['claude']
-        total_weight += self.weights['claude']
-        
-        # Perplexity는 포지션 크기 없으므로 중간값 사용
-        total_size += 5 * self.weights['perplexity']
-        total_weight += self.weights['perplexity']
-        
-        return round(total_size / total_weight) if total_weight > 0 else 5
-        
-    def _calculate_weighted_risk_level(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> int:
-        """가중 평균 리스크 레벨 계산"""
-        total_risk = 0.0
-        total_weight = 0.0
-        
-        # GPT-4 리스크 레벨
-        gpt4_risk = gpt4_result.get('risk_level', 5)
-        total_risk += gpt4_risk * self.weights['gpt4']
-        total_weight += self.weights['gpt4']
-        
-        # Claude 리스크 레벨
-        claude_risk = claude_result.get('risk_level', 5)
-        total_risk += claude_risk * self.weights['claude']
-        total_weight += self.weights['claude']
-        
-        # Perplexity 리스크 레벨 (뉴스 기반)
-        perplexity_risk = self._calculate_news_based_risk(perplexity_result)
-        total_risk += perplexity_risk * self.weights['perplexity']
-        total_weight += self.weights['perplexity']
-        
-        return round(total_risk / total_weight) if total_weight > 0 else 5
-        
-    def _calculate_news_based_risk(self, perplexity_result: Dict) -> int:
-        """뉴스 기반 리스크 계산"""
-        sentiment = perplexity_result.get('sentiment', 'NEUTRAL')
-        market_impact = perplexity_result.get('market_impact', 'LOW')
-        
-        # 감정에 따른 기본 리스크
-        base_risk = {
-            'POSITIVE': 3,
-            'NEUTRAL': 5,
-            'NEGATIVE': 7
-        }.get(sentiment, 5)
-        
-        # 시장 영향도에 따른 조정
-        impact_multiplier = {
-            'HIGH': 1.5,
-            'MEDIUM': 1.0,
-            'LOW': 0.8
-        }.get(market_impact, 1.0)
-        
-        return min(10, max(1, round(base_risk * impact_multiplier)))
-        
     def _determine_final_decision(self, decision_scores: Dict, confidence: float) -> str:
         """최종 의사결정"""
-        # 가장 높은 점수의 의사결정 선택
-        best_decision = max(decision_scores, key=decision_scores.get)
-        best_score = decision_scores[best_decision]
-        
         # 신뢰도가 낮으면 HOLD로 조정
         if confidence < 0.6:
             return 'HOLD'
             
+        # 한 번의 순회로 최고 점수 의사결정과 두 번째 점수 탐색 (동점이면 먼저 나온 키 우선)
+        best_decision, best_score, second_best = 'HOLD', float('-inf'), float('-inf')
+        for decision, score in decision_scores.items():
+            if score > best_score:
+                best_decision, best_score, second_best = decision, score, best_score
+            elif score > second_best:
+                second_best = score
+                
         # 점수 차이가 적으면 HOLD로 조정
-        second_best = sorted(decision_scores.values(), reverse=True)[1]
         if best_score - second_best < 0.1:
             return 'HOLD'
             
         return best_decision
         
-    def _calculate_expected_return(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> float:
-        """예상 수익률 계산"""
-        total_return = 0.0
-        total_weight = 0.0
-        
-        # GPT-4 예상 수익률
-        gpt4_return = gpt4_result.get('expected_return', 0.0)
-        total_return += gpt4_return * self.weights['gpt4']
-        total_weight += self.weights['gpt4']
-        
-        # Claude 예상 수익률
-        claude_return = claude_result.get('expected_return', 0.0)
-        total_return += claude_return * self.weights['claude']
-        total_weight += self.weights['claude']
-        
-        # Perplexity 기반 수익률 (감정 분석)
-        sentiment_return = self._calculate_sentiment_return(perplexity_result)
-        total_return += sentiment_return * self.weights['perplexity']
-        total_weight += self.weights['perplexity']
-        
-        return total_return / total_weight if total_weight > 0 else 0.0
-        
-    def _calculate_sentiment_return(self, perplexity_result: Dict) -> float:
-        """감정 분석 기반 수익률 계산"""
-        sentiment = perplexity_result.get('sentiment', 'NEUTRAL')
-        
-        return {
-            'POSITIVE': 0.05,  # 5% 상승 예상
-            'NEUTRAL': 0.0,    # 변화 없음
-            'NEGATIVE': -0.05  # 5% 하락 예상
-        }.get(sentiment, 0.0)
-        
     def _combine_reasoning(self, gpt4_result: Dict, claude_result: Dict, perplexity_result: Dict) -> str:
         """분석 근거 종합"""
-        reasoning_parts = []
-        
-        # GPT-4 근거
-        gpt4_reasoning = gpt4_result.get('reasoning', '')
-        if gpt4_reasoning:
-            reasoning_parts.append(f"GPT-4: {gpt4_reasoning}")
-            
-        # Claude 근거
-        claude_reasoning = claude_result.get('reasoning', '')
-        if claude_reasoning:
-            reasoning_parts.append(f"Claude: {claude_reasoning}")
-            
-        # Perplexity 근거
-        perplexity_summary = perplexity_result.get('summary', '')
-        if perplexity_summary:
-            reasoning_parts.append(f"뉴스: {perplexity_summary}")
-            
-        return " | ".join(reasoning_parts) if reasoning_parts else "앙상블 분석"
+        # (라벨, 구분자, 근거, 구분자) 조각을 모아 한 번의 join으로 결합 (근거별 f-string 임시 문자열 생략)
+        parts = []
+        for label, text in (
+            ("GPT-4: ", gpt4_result.get('reasoning', '')),
+            ("Claude: ", claude_result.get('reasoning', '')),
+            ("뉴스: ", perplexity_result.get('summary', ''))
+        ):
+            if text:
+                parts += (label, str(text), " | ")
+                
+        return "".join(parts[:-1]) if parts else "앙상블 분석"
         
     def _determine_stop_loss(self, gpt4_result: Dict, claude_result: Dict) -> Optional[float]:
         """손절매 가격 결정"""
@@ -320,29 +239,14 @@ class EnsembleDecision:
             
     def _determine_timeframe(self, gpt4_result: Dict, claude_result: Dict) -> str:
         """투자 기간 결정"""
-        gpt4_timeframe = gpt4_result.get('timeframe', '1H')
-        claude_timeframe = claude_result.get('timeframe', '1H')
-        
         # 더 짧은 기간 선택 (빠른 대응)
-        timeframes = {
-            '1M': 1, '5M': 5, '15M': 15, '30M': 30,
-            '1H': 60, '4H': 240, '1D': 1440
-        }
-        
-        gpt4_minutes = timeframes.get(gpt4_timeframe, 60)
-        claude_minutes = timeframes.get(claude_timeframe, 60)
-        
-        selected_minutes = min(gpt4_minutes, claude_minutes)
+        selected_minutes = min(
+            TIMEFRAME_MINUTES.get(gpt4_result.get('timeframe', '1H'), 60),
+            TIMEFRAME_MINUTES.get(claude_result.get('timeframe', '1H'), 60)
+        )
         
-        # 분을 시간/일로 변환
-        if selected_minutes < 60:
-            return f"{selected_minutes}M"
-        elif selected_minutes < 1440:
-            hours = selected_minutes // 60
-            return f"{hours}H"
-        else:
-            days = selected_minutes // 1440
-            return f"{days}D"
+        # 선택된 값은 항상 변환표에 있으므로 라벨을 바로 조회
+        return MINUTES_TIMEFRAME[selected_minutes]
             
     def _get_default_response(self) -> Dict:
         """기본 응답 반환"""
@@ -361,7 +265,8 @@ class EnsembleDecision:
                 "claude_decision": "HOLD",
                 "perplexity_sentiment": "NEUTRAL",
                 "decision_scores": {"BUY": 0.0, "SELL": 0.0, "HOLD": 1.0}
-            }
+            },
+            "fallback": True
         }
         
     def get_ensemble_summary(self) -> Dict:
@@ -2,28 +2,123 @@
 GPT-4 Turbo 기반 투자 분석 엔진
 """
 
-import json
+import asyncio
+import hashlib
 import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from string import Formatter
 from typing import Dict, List, Optional, Any
-from openai import OpenAI
+import httpx
+import numpy as np
+import orjson
+from openai import APIConnectionError, APIError, APIStatusError, AsyncOpenAI
 from loguru import logger
+from sqlalchemy import select, update
 
 from app.config import settings, LLM_CONFIG
+from app.models.trading_models import LLMBatchJob
+from app.utils.database import AsyncSessionLocal
+from app.utils.json_scanner import JsonObjectScanner
+from llm_models.rate_limiter import APIRateLimiter, estimate_tokens
+
+# JSON 모드 (응답이 항상 하나의 유효한 JSON 객체)
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# 시스템 메시지 (모든 요청에서 바이트 단위로 동일해야 프롬프트 캐시 적중)
+SYSTEM_MESSAGE = {"role": "system", "content": "당신은 전문 투자 분석가입니다. 정확하고 객관적인 분석을 제공하세요."}
+
+
+# Batch API 작업 상태
+BATCH_SUBMITTED = 'submitted'
+BATCH_COMPLETED = 'completed'
+BATCH_FAILED = 'failed'
+
+# 결과를 아직 수집하지 않은 배치 작업 조회
+PENDING_BATCH_JOBS_SELECT = select(
+    LLMBatchJob.id,
+    LLMBatchJob.batch_id,
+    LLMBatchJob.prompts
+).where(
+    LLMBatchJob.llm_provider == 'gpt4',
+    LLMBatchJob.status == BATCH_SUBMITTED
+).order_by(LLMBatchJob.created_at)
+
+
+class IncompleteStreamError(ValueError):
+    """스트림이 최상위 JSON 객체가 닫히기 전에 끝남"""
+
+
+# 일반 호출로 대체해도 다시 실패할 오류 (한도 초과/상태 코드/연결/시간 초과, 제한기 재시도 후 그대로 전파)
+STREAM_PROPAGATE_ERRORS = (APIStatusError, APIConnectionError, httpx.TimeoutException)
+
+# 스트리밍 고유 오류 (수신 중 연결 끊김, SSE 오류 이벤트, 미완성 JSON) - 이 경우에만 일반 호출로 대체
+STREAM_FALLBACK_ERRORS = (httpx.TransportError, APIError, IncompleteStreamError)
+
+
+def _compile_template(template: str) -> List[tuple]:
+    """format 템플릿을 (리터럴, 필드명) 조각 목록으로 미리 분해 (렌더링 시 템플릿 재파싱 생략)"""
+    return [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+
+def _render_template(parts: List[tuple], values: Dict) -> str:
+    """미리 분해한 템플릿 조각에 값을 채워 문자열 생성"""
+    return "".join([
+        literal if field is None else literal + str(values[field])
+        for literal, field in parts
+    ])
 
 
 class GPT4Engine:
     """GPT-4 Turbo 기반 투자 분석 엔진"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        # 재시도는 공용 호출 제한기가 담당 (429 발생 시 다른 호출도 함께 대기)
+        self.client = AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
         self.config = LLM_CONFIG['gpt4']
-        self.logger = logger.bind(name="gpt4_engine")
         
-        # 투자 특화 프롬프트
+        # 요청마다 쓰는 설정값 (호출 경로의 dict 조회 생략)
+        self._model = self.config['model']
+        self._max_tokens = self.config['max_tokens']
+        self._temperature = self.config['temperature']
+        
+        # 동시 요청 수 제한 (요금제 RPM 한도 보호)
+        self._semaphore = asyncio.Semaphore(self.config.get('max_concurrent_requests', 5))
+        
+        # 분당 요청/토큰 한도 및 재시도
+        self.rate_limiter = APIRateLimiter(
+            "gpt4",
+            requests_per_minute=self.config['requests_per_minute'],
+            tokens_per_minute=self.config['tokens_per_minute'],
+            max_retries=self.config['max_retries']
+        )
+        
+        # 프롬프트 응답 캐시 (프롬프트 해시 -> (저장 시각, 파싱 결과), 오래된 항목부터 제거)
+        self._response_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._response_cache_ttl = self.config.get('cache_ttl', 30)
+        self._response_cache_size = self.config.get('cache_size', 4096)
+        
+        self.logger = logger.bind(name="gpt4_engine", channel="llm")
+        
+        # 투자 특화 프롬프트 (고정 지시문/응답 형식을 앞에, 심볼별 데이터를 끝에 두어 프롬프트 캐시 접두사 유지)
         self.investment_prompt = """
-당신은 전문 투자 분석가입니다. 다음 정보를 바탕으로 투자 결정을 내려주세요:
+당신은 전문 투자 분석가입니다. 아래 시장 데이터를 바탕으로 투자 결정을 내려주세요.
 
-시장 데이터:
+분석 결과를 다음 JSON 형식으로 응답해주세요:
+{{
+    "decision": "BUY/SELL/HOLD",
+    "confidence": 0.0-1.0,
+    "position_size": 1-10,
+    "risk_level": 1-10,
+    "expected_return": 0.0-1.0,
+    "reasoning": "분석 근거",
+    "stop_loss": "손절매 가격",
+    "take_profit": "익절매 가격",
+    "timeframe": "투자 기간"
+}}
+
+## 시장 데이터
 - 심볼: {symbol}
 - 현재가: {current_price}
 - 거래량: {volume}
@@ -42,49 +137,105 @@ class GPT4Engine:
 - 추세: {trend}
 - 변동성: {volatility}
 - 거래량 추이: {volume_trend}
+"""
+        
+        # 다중 심볼 일괄 분석 프롬프트 (심볼별 데이터 블록 + 결과 배열 형식)
+        self.batch_item_prompt = """
+[{index}] 심볼: {symbol}
+- 현재가: {current_price}, 거래량: {volume}, 24시간 변동률: {price_change_percent}%
+- RSI: {rsi}, MACD: {macd}, MACD Signal: {macd_signal}
+- Bollinger Upper: {bollinger_upper}, Bollinger Lower: {bollinger_lower}, SMA 20: {sma_20}, SMA 50: {sma_50}
+- 추세: {trend}, 변동성: {volatility}, 거래량 추이: {volume_trend}
+"""
+        self.batch_prompt = """
+당신은 전문 투자 분석가입니다. 아래 심볼 각각에 대해 투자 결정을 내려주세요.
 
-분석 결과를 다음 JSON 형식으로 응답해주세요:
+분석 결과를 다음 JSON 형식으로 응답해주세요. results의 i번째 원소는 i번째 심볼에 대응해야 합니다:
 {{
-    "decision": "BUY/SELL/HOLD",
-    "confidence": 0.0-1.0,
-    "position_size": 1-10,
-    "risk_level": 1-10,
-    "expected_return": 0.0-1.0,
-    "reasoning": "분석 근거",
-    "stop_loss": "손절매 가격",
-    "take_profit": "익절매 가격",
-    "timeframe": "투자 기간"
+    "results": [
+        {{
+            "symbol": "심볼",
+            "decision": "BUY/SELL/HOLD",
+            "confidence": 0.0-1.0,
+            "position_size": 1-10,
+            "risk_level": 1-10,
+            "expected_return": 0.0-1.0,
+            "reasoning": "분석 근거",
+            "stop_loss": "손절매 가격",
+            "take_profit": "익절매 가격",
+            "timeframe": "투자 기간"
+        }}
+    ]
 }}
-"""
+
+## 시장 데이터 ({count}개 심볼)
+{items}"""
+        
+        # 프롬프트 템플릿 사전 분해
+        self._investment_parts = _compile_template(self.investment_prompt)
+        self._batch_item_parts = _compile_template(self.batch_item_prompt)
         
-    def analyze_market(self, market_data: Dict) -> Dict:
-        """시장 분석 수행"""
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료"""
+        await self.client.close()
+        
+    async def analyze_market(self, market_data: Dict) -> Dict:
+        """시장 분석 수행 (비동기 클라이언트, 이벤트 루프 비차단)"""
         try:
             start_time = time.time()
             
             # 프롬프트 생성
             prompt = self._create_analysis_prompt(market_data)
             
-            # GPT-4 API 호출
-            response = self.client.chat.completions.create(
-                model=self.config['model'],
-                messages=[
-                    {"role": "system", "content": "당신은 전문 투자 분석가입니다. 정확하고 객관적인 분석을 제공하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.config['max_tokens'],
-                temperature=self.config['temperature']
-            )
+            # 동일 프롬프트의 최근 응답이 있으면 API 호출 및 DB 저장 생략
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            cached = self._response_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self._response_cache_ttl:
+                self._response_cache.move_to_end(cache_key)
+                return {**cached[1], 'cached': True}
+            
+            # GPT-4 API 호출 (스트리밍, JSON 객체가 완성되면 즉시 수신 중단)
+            messages = [
+                SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt}
+            ]
+            tokens = estimate_tokens(prompt, self._max_tokens)
+            async with self._semaphore:
+                try:
+                    content = await self._stream_completion(messages, tokens)
+                except STREAM_PROPAGATE_ERRORS:
+                    raise
+                except STREAM_FALLBACK_ERRORS as e:
+                    self.logger.warning(f"GPT-4 스트리밍 실패 - 일반 호출로 대체: {e}")
+                    response = await self.rate_limiter.call(
+                        lambda: self.client.chat.completions.create(
+                            model=self._model,
+                            messages=messages,
+                            max_tokens=self._max_tokens,
+                            temperature=self._temperature,
+                            response_format=JSON_RESPONSE_FORMAT
+                        ),
+                        tokens
+                    )
+                    content = response.choices[0].message.content
+                    self._log_prompt_cache_usage(response)
             
             # 응답 파싱
-            result = self._parse_response(response.choices[0].message.content)
+            result = self._parse_response(content)
+            
+            # 응답 캐시 저장 (파싱 실패로 생긴 기본 응답은 저장하지 않음)
+            if not result.get('fallback'):
+                self._response_cache[cache_key] = (time.monotonic(), result)
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
             
             # 성능 로깅
             processing_time = time.time() - start_time
             self.logger.info(f"GPT-4 분석 완료 - 소요시간: {processing_time:.3f}초")
             
             # LLM 분석 결과 저장
-            self._save_analysis_result(market_data['symbol'], prompt, response.choices[0].message.content, processing_time)
+            self._save_analysis_result(market_data['symbol'], prompt, content, processing_time)
             
             return result
             
@@ -92,34 +243,253 @@ class GPT4Engine:
             self.logger.error(f"GPT-4 분석 오류: {e}")
             return self._get_default_response()
             
-    def _create_analysis_prompt(self, market_data: Dict) -> str:
-        """분석 프롬프트 생성"""
+    async def _stream_completion(self, messages: List[Dict], tokens: int = 0) -> str:
+        """응답을 스트리밍으로 수신하고 최상위 JSON 객체가 닫히는 즉시 중단 (남은 토큰 생성/과금 생략)"""
+        stream = await self.rate_limiter.call(
+            lambda: self.client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                max_tokens=self._max_tokens,
+                temperature=self._temperature,
+                response_format=JSON_RESPONSE_FORMAT,
+                stream=True
+            ),
+            tokens
+        )
+        
+        parts = []
+        scanner = JsonObjectScanner()
         try:
-            # 기술적 지표 계산
-            technical_indicators = self._calculate_technical_indicators(market_data)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                
+                # 문자열 내부의 중괄호는 무시하고 괄호 깊이 추적
+                end = scanner.feed(delta)
+                if end != -1:
+                    parts[-1] = delta[:end]
+                    return "".join(parts)
+        finally:
+            await stream.response.aclose()
             
-            # 시장 상황 분석
-            market_situation = self._analyze_market_situation(market_data)
+        raise IncompleteStreamError("JSON 객체가 닫히기 전에 스트림이 종료되었습니다.")
+        
+    async def analyze_market_batch(self, market_data_list: List[Dict], batch_size: int = 10) -> List[Dict]:
+        """여러 심볼을 batch_size개씩 묶어 요청 1회로 분석 (입력 순서대로 결과 반환)"""
+        chunks = [
+            market_data_list[i:i + batch_size]
+            for i in range(0, len(market_data_list), batch_size)
+        ]
+        chunk_results = await asyncio.gather(*(self._analyze_market_chunk(chunk) for chunk in chunks))
+        return [result for results in chunk_results for result in results]
+        
+    async def _analyze_market_chunk(self, chunk: List[Dict]) -> List[Dict]:
+        """심볼 묶음 일괄 분석 (응답 파싱 실패 시 심볼별 개별 분석으로 대체)"""
+        if len(chunk) == 1:
+            return [await self.analyze_market(chunk[0])]
             
-            # 프롬프트 변수 설정
-            prompt_vars = {
-                'symbol': market_data.get('symbol', 'UNKNOWN'),
-                'current_price': market_data.get('close_price', 0),
-                'volume': market_data.get('volume', 0),
-                'price_change_percent': market_data.get('price_change_percent', 0),
-                'rsi': technical_indicators.get('rsi', 0),
-                'macd': technical_indicators.get('macd', 0),
-                'macd_signal': technical_indicators.get('macd_signal', 0),
-                'bollinger_upper': technical_indicators.get('bollinger_upper', 0),
-                'bollinger_lower': technical_indicators.get('bollinger_lower', 0),
-                'sma_20': technical_indicators.get('sma_20', 0),
-                'sma_50': technical_indicators.get('sma_50', 0),
-                'trend': market_situation.get('trend', 'NEUTRAL'),
-                'volatility': market_situation.get('volatility', 'MEDIUM'),
-                'volume_trend': market_situation.get('volume_trend', 'STABLE')
-            }
+        try:
+            start_time = time.time()
+            
+            # 일괄 프롬프트 생성
+            prompt = self._create_batch_prompt(chunk)
+            
+            # GPT-4 API 호출 (응답 길이는 심볼 수에 비례)
+            max_tokens = self._max_tokens * len(chunk)
+            async with self._semaphore:
+                response = await self.rate_limiter.call(
+                    lambda: self.client.chat.completions.create(
+                        model=self._model,
+                        messages=[
+                            SYSTEM_MESSAGE,
+                            {"role": "user", "content": prompt}
+                        ],
+                        max_tokens=max_tokens,
+                        temperature=self._temperature,
+                        response_format=JSON_RESPONSE_FORMAT
+                    ),
+                    estimate_tokens(prompt, max_tokens)
+                )
+            content = response.choices[0].message.content
+            self._log_prompt_cache_usage(response)
+            
+            # 응답 파싱 (결과 수가 맞지 않으면 개별 분석)
+            results = self._parse_batch_response(content, len(chunk))
+            if results is None:
+                self.logger.warning("GPT-4 일괄 분석 응답 파싱 실패 - 심볼별 개별 분석으로 대체")
+                return await self.analyze_markets(chunk)
+                
+            # 성능 로깅
+            processing_time = time.time() - start_time
+            self.logger.info(f"GPT-4 일괄 분석 완료 - 심볼 {len(chunk)}개, 소요시간: {processing_time:.3f}초")
             
-            return self.investment_prompt.format(**prompt_vars)
+            # LLM 분석 결과 저장
+            rows = [
+                (market_data.get('symbol', 'UNKNOWN'), prompt, orjson.dumps(result).decode(), processing_time)
+                for market_data, result in zip(chunk, results)
+            ]
+            self._save_analysis_rows(rows, 'market_analysis_batch')
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"GPT-4 일괄 분석 오류: {e}")
+            return await self.analyze_markets(chunk)
+            
+    def _create_batch_prompt(self, chunk: List[Dict]) -> str:
+        """일괄 분석 프롬프트 생성"""
+        # 시장 상황은 묶음 전체를 한 번에 분류 (실패 시 심볼별 분류)
+        try:
+            situations = self._classify_market_batch(chunk)
+        except Exception as e:
+            self.logger.warning(f"시장 상황 일괄 분류 실패 - 심볼별 분류로 대체: {e}")
+            situations = [None] * len(chunk)
+            
+        items = "".join(
+            _render_template(self._batch_item_parts, {'index': index, **self._build_prompt_vars(market_data, situation)})
+            for index, (market_data, situation) in enumerate(zip(chunk, situations), 1)
+        )
+        return self.batch_prompt.format(count=len(chunk), items=items)
+        
+    def _parse_batch_response(self, response_text: str, expected: int) -> Optional[List[Dict]]:
+        """일괄 분석 응답 파싱 (결과 배열 길이가 심볼 수와 다르면 None)"""
+        try:
+            results = orjson.loads(response_text).get('results')
+            if not isinstance(results, list) or len(results) != expected:
+                return None
+                
+            # 필수 필드 검증
+            required_fields = ['decision', 'confidence', 'position_size', 'risk_level']
+            for result in results:
+                if not isinstance(result, dict):
+                    return None
+                for field in required_fields:
+                    if field not in result:
+                        result[field] = self._get_default_value(field)
+                        
+            return results
+            
+        except (orjson.JSONDecodeError, AttributeError) as e:
+            self.logger.error(f"일괄 응답 파싱 오류: {e}")
+            return None
+            
+    async def submit_batch(self, market_data_list: List[Dict]) -> str:
+        """비실시간 분석을 OpenAI Batch API로 제출 (24시간 내 처리, 비용 50% 절감, 별도 한도) 후 배치 ID 반환"""
+        prompts = {}
+        lines = []
+        for market_data in market_data_list:
+            symbol = market_data.get('symbol', 'UNKNOWN')
+            if symbol in prompts:  # custom_id는 배치 내에서 유일해야 함
+                continue
+            prompt = self._create_analysis_prompt(market_data)
+            prompts[symbol] = prompt
+            lines.append(orjson.dumps({
+                "custom_id": symbol,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self._model,
+                    "messages": [
+                        SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    "max_tokens": self._max_tokens,
+                    "temperature": self._temperature,
+                    "response_format": JSON_RESPONSE_FORMAT
+                }
+            }).decode())
+            
+        batch_file = await self.client.files.create(
+            file=("gpt4_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        # 결과 저장 시 입력 프롬프트 기록용 (재시작 후에도 수집하도록 DB에 저장)
+        async with AsyncSessionLocal() as db:
+            db.add(LLMBatchJob(
+                batch_id=batch.id,
+                llm_provider='gpt4',
+                status=BATCH_SUBMITTED,
+                prompts=orjson.dumps(prompts).decode(),
+                created_at=datetime.now()
+            ))
+            await db.commit()
+        self.logger.info(f"GPT-4 배치 제출 완료 - 배치 ID: {batch.id}, 심볼 {len(lines)}개")
+        return batch.id
+        
+    async def poll_batch(self, batch_id: str, prompts: Dict[str, str]) -> Optional[Dict[str, Dict]]:
+        """배치 결과 조회 (미완료면 None, 완료 시 심볼별 분석 결과 저장 후 반환, 실패 시 빈 dict)"""
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing"):
+            return None
+            
+        if batch.status != "completed" or not batch.output_file_id:
+            self.logger.error(f"GPT-4 배치 처리 실패 - 배치 ID: {batch_id}, 상태: {batch.status}")
+            return {}
+            
+        content = await self.client.files.content(batch.output_file_id)
+        
+        results = {}
+        rows = []
+        for line in content.text.splitlines():
+            if not line:
+                continue
+            item = orjson.loads(line)
+            symbol = item['custom_id']
+            choices = ((item.get('response') or {}).get('body') or {}).get('choices')
+            if not choices:
+                results[symbol] = self._get_default_response()
+                continue
+                
+            output = choices[0]['message']['content']
+            results[symbol] = self._parse_response(output)
+            rows.append((symbol, prompts.get(symbol), output, None))
+            
+        # LLM 분석 결과 저장
+        self._save_analysis_rows(rows, 'market_analysis_batch_api')
+        return results
+        
+    async def poll_pending_batches(self) -> int:
+        """제출한 배치 중 완료된 것의 결과를 저장하고 아직 처리 중인 배치 수 반환"""
+        async with AsyncSessionLocal() as db:
+            jobs = (await db.execute(PENDING_BATCH_JOBS_SELECT)).all()
+            
+        pending = 0
+        for job_id, batch_id, prompts_json in jobs:
+            try:
+                results = await self.poll_batch(batch_id, orjson.loads(prompts_json))
+            except Exception as e:
+                self.logger.error(f"GPT-4 배치 결과 조회 오류 - 배치 ID: {batch_id}: {e}")
+                results = None
+            if results is None:
+                pending += 1
+                continue
+                
+            # 작업 상태 갱신 (결과가 비어 있으면 실패)
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(LLMBatchJob).where(LLMBatchJob.id == job_id).values(
+                        status=BATCH_COMPLETED if results else BATCH_FAILED,
+                        completed_at=datetime.now()
+                    )
+                )
+                await db.commit()
+                
+        return pending
+        
+    def _create_analysis_prompt(self, market_data: Dict) -> str:
+        """분석 프롬프트 생성"""
+        try:
+            return _render_template(self._investment_parts, self._build_prompt_vars(market_data))
             
         except Exception as e:
             self.logger.error(f"프롬프트 생성 오류: {e}")
@@ -140,6 +510,33 @@ class GPT4Engine:
                 volume_trend='STABLE'
             )
             
+    def _build_prompt_vars(self, market_data: Dict, market_situation: Optional[Dict] = None) -> Dict:
+        """프롬프트 변수 생성 (기술적 지표 및 시장 상황 포함, 시장 상황이 미리 계산되어 있으면 재사용)"""
+        # 기술적 지표 계산
+        technical_indicators = self._calculate_technical_indicators(market_data)
+        
+        # 시장 상황 분석
+        if market_situation is None:
+            market_situation = self._analyze_market_situation(market_data)
+        
+        # 프롬프트 변수 설정
+        return {
+            'symbol': market_data.get('symbol', 'UNKNOWN'),
+            'current_price': market_data.get('close_price', 0),
+            'volume': market_data.get('volume', 0),
+            'price_change_percent': market_data.get('price_change_percent', 0),
+            'rsi': technical_indicators.get('rsi', 0),
+            'macd': technical_indicators.get('macd', 0),
+            'macd_signal': technical_indicators.get('macd_signal', 0),
+            'bollinger_upper': technical_indicators.get('bollinger_upper', 0),
+            'bollinger_lower': technical_indicators.get('bollinger_lower', 0),
+            'sma_20': technical_indicators.get('sma_20', 0),
+            'sma_50': technical_indicators.get('sma_50', 0),
+            'trend': market_situation.get('trend', 'NEUTRAL'),
+            'volatility': market_situation.get('volatility', 'MEDIUM'),
+            'volume_trend': market_situation.get('volume_trend', 'STABLE')
+        }
+            
     def _calculate_technical_indicators(self, market_data: Dict) -> Dict:
         """기술적 지표 계산"""
         try:
@@ -233,35 +630,75 @@ class GPT4Engine:
                 'volume_trend': 'STABLE'
             }
             
+    def _classify_market_batch(self, chunk: List[Dict]) -> List[Dict]:
+        """여러 심볼의 시장 상황(추세/변동성/거래량 추이)을 NumPy 배열 연산으로 한 번에 분류
+
+        분류 기준은 _analyze_market_situation과 동일합니다.
+        """
+        price_change = np.array([md.get('price_change_percent', 0) for md in chunk], dtype=np.float64)
+        high = np.array([md.get('high_price', 0) for md in chunk], dtype=np.float64)
+        low = np.array([md.get('low_price', 0) for md in chunk], dtype=np.float64)
+        close = np.array([md.get('close_price', 0) for md in chunk], dtype=np.float64)
+        volume = np.array([md.get('volume', 0) for md in chunk], dtype=np.float64)
+        
+        # 추세
+        trend = np.select(
+            [price_change > 5, price_change > 1, price_change < -5, price_change < -1],
+            ['STRONG_BULLISH', 'BULLISH', 'STRONG_BEARISH', 'BEARISH'],
+            default='NEUTRAL'
+        )
+        
+        # 변동성 (현재가가 0 이하이면 UNKNOWN)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility_pct = (high - low) / close * 100
+        volatility = np.select(
+            [close <= 0, volatility_pct > 10, volatility_pct > 5],
+            ['UNKNOWN', 'HIGH', 'MEDIUM'],
+            default='LOW'
+        )
+        
+        # 거래량 추이
+        volume_trend = np.select(
+            [volume > 1000000, volume > 100000],
+            ['HIGH', 'MEDIUM'],
+            default='LOW'
+        )
+        
+        return [
+            {'trend': t, 'volatility': v, 'volume_trend': vt}
+            for t, v, vt in zip(trend.tolist(), volatility.tolist(), volume_trend.tolist())
+        ]
+        
     def _parse_response(self, response_text: str) -> Dict:
         """GPT-4 응답 파싱"""
         try:
-            # JSON 추출
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
+            # JSON 모드 응답은 그대로 파싱
+            result = orjson.loads(response_text)
             
-            if start_idx != -1 and end_idx != 0:
-                json_str = response_text[start_idx:end_idx]
-                result = json.loads(json_str)
-                
-                # 필수 필드 검증
-                required_fields = ['decision', 'confidence', 'position_size', 'risk_level']
-                for field in required_fields:
-                    if field not in result:
-                        result[field] = self._get_default_value(field)
-                        
-                return result
-            else:
-                self.logger.warning("JSON 응답을 찾을 수 없습니다.")
-                return self._get_default_response()
-                
-        except json.JSONDecodeError as e:
+            # 필수 필드 검증
+            required_fields = ['decision', 'confidence', 'position_size', 'risk_level']
+            for field in required_fields:
+                if field not in result:
+                    result[field] = self._get_default_value(field)
+                    
+            return result
+            
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"JSON 파싱 오류: {e}")
             return self._get_default_response()
         except Exception as e:
             self.logger.error(f"응답 파싱 오류: {e}")
             return self._get_default_response()
             
+    def _log_prompt_cache_usage(self, response):
+        """프롬프트 캐시 적중 토큰 수 기록 (응답 usage에 캐시 정보가 있는 경우)"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached_tokens = getattr(details, 'cached_tokens', None) or 0
+        self.logger.debug(f"GPT-4 프롬프트 토큰: {usage.prompt_tokens} (캐시 적중 {cached_tokens})")
+        
     def _get_default_response(self) -> Dict:
         """기본 응답 반환"""
         return {
@@ -273,7 +710,8 @@ class GPT4Engine:
             "reasoning": "분석 실패로 인한 보수적 결정",
             "stop_loss": None,
             "take_profit": None,
-            "timeframe": "1H"
+            "timeframe": "1H",
+            "fallback": True  # API 오류/파싱 실패로 생성한 기본 응답 (캐시하지 않음)
         }
         
     def _get_default_value(self, field: str):
@@ -291,29 +729,22 @@ class GPT4Engine:
         }
         return defaults.get(field, None)
         
-    def _save_analysis_result(self, symbol: str, input_data: str, output_data: str, processing_time: float):
-        """분석 결과 저장"""
-        try:
-            from app.utils.database import get_db_session
-            from app.models.trading_models import LLMAnalysis
-            
-            with get_db_session() as db:
-                analysis = LLMAnalysis(
-                    symbol=symbol,
-                    timestamp=time.time(),
-                    llm_provider='gpt4',
-                    analysis_type='market_analysis',
-                    input_data=input_data,
-                    output_data=output_data,
-                    processing_time=processing_time,
-                    cost=0.0  # 비용 계산 로직 추가 필요
-                )
-                db.add(analysis)
-                db.commit()
-                
-        except Exception as e:
-            self.logger.error(f"분석 결과 저장 오류: {e}")
+    def _save_analysis_rows(self, rows: List[tuple], analysis_type: str):
+        """여러 분석 결과 저장 (행: 심볼, 입력, 출력, 소요시간)"""
+        from .analysis_writer import get_analysis_writer
+        writer = get_analysis_writer()
+        for symbol, input_data, output_data, processing_time in rows:
+            writer.submit('gpt4', analysis_type, symbol, input_data, output_data, processing_time)
             
+    def _save_analysis_result(self, symbol: str, input_data: str, output_data: str, processing_time: float):
+        """분석 결과 저장 (백그라운드 저장기에 위임, 호출 경로에서 DB 커밋 대기 없음)"""
+        from .analysis_writer import get_analysis_writer
+        get_analysis_writer().submit('gpt4', 'market_analysis', symbol, input_data, output_data, processing_time)
+        
+    async def analyze_markets(self, market_data_list: List[Dict]) -> List[Dict]:
+        """여러 심볼 시장 분석을 동시에 수행 (세마포어로 동시 요청 수 제한)"""
+        return await asyncio.gather(*(self.analyze_market(market_data) for market_data in market_data_list))
+        
     def get_analysis_summary(self) -> Dict:
         """분석 요약 정보 조회"""
         return {
@@ -321,4 +752,10 @@ class GPT4Engine:
             'model': self.config['model'],
             'weight': self.config['weight'],
             'status': 'active'
-        } 
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=1)
+def get_gpt4_engine() -> GPT4Engine:
+    """GPT-4 엔진 인스턴스 조회 (프로세스당 1개, HTTP 클라이언트 연결 재사용)"""
+    return GPT4Engine()
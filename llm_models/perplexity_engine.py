@@ -2,13 +2,18 @@
 Perplexity API 기반 뉴스 및 시장 감정 분석 엔진
 """
 
-import json
+import asyncio
 import time
+from collections import OrderedDict
+from functools import lru_cache
 import httpx
+import orjson
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
 from app.config import settings, LLM_CONFIG
+from app.utils.json_scanner import extract_first_object
+from llm_models.rate_limiter import APIRateLimiter, estimate_tokens
 
 
 class PerplexityEngine:
@@ -17,9 +22,40 @@ class PerplexityEngine:
     def __init__(self):
         self.api_key = settings.google_api_key  # Perplexity API 키로 변경 필요
         self.config = LLM_CONFIG['perplexity']
-        self.logger = logger.bind(name="perplexity_engine")
+        
+        # 요청마다 쓰는 설정값 (호출 경로의 dict 조회 생략)
+        self._model = self.config['model']
+        self._max_tokens = self.config['max_tokens']
+        self._temperature = self.config['temperature']
+        
+        self.logger = logger.bind(name="perplexity_engine", channel="llm")
         self.base_url = "https://api.perplexity.ai"
         
+        # API 호출 한도 (분당 요청 수) 및 재시도
+        self.rate_limiter = APIRateLimiter(
+            "perplexity",
+            requests_per_minute=self.config['requests_per_minute'],
+            burst=self.config['burst'],
+            max_retries=self.config['max_retries']
+        )
+        
+        # 뉴스 분석 캐시 ((심볼, 가격) -> (저장 시각, 파싱 결과), 오래된 항목부터 제거)
+        self._response_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._response_cache_ttl = self.config.get('cache_ttl', 60)
+        self._response_cache_size = self.config.get('cache_size', 512)
+        
+        # 공유 keep-alive HTTP/2 클라이언트 (요청마다 TCP/TLS 핸드셰이크 생략)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+        
         # 뉴스 분석 프롬프트
         self.news_analysis_prompt = """
 다음 암호화폐 심볼에 대한 최신 뉴스와 시장 감정을 분석해주세요:
@@ -40,11 +76,22 @@ class PerplexityEngine:
 }}
 """
         
-    def analyze_news_sentiment(self, symbol: str, current_price: float) -> Dict:
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료"""
+        await self._client.aclose()
+        
+    async def analyze_news_sentiment(self, symbol: str, current_price: float) -> Dict:
         """뉴스 감정 분석 수행"""
         try:
             start_time = time.time()
             
+            # 같은 심볼/가격의 최근 분석이 있으면 API 호출 및 DB 저장 생략
+            cache_key = (symbol, round(current_price or 0, 2))
+            cached = self._response_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self._response_cache_ttl:
+                self._response_cache.move_to_end(cache_key)
+                return {**cached[1], 'cached': True}
+            
             # 프롬프트 생성
             prompt = self.news_analysis_prompt.format(
                 symbol=symbol,
@@ -52,11 +99,18 @@ class PerplexityEngine:
             )
             
             # Perplexity API 호출
-            response = self._call_perplexity_api(prompt)
+            response = await self._call_perplexity_api(prompt)
             
             # 응답 파싱
             result = self._parse_response(response)
             
+            # 응답 캐시 저장 (API 오류/파싱 실패로 생긴 기본 응답은 저장하지 않음)
+            if not result.get('fallback'):
+                self._response_cache[cache_key] = (time.monotonic(), result)
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
+            
             # 성능 로깅
             processing_time = time.time() - start_time
             self.logger.info(f"Perplexity 뉴스 분석 완료 - 소요시간: {processing_time:.3f}초")
@@ -70,36 +124,33 @@ class PerplexityEngine:
             self.logger.error(f"Perplexity 뉴스 분석 오류: {e}")
             return self._get_default_response()
             
-    def _call_perplexity_api(self, prompt: str) -> str:
+    async def _call_perplexity_api(self, prompt: str) -> str:
         """Perplexity API 호출"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             data = {
-                "model": self.config['model'],
+                "model": self._model,
                 "messages": [
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
-                "max_tokens": self.config['max_tokens'],
-                "temperature": self.config['temperature']
+                "max_tokens": self._max_tokens,
+                "temperature": self._temperature
             }
             
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=data
-                )
+            body = orjson.dumps(data)
+            
+            async def post() -> httpx.Response:
+                response = await self._client.post("/chat/completions", content=body)
                 response.raise_for_status()
+                return response
                 
-                result = response.json()
-                return result['choices'][0]['message']['content']
+            # 한도 초과/서버 오류는 Retry-After 또는 지수 백오프 후 재시도
+            response = await self.rate_limiter.call(post, estimate_tokens(prompt, self._max_tokens))
+            
+            result = orjson.loads(response.content)
+            return result['choices'][0]['message']['content']
                 
         except Exception as e:
             self.logger.error(f"Perplexity API 호출 오류: {e}")
@@ -108,13 +159,11 @@ class PerplexityEngine:
     def _parse_response(self, response_text: str) -> Dict:
         """Perplexity 응답 파싱"""
         try:
-            # JSON 추출
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
+            # JSON 추출 (첫 번째로 균형이 맞는 객체)
+            json_str = extract_first_object(response_text)
             
-            if start_idx != -1 and end_idx != 0:
-                json_str = response_text[start_idx:end_idx]
-                result = json.loads(json_str)
+            if json_str is not None:
+                result = orjson.loads(json_str)
                 
                 # 필수 필드 검증
                 required_fields = ['sentiment', 'confidence', 'key_news', 'market_impact']
@@ -127,7 +176,7 @@ class PerplexityEngine:
                 self.logger.warning("JSON 응답을 찾을 수 없습니다.")
                 return self._get_default_response()
                 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"JSON 파싱 오류: {e}")
             return self._get_default_response()
         except Exception as e:
@@ -144,7 +193,8 @@ class PerplexityEngine:
             "trend_prediction": "NEUTRAL",
             "risk_factors": ["분석 불가"],
             "opportunities": ["분석 불가"],
-            "summary": "뉴스 분석에 실패했습니다."
+            "summary": "뉴스 분석에 실패했습니다.",
+            "fallback": True  # API 오류/파싱 실패로 생성한 기본 응답 (캐시하지 않음)
         }
         
     def _get_default_value(self, field: str):
@@ -162,28 +212,10 @@ class PerplexityEngine:
         return defaults.get(field, None)
         
     def _save_analysis_result(self, symbol: str, input_data: str, output_data: str, processing_time: float):
-        """분석 결과 저장"""
-        try:
-            from app.utils.database import get_db_session
-            from app.models.trading_models import LLMAnalysis
-            
-            with get_db_session() as db:
-                analysis = LLMAnalysis(
-                    symbol=symbol,
-                    timestamp=time.time(),
-                    llm_provider='perplexity',
-                    analysis_type='news_sentiment',
-                    input_data=input_data,
-                    output_data=output_data,
-                    processing_time=processing_time,
-                    cost=0.0  # 비용 계산 로직 추가 필요
-                )
-                db.add(analysis)
-                db.commit()
-                
-        except Exception as e:
-            self.logger.error(f"분석 결과 저장 오류: {e}")
-            
+        """분석 결과 저장 (백그라운드 저장기에 위임, 호출 경로에서 DB 커밋 대기 없음)"""
+        from .analysis_writer import get_analysis_writer
+        get_analysis_writer().submit('perplexity', 'news_sentiment', symbol, input_data, output_data, processing_time)
+        
     def get_analysis_summary(self) -> Dict:
         """분석 요약 정보 조회"""
         return {
@@ -193,21 +225,24 @@ class PerplexityEngine:
             'status': 'active'
         }
         
-    def analyze_multiple_symbols(self, symbols: List[str], prices: Dict[str, float]) -> Dict[str, Dict]:
-        """여러 심볼에 대한 뉴스 분석"""
-        results = {}
+    async def analyze_multiple_symbols(self, symbols: List[str], prices: Dict[str, float]) -> Dict[str, Dict]:
+        """여러 심볼에 대한 뉴스 분석 (동시 수행, 호출 간격은 토큰 버킷이 조절)"""
+        analyses = await asyncio.gather(
+            *(self.analyze_news_sentiment(symbol, prices.get(symbol, 0)) for symbol in symbols),
+            return_exceptions=True
+        )
         
-        for symbol in symbols:
-            try:
-                current_price = prices.get(symbol, 0)
-                result = self.analyze_news_sentiment(symbol, current_price)
-                results[symbol] = result
-                
-                # API 호출 간격 조절
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"{symbol} 뉴스 분석 실패: {e}")
-                results[symbol] = self._get_default_response()
-                
-        return results 
\ No newline at end of file
+        results = {}
+        for symbol, result in zip(symbols, analyses):
+            if isinstance(result, Exception):
+                self.logger.error(f"{symbol} 뉴스 분석 실패: {result}")
+                result = self._get_default_response()
+            results[symbol] = result
+            
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_perplexity_engine() -> PerplexityEngine:
+    """Perplexity 엔진 인스턴스 조회 (프로세스당 1개, HTTP 클라이언트 연결 재사용)"""
+    return PerplexityEngine()
@@ -0,0 +1,115 @@
+"""
+LLM API 호출 한도 관리 및 재시도
+"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# 재시도 대상 HTTP 상태 코드 (한도 초과 및 일시적 서버 오류)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# 지수 백오프 최대 대기 시간 (초)
+MAX_BACKOFF = 30.0
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """요청이 소모할 토큰 수 추정 (한글 비중을 고려해 프롬프트 약 2자당 1토큰 + 최대 응답 토큰)"""
+    return len(prompt) // 2 + max_tokens
+
+
+class APIRateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 지키는 비동기 API 호출 제한기
+
+    두 한도를 각각 토큰 버킷으로 충전하며, 429 응답을 받으면 Retry-After 동안
+    같은 제공자에 대한 모든 호출을 멈춘 뒤 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(self, name: str, requests_per_minute: float, tokens_per_minute: Optional[float] = None,
+                 burst: Optional[float] = None, max_retries: int = 3):
+        self.name = name
+        self.max_retries = max_retries
+        self.logger = logger.bind(name=f"{name}_rate_limiter", channel="llm")
+
+        # 요청 수 버킷 (burst 미지정 시 1분치 요청까지 몰아서 허용)
+        self._request_rate = requests_per_minute / 60
+        self._request_capacity = burst or requests_per_minute
+        self._available_requests = float(self._request_capacity)
+
+        # 토큰 수 버킷 (tokens_per_minute 미지정 시 토큰 한도 없음)
+        self._token_rate = tokens_per_minute / 60 if tokens_per_minute else 0.0
+        self._token_capacity = tokens_per_minute or 0
+        self._available_tokens = float(self._token_capacity)
+
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self, tokens: int = 0):
+        """요청 1건과 토큰 tokens개를 쓸 수 있을 때까지 대기 후 소모"""
+        tokens = min(tokens, self._token_capacity) if self._token_rate else 0
+
+        while True:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            self._available_requests = min(
+                self._request_capacity, self._available_requests + elapsed * self._request_rate
+            )
+            if self._token_rate:
+                self._available_tokens = min(
+                    self._token_capacity, self._available_tokens + elapsed * self._token_rate
+                )
+
+            # 429 이후 일시 정지 중이 아니면 두 버킷이 모두 채워질 때까지의 시간 계산
+            wait = self._paused_until - now
+            if wait <= 0:
+                wait = (1 - self._available_requests) / self._request_rate
+                if self._token_rate:
+                    wait = max(wait, (tokens - self._available_tokens) / self._token_rate)
+                if wait <= 0:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """한도 초과 응답 후 seconds초 동안 모든 호출 대기"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def call(self, func: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+        """한도 내에서 func 호출 (429/5xx 응답은 Retry-After 또는 지수 백오프 후 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            await self.acquire(tokens)
+            try:
+                return await func()
+
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == self.max_retries:
+                    raise
+                self.logger.warning(f"{self.name} API 호출 실패 ({e}) - {delay:.1f}초 후 재시도")
+                await asyncio.sleep(delay)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """재시도 대기 시간 계산 (재시도 대상이 아니면 None)"""
+        # openai/anthropic APIStatusError, httpx.HTTPStatusError 모두 response 속성을 가짐
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        if status_code not in RETRYABLE_STATUS_CODES:
+            return None
+
+        try:
+            delay = float(response.headers.get('retry-after'))
+        except (TypeError, ValueError):
+            delay = min(MAX_BACKOFF, 2 ** attempt) + random.random()
+
+        # 한도 초과는 같은 제공자의 다른 호출도 함께 대기
+        if status_code == 429:
+            self.pause(delay)
+        return delay
@@ -3,28 +3,31 @@ AI 거래 시스템 메인 애플리케이션
 """
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-import asyncio
-import threading
 from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
 from app.api.routes import router
-from app.services.ai_engine import AIEngine
-from app.utils.database import init_db
-
-
-# 전역 AI 엔진 인스턴스
-ai_engine = None
+from app.api import trading_control
+from app.api.middleware import StaticCORSMiddleware
+from app.api.dependencies import get_ai_engine, get_notification_service, get_trading_executor, warm_up_dependencies
+from app.utils.database import init_db, async_engine
+from app.utils.cache import init_cache
+from app.utils.async_utils import run_in_thread
+from app.utils.logger import log_logging_config
+from llm_models import get_claude_engine, get_gpt4_engine, get_perplexity_engine
+from llm_models.analysis_writer import get_analysis_writer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시 실행
+    log_logging_config()
     logger.info("AI 거래 시스템을 시작합니다...")
     
     # 데이터베이스 초기화
@@ -34,17 +37,29 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {e}")
     
-    # AI 엔진 초기화
-    global ai_engine
-    ai_engine = AIEngine()
+    # 응답 캐시 초기화
+    init_cache()
+    
+    # 서비스 인스턴스 초기화 (AI 엔진 포함)
+    warm_up_dependencies()
     logger.info("AI 엔진 초기화 완료")
     
     yield
     
     # 종료 시 실행
     logger.info("AI 거래 시스템을 종료합니다...")
-    if ai_engine:
-        await ai_engine.stop_ai_trading()
+    await get_ai_engine().stop_ai_trading()
+    await trading_control.cancel_trading_task()
+    await get_ai_engine().notification_service.close()
+    await get_notification_service().close()
+    await get_gpt4_engine().aclose()
+    await get_claude_engine().aclose()
+    await get_perplexity_engine().aclose()
+    await run_in_thread(get_ai_engine().trading_executor.close)
+    await run_in_thread(get_trading_executor().close)
+    await run_in_thread(get_analysis_writer().close)
+    await async_engine.dispose()
+    await logger.complete()
 
 
 # FastAPI 애플리케이션 생성
@@ -52,18 +67,20 @@ app = FastAPI(
     title="AI 거래 시스템",
     description="LLM 앙상블 기반 암호화폐 자동 거래 시스템",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# CORS 미들웨어 설정
+# CORS 미들웨어 설정 (허용 출처가 고정이므로 응답 헤더를 미리 생성)
 app.add_middleware(
-    CORSMiddleware,
+    StaticCORSMiddleware,
     allow_origins=["*"],  # 프로덕션에서는 특정 도메인으로 제한
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 설정 (1KB 이상 응답만 압축)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # API 라우터 등록
 app.include_router(router)
 
@@ -80,12 +97,23 @@ async def root():
     }
 
 
+# 데이터베이스 예외 처리
+@app.exception_handler(SQLAlchemyError)
+async def database_exception_handler(request, exc):
+    """데이터베이스 예외 처리"""
+    logger.opt(exception=exc).error(f"데이터베이스 예외 발생 ({request.url.path}): {exc}")
+    return ORJSONResponse(
+        status_code=503,
+        content={"error": "데이터베이스 오류가 발생했습니다."}
+    )
+
+
 # 전역 예외 처리
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """전역 예외 처리"""
-    logger.error(f"전역 예외 발생: {exc}")
-    return JSONResponse(
+    logger.opt(exception=exc).error(f"전역 예외 발생 ({request.url.path}): {exc}")
+    return ORJSONResponse(
         status_code=500,
         content={"error": "내부 서버 오류가 발생했습니다."}
     )
@@ -95,54 +123,21 @@ async def global_exception_handler(request, exc):
 @app.post("/start-trading")
 async def start_trading():
     """AI 거래 시작"""
-    global ai_engine
-    if not ai_engine:
-        raise HTTPException(status_code=500, detail="AI 엔진이 초기화되지 않았습니다")
-    
-    try:
-        # 별도 스레드에서 AI 거래 시작
-        def run_ai_trading():
-            asyncio.run(ai_engine.start_ai_trading())
-        
-        thread = threading.Thread(target=run_ai_trading, daemon=True)
-        thread.start()
-        
-        return {"success": True, "message": "AI 거래가 시작되었습니다"}
-    except Exception as e:
-        logger.error(f"AI 거래 시작 실패: {e}")
-        raise HTTPException(status_code=500, detail=f"AI 거래 시작 실패: {str(e)}")
+    return await trading_control.start_trading()
 
 
 # AI 거래 중지 엔드포인트
 @app.post("/stop-trading")
 async def stop_trading():
     """AI 거래 중지"""
-    global ai_engine
-    if not ai_engine:
-        raise HTTPException(status_code=500, detail="AI 엔진이 초기화되지 않았습니다")
-    
-    try:
-        await ai_engine.stop_ai_trading()
-        return {"success": True, "message": "AI 거래가 중지되었습니다"}
-    except Exception as e:
-        logger.error(f"AI 거래 중지 실패: {e}")
-        raise HTTPException(status_code=500, detail=f"AI 거래 중지 실패: {str(e)}")
+    return await trading_control.stop_trading()
 
 
 # 시스템 상태 엔드포인트
 @app.get("/status")
 async def get_status():
     """시스템 상태 조회"""
-    global ai_engine
-    if not ai_engine:
-        return {"status": "initializing", "message": "시스템 초기화 중"}
-    
-    try:
-        status = await ai_engine.get_system_summary()
-        return status
-    except Exception as e:
-        logger.error(f"상태 조회 실패: {e}")
-        return {"status": "error", "message": str(e)}
+    return await get_ai_engine().get_system_summary()
 
 
 if __name__ == "__main__":
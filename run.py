@@ -5,8 +5,9 @@ AI 거래 시스템 실행 스크립트
 
 import os
 import sys
-import asyncio
 import argparse
+import asyncio
+import operator
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -15,9 +16,21 @@ sys.path.insert(0, str(project_root))
 
 from app.config import settings
 from app.utils.database import init_db
-from app.services.ai_engine import AIEngine
+from app.api.dependencies import get_ai_engine
+from app.utils.async_utils import run_async, run_in_thread
 from loguru import logger
 
+# 필수 환경 변수 (설정 속성명은 환경 변수명의 소문자)
+REQUIRED_ENV_VARS = (
+    'BINANCE_API_KEY',
+    'BINANCE_SECRET_KEY',
+    'OPENAI_API_KEY',
+    'ANTHROPIC_API_KEY',
+    'TELEGRAM_BOT_TOKEN',
+    'TELEGRAM_CHAT_ID'
+)
+_get_required_settings = operator.attrgetter(*(var.lower() for var in REQUIRED_ENV_VARS))
+
 
 def setup_logging():
     """로깅 설정"""
@@ -45,20 +58,11 @@ def setup_logging():
 
 def check_environment():
     """환경 설정 확인"""
-    required_vars = [
-        'BINANCE_API_KEY',
-        'BINANCE_SECRET_KEY',
-        'OPENAI_API_KEY',
-        'ANTHROPIC_API_KEY',
-        'TELEGRAM_BOT_TOKEN',
-        'TELEGRAM_CHAT_ID'
+    missing_vars = [
+        var for var, value in zip(REQUIRED_ENV_VARS, _get_required_settings(settings))
+        if not value
     ]
     
-    missing_vars = []
-    for var in required_vars:
-        if not getattr(settings, var.lower(), None):
-            missing_vars.append(var)
-    
     if missing_vars:
         logger.error(f"필수 환경 변수가 설정되지 않았습니다: {', '.join(missing_vars)}")
         logger.info("env_example.txt 파일을 참고하여 .env 파일을 생성하세요.")
@@ -67,8 +71,9 @@ def check_environment():
     return True
 
 
-async def run_ai_trading():
-    """AI 거래 실행"""
+async def run_ai_trading(close_services: bool = True):
+    """AI 거래 실행 (close_services: 종료 시 저장 스레드/알림 연결 정리, 웹 서버와 함께 실행하면 lifespan이 담당)"""
+    ai_engine = None
     try:
         logger.info("AI 거래 시스템을 시작합니다...")
         
@@ -79,7 +84,7 @@ async def run_ai_trading():
         
         # AI 엔진 생성 및 시작
         logger.info("AI 엔진 초기화 중...")
-        ai_engine = AIEngine()
+        ai_engine = get_ai_engine()
         logger.info("AI 엔진 초기화 완료")
         
         # AI 거래 시작
@@ -91,6 +96,11 @@ async def run_ai_trading():
     except Exception as e:
         logger.error(f"AI 거래 실행 중 오류 발생: {e}")
         raise
+    finally:
+        # 대기 중인 거래/포지션 기록 저장 후 저장 스레드 및 알림 커넥션 풀 종료
+        if close_services and ai_engine is not None:
+            await run_in_thread(ai_engine.trading_executor.close)
+            await ai_engine.notification_service.close()
 
 
 def run_web_server():
@@ -100,9 +110,14 @@ def run_web_server():
         logger.info("웹 서버를 시작합니다...")
         uvicorn.run(
             "main:app",
-            host="0.0.0.0",
-            port=8000,
+            host=settings.host,
+            port=settings.port,
             reload=False,
+            workers=settings.web_workers,
+            loop="uvloop",
+            http="httptools",
+            limit_concurrency=1000,
+            timeout_keep_alive=30,
             log_level="info"
         )
     except ImportError:
@@ -111,6 +126,23 @@ def run_web_server():
         logger.error(f"웹 서버 실행 중 오류 발생: {e}")
 
 
+async def run_web_and_trading():
+    """웹 서버와 AI 거래를 하나의 이벤트 루프에서 함께 실행"""
+    import uvicorn
+    logger.info("웹 서버와 AI 거래를 함께 시작합니다...")
+    config = uvicorn.Config(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        http="httptools",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+        log_level="info"
+    )
+    server = uvicorn.Server(config)
+    await asyncio.gather(server.serve(), run_ai_trading(close_services=False))
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description="AI 거래 시스템")
@@ -142,27 +174,13 @@ def main():
     try:
         if args.mode == "trading":
             # AI 거래만 실행
-            asyncio.run(run_ai_trading())
+            run_async(run_ai_trading())
         elif args.mode == "web":
             # 웹 서버만 실행
             run_web_server()
         else:
-            # 둘 다 실행 (별도 프로세스)
-            import subprocess
-            import threading
-            
-            def run_trading():
-                asyncio.run(run_ai_trading())
-            
-            def run_web():
-                run_web_server()
-            
-            # AI 거래를 별도 스레드에서 실행
-            trading_thread = threading.Thread(target=run_trading, daemon=True)
-            trading_thread.start()
-            
-            # 웹 서버를 메인 스레드에서 실행
-            run_web()
+            # 둘 다 실행 (단일 프로세스, 단일 이벤트 루프)
+            run_async(run_web_and_trading())
             
     except KeyboardInterrupt:
         logger.info("프로그램이 중단되었습니다.")